@@ -52,6 +52,7 @@ else:
 
 from .at_prop_labeltype import CPgAtLabelType
 from .at_prop_objdata import CPgAtObjectData
+from .at_prop_objdata import CPgAtMeshData
 from .at_prop_objdata import CPgAtIgnoreObjectData
 from .cls_prop_labelset import CLabelSet
 
@@ -141,6 +142,181 @@ class CPgAtLabelSet(bpy.types.PropertyGroup):
 
     bEnableArmatureSelfOcclusion: bpy.props.BoolProperty(name="Armature Self-Occlusion", default=True)
 
+    eLabelEncoding: bpy.props.EnumProperty(
+        items=[
+            ("MATERIAL", "Material per Type", "Create a label material per label type"),
+            (
+                "OBJECT_ATTRIBUTE",
+                "Shared Material",
+                "Use a single label material, which reads the label type and instance indices from object attributes",
+            ),
+        ],
+        default="MATERIAL",
+        name="Label Encoding",
+        description="Select how the label type and instance are encoded in the label materials",
+    )
+
+    eBoundsFidelity: bpy.props.EnumProperty(
+        items=[
+            ("OBJECT_BOUNDS", "Object Bounds", "Use the 8 bounding box corners of each object"),
+            ("HULL", "Convex Hull", "Use the cached convex hull vertices of each object"),
+            ("SAMPLED", "Sampled", "Use a random subset of the vertices of each object"),
+            ("FULL", "Full", "Use all vertices of each object, unless the convex hull gives the same box"),
+        ],
+        default="FULL",
+        name="Bounds Fidelity",
+        description="Select the vertices that are used to evaluate the 3D and 2D boxes",
+    )
+
+    iBoundsSampleCount: bpy.props.IntProperty(
+        name="Bounds Sample Count",
+        description="Maximal number of vertices per object used to evaluate the boxes, at bounds fidelity 'Sampled'",
+        default=1000,
+        min=8,
+    )
+
+    bUseBoneCapsuleBoxes: bpy.props.BoolProperty(
+        name="Bone Capsule Boxes",
+        description=(
+            "Approximate the 3D boxes of posed armature instances by the bone capsules, "
+            "instead of evaluating the deformed meshes. The bone radii are padded, so that the capsules "
+            "contain the meshes in the rest pose"
+        ),
+        default=False,
+    )
+
+    eBoxes2dMode: bpy.props.EnumProperty(
+        items=[
+            ("VERTICES", "Projected Vertices", "Use the tight box of the projected vertices of each instance"),
+            (
+                "BOX3D_CORNERS",
+                "Projected 3D Box Corners",
+                "Use the box of the 8 projected corners of the 3D box of each instance, "
+                "and export the corner image coordinates",
+            ),
+        ],
+        default="VERTICES",
+        name="2D Box Mode",
+        description="Select how the 2D boxes are evaluated",
+    )
+
+    bUseViewCulling: bpy.props.BoolProperty(
+        name="View Culling",
+        description=(
+            "Skip the evaluation of boxes and vertex lists for instances, whose bounds are outside "
+            "of the camera view or farther away than the maximal distance"
+        ),
+        default=False,
+    )
+
+    fViewCullMaxDistance: bpy.props.FloatProperty(
+        name="View Culling Max Distance",
+        description="Maximal distance of the instance bounds from the camera. If zero, the distance is not limited",
+        default=0.0,
+        min=0.0,
+        subtype="DISTANCE",
+    )
+
+    bExportCulledInstances: bpy.props.BoolProperty(
+        name="Export Culled Instances",
+        description="Export the instances that are culled by the view culling, without boxes and vertex lists",
+        default=True,
+    )
+
+    eEncodingCapacity: bpy.props.EnumProperty(
+        items=[
+            ("FRAME", "Per Apply", "Evaluate the label type count and maximal instance count with each label apply"),
+            (
+                "AUTO",
+                "Auto Grow",
+                "Keep the capacity for a frame sequence and grow it with headroom, if it is exceeded",
+            ),
+            ("PINNED", "Pinned", "Use the given capacity for the label type count and maximal instance count"),
+        ],
+        default="FRAME",
+        name="Encoding Capacity",
+        description="Select how the label type count and maximal instance count of the label encoding are evaluated",
+    )
+    iCapacityTypeCount: bpy.props.IntProperty(
+        name="Capacity Type Count",
+        description=(
+            "Label type count of the encoding capacity. "
+            "If zero, it is set to the current count with headroom by the next label apply"
+        ),
+        default=0,
+        min=0,
+    )
+    iCapacityMaxInstCount: bpy.props.IntProperty(
+        name="Capacity Max. Instance Count",
+        description=(
+            "Maximal instance count of the encoding capacity. "
+            "If zero, it is set to the current count with headroom by the next label apply"
+        ),
+        default=0,
+        min=0,
+    )
+    fCapacityHeadroom: bpy.props.FloatProperty(
+        name="Capacity Headroom",
+        description="Relative headroom added when the capacity is grown automatically or pinned to the current counts",
+        default=0.25,
+        min=0.0,
+    )
+
+    iGeometryMemoryBudget: bpy.props.IntProperty(
+        name="Geometry Memory Budget (MB)",
+        description="Maximal size of the scratch buffers kept for evaluating the label geometry, in megabytes",
+        default=256,
+        min=1,
+    )
+
+    bUseTemporalCoherence: bpy.props.BoolProperty(
+        name="Temporal Coherence",
+        description=(
+            "Only evaluate the label data of instances again, whose objects, armature poses or "
+            "relevant camera parameters have changed since the last label data update"
+        ),
+        default=False,
+    )
+
+    iWorkerThreads: bpy.props.IntProperty(
+        name="Worker Threads",
+        description=(
+            "Number of threads that evaluate the label geometry in parallel. "
+            "Set to zero to use one thread per CPU core, and to one to evaluate on the main thread only"
+        ),
+        default=0,
+        min=0,
+    )
+
+    bGeometryDoublePrecision: bpy.props.BoolProperty(
+        name="Double Precision Geometry",
+        description=(
+            "Store the evaluated vertices of the labeled objects with double instead of single precision. "
+            "This doubles the memory needed per frame"
+        ),
+        default=False,
+    )
+
+    sGeometryCachePath: bpy.props.StringProperty(
+        name="Geometry Cache",
+        description=(
+            "Path of the folder in which geometry summaries of static meshes are cached. "
+            "The folder may be shared by many processes. Leave empty to disable the cache"
+        ),
+        subtype="DIR_PATH",
+        default="",
+    )
+
+    bUseMaterialOverride: bpy.props.BoolProperty(
+        name="Use Material Override",
+        description=(
+            "Apply the materials of the annotation types other than 'Label' via the material override "
+            "of the view layer, instead of replacing the materials of all meshes. "
+            "Note that the override also applies to objects in ignored collections"
+        ),
+        default=False,
+    )
+
     eAnnotationType: bpy.props.EnumProperty(
         items=[
             ("LABEL", "Label", "Apply label materials"),
@@ -183,16 +359,24 @@ class CPgAtLabelSet(bpy.types.PropertyGroup):
 
     # Store object data that has to be restored when labelling is unapplied
     clObjectData: bpy.props.CollectionProperty(type=CPgAtObjectData)
+    # Store mesh data that has to be restored when labelling is unapplied
+    clMeshData: bpy.props.CollectionProperty(type=CPgAtMeshData)
     # Store objects that are ignored for labelling
     clIgnoreObjectData: bpy.props.CollectionProperty(type=CPgAtIgnoreObjectData)
 
     # Store original world shader id
     sWorldId: bpy.props.StringProperty(name="WorldId", default="")
 
+    # Store original material override of view layer, if the material override is used
+    bMaterialOverrideApplied: bpy.props.BoolProperty(name="Material Override Applied", default=False)
+    sViewLayerId: bpy.props.StringProperty(name="ViewLayerId", default="")
+    sMaterialOverrideId: bpy.props.StringProperty(name="MaterialOverrideId", default="")
+
     # Store all data that is applied
     clAppliedTypes: bpy.props.CollectionProperty(type=CPgAtLabelType)
     iAppliedTypeSelIdx: bpy.props.IntProperty(name="Selected Applied Type Index", default=0)
     iColorNormValue: bpy.props.IntProperty(name="Max. instantiation count", default=0)
+    iColorTypeCount: bpy.props.IntProperty(name="Label type count", default=0)
 
     # Active Elements
     # sActiveObject: bpy.props.StringProperty(name="Active Object", default="")
@@ -237,8 +421,10 @@ def AnyTruth_LabelSetInit(_xScene):
 
 
 @persistent
-def AnyTruth_FrameChangePost(_xScene):
+def AnyTruth_FrameChangePost(_xScene, _xDepsGraph):
     xLabelSet = CLabelSet(bpy.context.scene.xAtLabelSet)
+    # Record the geometry updates of the frame change, before the label data is updated
+    xLabelSet.RecordGeometryUpdates(_xDepsGraph)
     if xLabelSet.bApplyAnnotation and xLabelSet.bAutoUpdateAnnotation:
         xLabelSet.UpdateLabelData3d()
     # endif
@@ -252,6 +438,20 @@ def AnyTruth_SavePre(_xScene):
     CLabelSet(bpy.context.scene.xAtLabelSet).ApplyAnnotation(False)
 
 
+# enddef
+
+
+@persistent
+def AnyTruth_DepsgraphUpdatePost(_xScene, _xDepsGraph):
+    # Record the scene changes, so that applied labels can be updated incrementally
+    xLabelSet = CLabelSet(_xScene.xAtLabelSet)
+    # Record the geometry updates, so that unchanged geometry need not be read by label data updates
+    xLabelSet.RecordGeometryUpdates(_xDepsGraph)
+    if xLabelSet.loc_bApplyAnnotation and xLabelSet.eAnnotationType == "LABEL":
+        xLabelSet.RecordDepsgraphUpdates(_xDepsGraph)
+    # endif
+
+
 # enddef
 
 ###################################################################################
@@ -281,6 +481,11 @@ def register():
         bpy.app.handlers.save_pre.append(AnyTruth_SavePre)
     # endif
 
+    # add handler if not in app.handlers
+    if AnyTruth_DepsgraphUpdatePost not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(AnyTruth_DepsgraphUpdatePost)
+    # endif
+
     # # add handler if not in app.handlers
     # if AnyTruth_LabelSetInit not in bpy.app.handlers.load_factory_startup_post:
     # 	bpy.app.handlers.load_factory_startup_post.append(AnyTruth_LabelSetInit)
@@ -312,6 +517,11 @@ def unregister():
         bpy.app.handlers.save_pre.remove(AnyTruth_SavePre)
     # endif
 
+    # remove handler if in app.handlers
+    if AnyTruth_DepsgraphUpdatePost in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(AnyTruth_DepsgraphUpdatePost)
+    # endif
+
     bpy.utils.unregister_class(CPgAtLabelSet)
     at_prop_labeltype.unregister()
     at_prop_objdata.unregister()
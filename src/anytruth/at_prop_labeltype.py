@@ -44,9 +44,14 @@ class CPgAtBox2d(bpy.types.PropertyGroup):
     vMinXY: bpy.props.FloatVectorProperty(name="Min XY")
     vMaxXY: bpy.props.FloatVectorProperty(name="Max XY")
 
+    # Image coordinates of the projected 3D box corners, as consecutive (x, y) pairs
+    bHasCorners: bpy.props.BoolProperty(default=False, name="Has Corners")
+    vCornersXY: bpy.props.FloatVectorProperty(name="Corners XY", size=16)
+
     def clear(self):
         self.vMinXY = (0, 0, 0)
         self.vMaxXY = (0, 0, 0)
+        self.bHasCorners = False
 
     # enddef
 
@@ -336,6 +341,10 @@ class CPgAtInstance(bpy.types.PropertyGroup):
     clPoses: bpy.props.CollectionProperty(type=CPgAtPose)
     clVexGrpTypes: bpy.props.CollectionProperty(type=CPgAtVgLabelType)
 
+    # View culling results
+    bIsCulled: bpy.props.BoolProperty(default=False, name="Is Culled")
+    fInImageRatio: bpy.props.FloatProperty(default=1.0, name="In Image Ratio")
+
     def clear(self):
         self.iIdx = 0
         self.clObjects.clear()
@@ -343,6 +352,8 @@ class CPgAtInstance(bpy.types.PropertyGroup):
         self.xBox3d.clear()
         self.clPoses.clear()
         self.clVexGrpTypes.clear()
+        self.bIsCulled = False
+        self.fInImageRatio = 1.0
 
     # enddef
 
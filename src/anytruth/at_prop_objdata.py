@@ -54,6 +54,21 @@ class CPgAtMesh(bpy.types.PropertyGroup):
 # endclass
 
 
+###################################################################################
+# Original data of a mesh datablock, which is stored only once,
+# even if the mesh is shared by many objects.
+class CPgAtMeshData(bpy.types.PropertyGroup):
+
+    sId: bpy.props.StringProperty(default="")
+    sLabelId: bpy.props.StringProperty(default="")
+    sMaterialType: bpy.props.StringProperty(default="")
+    bLodEnabled: bpy.props.BoolProperty(default=False)
+    clMaterial: bpy.props.CollectionProperty(type=CPgAtMaterial)
+
+
+# endclass
+
+
 ###################################################################################
 class CPgAtObjectData(bpy.types.PropertyGroup):
 
@@ -88,6 +103,7 @@ def register():
 
     bpy.utils.register_class(CPgAtMaterial)
     bpy.utils.register_class(CPgAtMesh)
+    bpy.utils.register_class(CPgAtMeshData)
     bpy.utils.register_class(CPgAtObjectData)
     bpy.utils.register_class(CPgAtIgnoreObjectData)
 
@@ -99,6 +115,7 @@ def unregister():
 
     bpy.utils.unregister_class(CPgAtIgnoreObjectData)
     bpy.utils.unregister_class(CPgAtObjectData)
+    bpy.utils.unregister_class(CPgAtMeshData)
     bpy.utils.unregister_class(CPgAtMesh)
     bpy.utils.unregister_class(CPgAtMaterial)
 
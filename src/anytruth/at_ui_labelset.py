@@ -90,6 +90,39 @@ class AT_PT_LabelSet(bpy.types.Panel):
         yCol1.label(text="Annotation Type")
         yCol2.prop(xLabelSet, "eAnnotationType", text="")
         yRow = layout.row()
+        yRow.prop(xLabelSet, "eLabelEncoding")
+        yRow.enabled = xLabelSet.eAnnotationType == "LABEL" and not xLabelSet.bApplyAnnotation
+        yRow = layout.row()
+        yRow.prop(xLabelSet, "eEncodingCapacity")
+        if xLabelSet.eEncodingCapacity != "FRAME":
+            yRow = layout.row()
+            yRow.prop(xLabelSet, "iCapacityTypeCount", text="Types")
+            yRow.prop(xLabelSet, "iCapacityMaxInstCount", text="Instances")
+            yRow.prop(xLabelSet, "fCapacityHeadroom", text="Headroom")
+        # endif
+        yRow = layout.row()
+        yRow.prop(xLabelSet, "sGeometryCachePath")
+        yRow = layout.row()
+        yRow.prop(xLabelSet, "bUseTemporalCoherence")
+        yRow = layout.row()
+        yRow.prop(xLabelSet, "eBoundsFidelity")
+        if xLabelSet.eBoundsFidelity == "SAMPLED":
+            yRow.prop(xLabelSet, "iBoundsSampleCount", text="Samples")
+        # endif
+        yRow = layout.row()
+        yRow.prop(xLabelSet, "bUseBoneCapsuleBoxes")
+        yRow = layout.row()
+        yRow.prop(xLabelSet, "eBoxes2dMode")
+        yRow = layout.row()
+        yRow.prop(xLabelSet, "bUseViewCulling")
+        if xLabelSet.bUseViewCulling is True:
+            yRow.prop(xLabelSet, "fViewCullMaxDistance", text="Max Distance")
+            yRow.prop(xLabelSet, "bExportCulledInstances", text="Export Culled")
+        # endif
+        yRow = layout.row()
+        yRow.prop(xLabelSet, "bUseMaterialOverride")
+        yRow.enabled = xLabelSet.eAnnotationType != "LABEL" and not xLabelSet.bApplyAnnotation
+        yRow = layout.row()
         yRow.prop(xLabelSet, "bApplyAnnotation")
 
         if xLabelSet.bApplyAnnotation and xLabelSet.eAnnotationType == "LABEL":
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_dirty_tracker.py
+# Created Date: Saturday, October 17th 2026, 11:02:15 am
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import bpy
+
+
+###################################################################################
+# Records the collections, objects, meshes and materials that have been changed
+# since the labels were last applied. The records are filled from the
+# depsgraph_update_post handler and are used to re-apply labels incrementally.
+class CDirtyTracker:
+    def __init__(self):
+        # The records are only valid, if they have been started after a label apply.
+        # While the tracker is invalid, no updates are recorded. This is also used
+        # to ignore the updates caused by the label set itself.
+        self._bIsValid: bool = False
+
+        self._setCollections: set[str] = set()
+        self._setObjects: set[str] = set()
+        self._setMeshes: set[str] = set()
+        self._setMaterials: set[str] = set()
+
+        # The render visibility and parent per object name, when the records were started.
+        # These changes are not flagged as geometry or shading updates by the depsgraph.
+        self._dicObjectStates: dict[str, tuple[bool, str]] = {}
+
+    # enddef
+
+    @property
+    def bIsValid(self) -> bool:
+        return self._bIsValid
+
+    # enddef
+
+    @property
+    def bHasChanges(self) -> bool:
+        return (
+            len(self._setCollections) > 0
+            or len(self._setObjects) > 0
+            or len(self._setMeshes) > 0
+            or len(self._setMaterials) > 0
+        )
+
+    # enddef
+
+    @property
+    def setCollections(self) -> set[str]:
+        return self._setCollections
+
+    # enddef
+
+    @property
+    def setObjects(self) -> set[str]:
+        return self._setObjects
+
+    # enddef
+
+    @property
+    def setMeshes(self) -> set[str]:
+        return self._setMeshes
+
+    # enddef
+
+    @property
+    def setMaterials(self) -> set[str]:
+        return self._setMaterials
+
+    # enddef
+
+    ##########################################################################
+    def Clear(self):
+        self._setCollections.clear()
+        self._setObjects.clear()
+        self._setMeshes.clear()
+        self._setMaterials.clear()
+        self._dicObjectStates.clear()
+
+    # enddef
+
+    ##########################################################################
+    def _GetObjectState(self, _objX: bpy.types.Object) -> tuple[bool, str]:
+        return (_objX.hide_render, _objX.parent.name if _objX.parent is not None else "")
+
+    # enddef
+
+    ##########################################################################
+    def Start(self):
+        """Clear all records and mark the tracker as valid.
+        Call this after labels have been applied and the view layer has been updated.
+        """
+        self.Clear()
+        self._dicObjectStates = {objX.name: self._GetObjectState(objX) for objX in bpy.data.objects}
+        self._bIsValid = True
+
+    # enddef
+
+    ##########################################################################
+    def Invalidate(self):
+        self.Clear()
+        self._bIsValid = False
+
+    # enddef
+
+    ##########################################################################
+    def RecordDepsgraph(self, _xDepsGraph: bpy.types.Depsgraph):
+        if self._bIsValid is False:
+            return
+        # endif
+
+        for xUpdate in _xDepsGraph.updates:
+            xId = xUpdate.id
+            sName: str = xId.name
+
+            if isinstance(xId, bpy.types.Object):
+                # Label helper objects are created by the label set itself
+                if sName.startswith("AT.Label"):
+                    continue
+                # endif
+
+                # Pure transformations do not change the label assignment,
+                # but changes of the render visibility or the parent do.
+                if (
+                    xUpdate.is_updated_geometry
+                    or xUpdate.is_updated_shading
+                    or self._dicObjectStates.get(sName) != self._GetObjectState(xId.original)
+                ):
+                    self._setObjects.add(sName)
+                # endif
+
+            elif isinstance(xId, bpy.types.Collection):
+                if sName.startswith("AnyTruth"):
+                    continue
+                # endif
+                self._setCollections.add(sName)
+
+            elif isinstance(xId, bpy.types.Mesh):
+                self._setMeshes.add(sName)
+
+            elif isinstance(xId, bpy.types.Material):
+                if sName.startswith("AnyTruth."):
+                    continue
+                # endif
+                self._setMaterials.add(sName)
+
+            # endif
+        # endfor
+
+    # enddef
+
+
+# endclass
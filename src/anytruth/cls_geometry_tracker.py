@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_geometry_tracker.py
+# Created Date: Sunday, October 18th 2026, 4:12:37 pm
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+from typing import Callable, Optional
+
+import bpy
+
+
+###################################################################################
+# Records the objects and meshes whose evaluated geometry has been updated between
+# label data updates, and keeps the geometry fingerprints of the objects.
+# The records are filled from the depsgraph_update_post and frame_change_post handlers.
+# A fingerprint of an object is only evaluated again, if the depsgraph reported a geometry
+# update of the object or its' mesh. This avoids reading the vertices of all deformable meshes
+# only to test, whether they have changed.
+class CGeometryTracker:
+    def __init__(self):
+        # The records are only valid, if they have been started by a label data update.
+        self._bIsValid: bool = False
+        # Whether any depsgraph updates have been recorded since the start. If the handlers
+        # are not registered, for example if the add-on is not installed, nothing is recorded
+        # and all fingerprints are evaluated again.
+        self._bHasRecords: bool = False
+        # The name of the scene, whose label data update started the records
+        self._sScene: Optional[str] = None
+
+        # The objects and meshes with geometry updates since the start of the records
+        self._setObjects: set[str] = set()
+        self._setMeshes: set[str] = set()
+        # The objects and meshes with geometry updates before the current label data update
+        self._setChangedObjects: set[str] = set()
+        self._setChangedMeshes: set[str] = set()
+
+        # Fingerprint per fingerprint key, and the keys used by the current label data update
+        self._dicFingerprints: dict[str, str] = {}
+        self._setUsedKeys: set[str] = set()
+
+    # enddef
+
+    ##########################################################################
+    def BeginUpdate(self, _sScene: str):
+        """Take the records for a label data update of the given scene and start new records.
+        Call this at the start of the label data update, so that the geometry updates made
+        during the label data update are recorded for the next one.
+        Fingerprints that have not been used by the last label data update are dropped.
+        """
+        if self._bIsValid is True and self._bHasRecords is True and _sScene == self._sScene:
+            self._dicFingerprints = {sKey: self._dicFingerprints[sKey] for sKey in self._setUsedKeys}
+        else:
+            self._dicFingerprints = {}
+        # endif
+
+        self._setChangedObjects = self._setObjects
+        self._setChangedMeshes = self._setMeshes
+        self._setObjects = set()
+        self._setMeshes = set()
+        self._setUsedKeys = set()
+        self._sScene = _sScene
+        self._bHasRecords = False
+        self._bIsValid = True
+
+    # enddef
+
+    ##########################################################################
+    def Invalidate(self):
+        self._setObjects = set()
+        self._setMeshes = set()
+        self._setChangedObjects = set()
+        self._setChangedMeshes = set()
+        self._dicFingerprints = {}
+        self._setUsedKeys = set()
+        self._sScene = None
+        self._bHasRecords = False
+        self._bIsValid = False
+
+    # enddef
+
+    ##########################################################################
+    def RecordDepsgraph(self, _xDepsGraph: bpy.types.Depsgraph):
+        if self._bIsValid is False:
+            return
+        # endif
+
+        self._bHasRecords = True
+        for xUpdate in _xDepsGraph.updates:
+            xId = xUpdate.id
+            if isinstance(xId, bpy.types.Object):
+                if xUpdate.is_updated_geometry:
+                    self._setObjects.add(xId.name)
+                # endif
+            elif isinstance(xId, bpy.types.Mesh):
+                self._setMeshes.add(xId.name)
+            # endif
+        # endfor
+
+    # enddef
+
+    ##########################################################################
+    def GetFingerprint(self, _sKind: str, _objOrigX: bpy.types.Object, _funcFingerprint: Callable[[], str]) -> str:
+        """Get a fingerprint of the evaluated geometry of an object.
+        The fingerprint function is only called, if no fingerprint is stored for the object,
+        or if the geometry of the object has been updated since the fingerprint was stored.
+
+        Parameters
+        ----------
+        _sKind : str
+            The kind of geometry data the fingerprint is evaluated from.
+        _objOrigX : bpy.types.Object
+            The original object.
+        _funcFingerprint : Callable[[], str]
+            The function that evaluates the fingerprint from the evaluated geometry.
+
+        Returns
+        -------
+        str
+            The fingerprint.
+        """
+        sKey = "{};{}".format(_sKind, _objOrigX.name)
+        sFingerprint = self._dicFingerprints.get(sKey)
+        # Changed geometry is only evaluated again for its' first use in a label data update
+        bIsChanged: bool = _objOrigX.name in self._setChangedObjects or (
+            _objOrigX.data is not None and _objOrigX.data.name in self._setChangedMeshes
+        )
+        if sFingerprint is None or (bIsChanged is True and sKey not in self._setUsedKeys):
+            sFingerprint = self._dicFingerprints[sKey] = _funcFingerprint()
+        # endif
+
+        self._setUsedKeys.add(sKey)
+        return sFingerprint
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_instance_tracker.py
+# Created Date: Sunday, October 18th 2026, 12:04:26 am
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import hashlib
+from typing import Any, Optional
+
+
+###################################################################################
+# Tracks the state of the label instances between label data updates.
+# For each evaluation stage, the fingerprint of the state an instance had when
+# the stage was last evaluated for it is stored. If the fingerprint has not changed,
+# the results of the last evaluation are still valid and need not be evaluated again.
+# The stored states must be cleared, whenever the applied instances are created again.
+# The tracker does not import bpy, so that it can also be used outside of Blender.
+class CInstanceTracker:
+    def __init__(self):
+        # Fingerprints per instance key, per stage
+        self._dicStates: dict[str, dict[str, str]] = {}
+        # Number of tests and of unchanged instances per stage
+        self._dicTests: dict[str, int] = {}
+        self._dicHits: dict[str, int] = {}
+
+    # enddef
+
+    ##########################################################################
+    @staticmethod
+    def GetFingerprint(*_tParts: Any) -> str:
+        """Get the fingerprint of the given state parts.
+        Byte-like parts, like numpy arrays, are hashed by their memory contents,
+        all other parts by their representation.
+        """
+        xHash = hashlib.blake2b(digest_size=16)
+        for xPart in _tParts:
+            if hasattr(xPart, "tobytes"):
+                xHash.update(xPart.tobytes())
+            else:
+                xHash.update(repr(xPart).encode("utf-8"))
+            # endif
+            xHash.update(b"\0")
+        # endfor
+        return xHash.hexdigest()
+
+    # enddef
+
+    ##########################################################################
+    def IsUnchanged(self, _sStage: str, _sInstKey: str, _sFingerprint: str) -> bool:
+        """Test whether an instance has the same state as when the stage was last evaluated for it.
+        If the state has changed, the new state is stored, so that the caller has to evaluate the stage.
+        """
+        dicStates = self._dicStates.setdefault(_sStage, {})
+        bIsUnchanged = dicStates.get(_sInstKey) == _sFingerprint
+        if bIsUnchanged is False:
+            dicStates[_sInstKey] = _sFingerprint
+        # endif
+
+        self._dicTests[_sStage] = self._dicTests.get(_sStage, 0) + 1
+        if bIsUnchanged is True:
+            self._dicHits[_sStage] = self._dicHits.get(_sStage, 0) + 1
+        # endif
+
+        return bIsUnchanged
+
+    # enddef
+
+    ##########################################################################
+    def Discard(self, _sStage: str, _sInstKey: str):
+        """Discard the stored state of an instance for a stage, so that the stage is evaluated again for it."""
+        dicStates = self._dicStates.get(_sStage)
+        if dicStates is not None:
+            dicStates.pop(_sInstKey, None)
+        # endif
+
+    # enddef
+
+    ##########################################################################
+    def GetHitRates(self) -> dict[str, float]:
+        """Get the ratio of unchanged instances to all tested instances per stage,
+        since the statistics have last been reset.
+        """
+        return {sStage: self._dicHits.get(sStage, 0) / iTests for sStage, iTests in self._dicTests.items()}
+
+    # enddef
+
+    ##########################################################################
+    def ResetStats(self):
+        self._dicTests.clear()
+        self._dicHits.clear()
+
+    # enddef
+
+    ##########################################################################
+    def Clear(self, _sStage: Optional[str] = None):
+        """Clear the stored instance states of the given stage, or of all stages if None,
+        so that the stages are evaluated again.
+        """
+        if _sStage is None:
+            self._dicStates.clear()
+        else:
+            self._dicStates.pop(_sStage, None)
+        # endif
+
+    # enddef
+
+
+# endclass
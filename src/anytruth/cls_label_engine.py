@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_label_engine.py
+# Created Date: Saturday, October 17th 2026, 2:41:08 pm
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+from typing import Optional
+
+from .cls_scene_index import CSceneIndex
+
+
+###################################################################################
+class CLabelInstance:
+    def __init__(
+        self,
+        *,
+        _sTopObj: str,
+        _sOrientObj: str,
+        _lValidObjects: list[str],
+        _sType: str,
+    ):
+        self._sTopObj: str = _sTopObj
+        self._sOrientObj: str = _sOrientObj
+        self._lValidObjects: list[str] = _lValidObjects.copy()
+        self._sType: str = _sType
+
+    # enddef
+
+    @property
+    def sTopObj(self):
+        return self._sTopObj
+
+    # enddef
+
+    @property
+    def sOrientObj(self):
+        return self._sOrientObj
+
+    # enddef
+
+    @property
+    def lValidObjects(self):
+        return self._lValidObjects
+
+    # enddef
+
+    @property
+    def sType(self):
+        return self._sType
+
+    # enddef
+
+
+# endclass
+
+
+###################################################################################
+# The result of the label resolution as plain data.
+# The instance indices are 1-based, as stored in the applied types.
+class CLabelPlan:
+    def __init__(self):
+        # Applied label type ids in the order of creation
+        self.lTypes: list[str] = []
+        # List of instances per applied label type id. Each instance is a dictionary with the elements
+        #   iIdx: the 1-based instance index
+        #   sOrientId: the name of the instance orientation object
+        #   lInstRep: list of (name, is collection) tuples of the objects or collections that represent the instance
+        self.dicInstances: dict[str, list[dict]] = {}
+        # The label assignments in traversal order. Each assignment is a dictionary with the elements
+        #   sType: the label type id
+        #   iInstIdx: the 1-based instance index
+        #   sTopObj: the name of the top object of the label instance
+        #   sTopType: the object type of the top object
+        #   lObjects: the names of the mesh objects that are labeled
+        self.lAssignments: list[dict] = []
+        # Objects that are ignored and need to be hidden while labels are applied
+        self.lIgnoreObjects: list[str] = []
+        # Collections with a label type that is not available
+        self.lInvalidLabelCollections: list[str] = []
+
+    # enddef
+
+    ##########################################################################
+    def HasType(self, _sType: str) -> bool:
+        return _sType in self.dicInstances
+
+    # enddef
+
+    ##########################################################################
+    def AddType(self, _sType: str):
+        self.lTypes.append(_sType)
+        self.dicInstances[_sType] = []
+
+    # enddef
+
+    ##########################################################################
+    def AddInstance(self, _sType: str, _sOrientId: Optional[str]) -> dict:
+        lInstances = self.dicInstances[_sType]
+        dicInst = {
+            "iIdx": len(lInstances) + 1,
+            "sOrientId": _sOrientId if _sOrientId is not None else "",
+            "lInstRep": [],
+        }
+        lInstances.append(dicInst)
+        return dicInst
+
+    # enddef
+
+
+# endclass
+
+
+###################################################################################
+# Resolves the label types and instances of all objects of a collection tree.
+# The engine only works on the data of a CSceneIndex and does not access Blender,
+# so that it can be profiled and tested with synthetic scenes.
+class CLabelEngine:
+    lAllowedInstTypes: list[str] = ["MESH", "ARMATURE"]
+
+    dicInstInc: dict = {
+        "NONE": {
+            "NONE": (0, 0),
+            "SINGLE": (1, 0),
+            "COLLECTION": (1, 0),
+            "OBJECT": (1, 1),
+        },
+        "SINGLE": {
+            "NONE": (0, 0),
+            "SINGLE": (0, 0),
+            "COLLECTION": (1, 0),
+            "OBJECT": (1, 1),
+        },
+        "COLLECTION": {
+            "NONE": (1, 0),
+            "SINGLE": (1, 0),
+            "COLLECTION": (1, 0),
+            "OBJECT": (1, 1),
+        },
+        "OBJECT": {
+            "NONE": (1, 1),
+            "SINGLE": (1, 0),
+            "COLLECTION": (1, 0),
+            "OBJECT": (1, 1),
+        },
+    }
+
+    def __init__(self, _xIndex: CSceneIndex, _lLabelTypes: list[str]):
+        self._xIndex: CSceneIndex = _xIndex
+        self._setLabelTypes: set[str] = set(_lLabelTypes)
+        self._xPlan: CLabelPlan = None
+        self._setIgnoreObjects: set[str] = set()
+
+    # enddef
+
+    ##########################################################################
+    def Resolve(self, _sRootCollection: str, *, _sRootLabelType: str = "None") -> CLabelPlan:
+        """Resolve the label types and instances of all objects below the root collection.
+
+        Parameters
+        ----------
+        _sRootCollection : str
+            The name of the root collection.
+        _sRootLabelType : str, optional
+            The label type of the root collection. This type is always added
+            as first applied type. By default "None".
+
+        Returns
+        -------
+        CLabelPlan
+            The label plan.
+        """
+        self._xPlan = CLabelPlan()
+        self._setIgnoreObjects = set()
+
+        self._xPlan.AddType(_sRootLabelType)
+        self._AddLabelData(_sRootCollection, "NONE", _sRootLabelType, None, None)
+
+        return self._xPlan
+
+    # enddef
+
+    ############################################################################################################
+    def _GetInstances(self, _lObjects: list[str], _sActiveCollection: str) -> list[CLabelInstance]:
+        """For each top level object collect the object itself and all its' children
+            that are of an allowed type and are members of collection _clAct, into separate object lists.
+
+        Parameters
+        ----------
+        _lObjects : list[str]
+            Top level objects.
+        _sActiveCollection : string
+            Only objects and child objects that are members of this collection are considered.
+
+        Returns
+        -------
+        list[CLabelInstance]
+            List of instance objects.
+        """
+        # For each top level object collect the object itself and all its' children
+        # that are of an allowed type, into separate object lists.
+        # The object hierarchy is traversed depth first with an explicit stack.
+        # Each stack element is a tuple of the object name and the list of valid objects
+        # of the instance the object belongs to, which is None for objects that are not
+        # children of an instance object.
+        xIndex: CSceneIndex = self._xIndex
+
+        lLabInstList: list[CLabelInstance] = []
+        lStack: list[tuple[str, Optional[list[str]]]] = [(x, None) for x in reversed(_lObjects)]
+        while len(lStack) > 0:
+            sObj, lInstGrp = lStack.pop()
+
+            if not xIndex.IsInCollection(sObj, _sActiveCollection):
+                continue
+            # endif
+
+            if not xIndex.IsInViewLayer(sObj):
+                continue
+            # endif
+
+            if xIndex.IsIgnored(sObj) is True:
+                if sObj not in self._setIgnoreObjects:
+                    self._setIgnoreObjects.add(sObj)
+                    self._xPlan.lIgnoreObjects.append(sObj)
+                # endif
+                continue
+            # endif
+
+            sType: str = xIndex.GetType(sObj)
+
+            if sType == "EMPTY":
+                lStack.extend((x, lInstGrp) for x in reversed(xIndex.GetChildren(sObj)))
+
+            elif (
+                sType in self.lAllowedInstTypes
+                and xIndex.IsHiddenRender(sObj) is False
+                and xIndex.IsLabelMesh(sObj) is False
+            ):
+                if lInstGrp is None:
+                    # Look for instance orientation object
+                    sOrientObj = xIndex.GetFirstChildOrientEmpty(sObj)
+
+                    xLabInst = CLabelInstance(
+                        _sTopObj=sObj,
+                        _sOrientObj=sOrientObj if sOrientObj is not None else sObj,
+                        _lValidObjects=[sObj],
+                        _sType=sType,
+                    )
+                    lLabInstList.append(xLabInst)
+                    lInstGrp = xLabInst.lValidObjects
+                else:
+                    lInstGrp.append(sObj)
+                # endif
+
+                lStack.extend((x, lInstGrp) for x in reversed(xIndex.GetChildren(sObj)))
+            # endif
+        # endwhile
+
+        return lLabInstList
+
+    # enddef
+
+    ############################################################################################################
+    def _AddLabelData(
+        self,
+        _sCollection: str,
+        _sParentInstType: str,
+        _sLabelType: str,
+        _sParentInstOrientId: Optional[str],
+        _iParentInstIdx: Optional[int],
+    ):
+        # The collection tree is traversed depth first with an explicit stack of collection frames.
+        # The instance index returned by a child collection is needed to process the next child,
+        # so that a frame stays on the stack until all its' children have been processed.
+        dicFrame: dict = self._EnterCollection(
+            _sCollection, _sParentInstType, _sLabelType, _sParentInstOrientId, _iParentInstIdx
+        )
+        if dicFrame is None:
+            return
+        # endif
+
+        lStack: list[dict] = [dicFrame]
+        while len(lStack) > 0:
+            dicFrame = lStack[-1]
+            lChildren: list[str] = dicFrame["lChildren"]
+
+            if dicFrame["iChild"] < len(lChildren):
+                sChild = lChildren[dicFrame["iChild"]]
+                dicFrame["iChild"] += 1
+
+                dicChildFrame = self._EnterCollection(
+                    sChild,
+                    dicFrame["sThisInstType"],
+                    dicFrame["sLabelType"],
+                    dicFrame["sInstOrientId"],
+                    dicFrame["iThisInstIdx"],
+                )
+                if dicChildFrame is not None:
+                    lStack.append(dicChildFrame)
+                # endif
+                continue
+            # endif
+
+            lStack.pop()
+            iChildInstIdx = self._LeaveCollection(dicFrame)
+            if len(lStack) > 0:
+                dicParentFrame = lStack[-1]
+                if (
+                    dicParentFrame["iThisInstIdx"] is None
+                    and iChildInstIdx is not None
+                    and dicParentFrame["iNextObjInc"] == 0
+                ):
+                    dicParentFrame["iThisInstIdx"] = iChildInstIdx
+                # endif
+            # endif
+        # endwhile
+
+    # enddef
+
+    ############################################################################################################
+    def _EnterCollection(
+        self,
+        _sCollection: str,
+        _sParentInstType: str,
+        _sLabelType: str,
+        _sParentInstOrientId: Optional[str],
+        _iParentInstIdx: Optional[int],
+    ) -> Optional[dict]:
+        """Add the label data of the objects of a collection and return the frame
+        for processing the child collections. Returns None if the collection is ignored.
+        """
+        xIndex: CSceneIndex = self._xIndex
+        xPlan: CLabelPlan = self._xPlan
+
+        xLabel = xIndex.GetCollectionLabel(_sCollection)
+        if xLabel is None or xLabel.bIgnore:
+            return None
+        # endif
+
+        # Test whether collection has a label type that is currently not available
+        # In this case, mark the collection has not having a label
+        bHasLabel: bool = xLabel.bHasLabel
+        if bHasLabel is True and xLabel.sType not in self._setLabelTypes:
+            bHasLabel = False
+            xPlan.lInvalidLabelCollections.append(_sCollection)
+        # endif
+
+        sLabelType = xLabel.sType if bHasLabel else _sLabelType
+        bEqualLabelType = _sLabelType == sLabelType
+
+        sThisInstType = xLabel.sChildrenInstType if bHasLabel else "NONE"
+        sParentInstType = _sParentInstType if bEqualLabelType else "NONE"
+
+        if sThisInstType == "INHERIT":
+            sThisInstType = sParentInstType
+        # endif
+
+        bFirstObject = True
+        dicThisInstInc = self.dicInstInc.get(sParentInstType)
+        if dicThisInstInc is None:
+            raise Exception("Unsupport children instance type '{0}'".format(sParentInstType))
+        # endif
+        iFirstObjInc, iNextObjInc = dicThisInstInc.get(sThisInstType)
+
+        # The active instance is referenced by its' list index in the instances of the label type
+        iActInst: Optional[int] = None
+        if xPlan.HasType(sLabelType) and bEqualLabelType and _iParentInstIdx is not None and iFirstObjInc == 0:
+            iActInst = _iParentInstIdx
+        # endif
+
+        # Get top-level objects in collection
+        lTopObjs = xIndex.GetCollectionTopObjects(_sCollection)
+        # Keep only those objects that are also rendered
+        lTopObjs = [x for x in lTopObjs if xIndex.IsHiddenRender(x) is False]
+
+        # Get list of instances by ignoring empties and only collecting
+        # MESH and ARMATURE objects and their children as instances.
+        lLabInst: list[CLabelInstance] = self._GetInstances(lTopObjs, _sCollection)
+
+        if bEqualLabelType and _sParentInstOrientId is not None and iFirstObjInc == 0:
+            sInstOrientId = _sParentInstOrientId
+        else:
+            # Look for instance orientation object
+            sOrientObj = next((x for x in lTopObjs if xIndex.IsOrientEmpty(x)), None)
+
+            if sOrientObj is None:
+                # if no explicit instance orientation object is present at the top level,
+                # then look for an orientation empty as child of a top object.
+                for sTopObj in lTopObjs:
+                    sOrientObj = xIndex.GetFirstChildOrientEmpty(sTopObj)
+                    if sOrientObj is not None:
+                        break
+                    # endif
+                # endfor
+
+                if sOrientObj is None:
+                    # if not explicit orientation object could be found as child of a top object,
+                    # then take the first Empty in the collection.
+                    sOrientObj = next((x for x in lTopObjs if xIndex.GetType(x) == "EMPTY"), None)
+
+                    # if there is also no empty in the collection, use the first object's orientation object
+                    if sOrientObj is None and len(lLabInst) > 0:
+                        sOrientObj = lLabInst[0].sOrientObj
+                    # endif
+                # endif
+            # endif
+
+            sInstOrientId = sOrientObj
+        # endif
+
+        # Loop over instances
+        for xLabInst in lLabInst:
+            bNewInstance = False
+            if bFirstObject:
+                bFirstObject = False
+                if iActInst is None and iFirstObjInc == 0:
+                    bNewInstance = True
+                else:
+                    bNewInstance = iFirstObjInc > 0
+                # endif
+            else:
+                bNewInstance = iNextObjInc > 0
+            # endif
+
+            # If every object is an instance, then use the object's orientation
+            # as instance orientation, or a child orientation empty.
+            if iNextObjInc > 0:
+                sInstOrientId = xLabInst.sOrientObj
+            # endif
+
+            # Add new instance to plan
+            if bNewInstance:
+                if not xPlan.HasType(sLabelType):
+                    xPlan.AddType(sLabelType)
+                # endif
+
+                dicInst = xPlan.AddInstance(sLabelType, sInstOrientId)
+                iActInst = dicInst["iIdx"] - 1
+
+                # if the whole collection is an instance, then store its' name
+                if iNextObjInc == 0:
+                    dicInst["lInstRep"].append((_sCollection, True))
+                # endif
+            # endif
+
+            dicActInst: dict = xPlan.dicInstances[sLabelType][iActInst]
+
+            # Store top objects, if every object is an instance
+            if iNextObjInc > 0 and not any(x[0] == xLabInst.sTopObj for x in dicActInst["lInstRep"]):
+                dicActInst["lInstRep"].append((xLabInst.sTopObj, False))
+            # endif
+
+            xPlan.lAssignments.append(
+                {
+                    "sType": sLabelType,
+                    "iInstIdx": dicActInst["iIdx"],
+                    "sTopObj": xLabInst.sTopObj,
+                    "sTopType": xLabInst.sType,
+                    "lObjects": [x for x in xLabInst.lValidObjects if xIndex.GetType(x) == "MESH"],
+                }
+            )
+        # endfor objects in collection
+
+        iThisInstIdx = None
+        if iNextObjInc == 0 and iActInst is not None:
+            iThisInstIdx = len(xPlan.dicInstances[sLabelType]) - 1
+        # endif
+
+        # Whether the collection passes the index of its' last instance on to its' parent
+        bReturnInstIdx = bEqualLabelType and _iParentInstIdx is None and iFirstObjInc == 0 and iActInst is not None
+
+        return {
+            "lChildren": xIndex.GetCollectionChildren(_sCollection),
+            "iChild": 0,
+            "sLabelType": sLabelType,
+            "sThisInstType": sThisInstType,
+            "sInstOrientId": sInstOrientId,
+            "iThisInstIdx": iThisInstIdx,
+            "iNextObjInc": iNextObjInc,
+            "bReturnInstIdx": bReturnInstIdx,
+        }
+
+    # enddef
+
+    ############################################################################################################
+    def _LeaveCollection(self, _dicFrame: dict) -> Optional[int]:
+        """Get the instance index a collection passes on to its' parent, after all its' children have been processed."""
+        if _dicFrame["bReturnInstIdx"] is True:
+            return len(self._xPlan.dicInstances[_dicFrame["sLabelType"]]) - 1
+        # endif
+        return None
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_name_cache.py
+# Created Date: Saturday, October 17th 2026, 4:05:51 pm
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import re
+from typing import Optional
+
+
+###################################################################################
+# Caches the classification of AnyTruth object, bone and vertex group names.
+# Each name is matched against the corresponding regular expression only once.
+# An instance is meant to live for a single label apply or update.
+class CNameCache:
+    reAtOrient: re.Pattern = re.compile(r"^.+;AT\.Label\.Instance\.Orientation$")
+    reAtBone: re.Pattern = re.compile(r"^AT\.Label;(?P<skel>.+);(?P<bone>.+)")
+    reAtVexGrp: re.Pattern = re.compile(
+        r"^AT\.Label;(?P<type>[^;]+);(?P<inst>\d+);(?P<id>[^;]+);(?P<vextype>\w+);" r"(?P<r>\d+);(?P<g>\d+);(?P<b>\d+)$"
+    )
+    # Prefix of the label mesh objects created for armature meshes
+    sLabelMeshPrefix: str = "AT.Label;"
+
+    def __init__(self):
+        self._dicOrient: dict[str, bool] = {}
+        self._dicBone: dict[str, Optional[tuple[str, str]]] = {}
+        self._dicVexGrp: dict[str, Optional[dict[str, str]]] = {}
+        self._dicLabelMesh: dict[str, bool] = {}
+
+    # enddef
+
+    ##########################################################################
+    def IsOrientEmpty(self, _sName: str) -> bool:
+        """Test whether the name is that of an instance orientation empty."""
+        bIsOrient = self._dicOrient.get(_sName)
+        if bIsOrient is None:
+            bIsOrient = self._dicOrient[_sName] = self.reAtOrient.match(_sName) is not None
+        # endif
+        return bIsOrient
+
+    # enddef
+
+    ##########################################################################
+    def MatchBone(self, _sName: str) -> Optional[tuple[str, str]]:
+        """Get the skeleton and bone id of an AT bone name.
+
+        Returns
+        -------
+        Optional[tuple[str, str]]
+            The tuple (skeleton id, bone id), or None if the name is not an AT bone name.
+        """
+        if _sName in self._dicBone:
+            return self._dicBone[_sName]
+        # endif
+
+        tBone = None
+        xMatch = self.reAtBone.search(_sName)
+        if xMatch is not None:
+            tBone = (xMatch.group("skel"), xMatch.group("bone"))
+        # endif
+        self._dicBone[_sName] = tBone
+        return tBone
+
+    # enddef
+
+    ##########################################################################
+    def MatchVexGrp(self, _sName: str) -> Optional[dict[str, str]]:
+        """Get the elements of an AT vertex group name.
+
+        Returns
+        -------
+        Optional[dict[str, str]]
+            The dictionary with the elements 'type', 'inst', 'id', 'vextype', 'r', 'g', 'b',
+            or None if the name is not an AT vertex group name.
+        """
+        if _sName in self._dicVexGrp:
+            return self._dicVexGrp[_sName]
+        # endif
+
+        dicVexGrp = None
+        xMatch = self.reAtVexGrp.match(_sName)
+        if xMatch is not None:
+            dicVexGrp = xMatch.groupdict()
+        # endif
+        self._dicVexGrp[_sName] = dicVexGrp
+        return dicVexGrp
+
+    # enddef
+
+    ##########################################################################
+    def IsLabelMesh(self, _sName: str) -> bool:
+        """Test whether the name is that of a label mesh object created for an armature mesh."""
+        bIsLabelMesh = self._dicLabelMesh.get(_sName)
+        if bIsLabelMesh is None:
+            bIsLabelMesh = self._dicLabelMesh[_sName] = _sName.startswith(self.sLabelMeshPrefix)
+        # endif
+        return bIsLabelMesh
+
+    # enddef
+
+
+# endclass
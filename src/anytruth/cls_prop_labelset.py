@@ -27,6 +27,7 @@
 ###
 
 import bpy
+import math
 import mathutils
 
 import sys
@@ -61,8 +62,7 @@ from anycam.obj.camera_lut import StoreLutCameraData
 from anybase.cls_any_error import CAnyError_Message
 from anybase.cls_anycml import CAnyCML
 
-from .material.cls_label import CLabel
-from .material.cls_label_skeleton import CLabelSkeleton
+from .material.cls_label_pool import CLabelPool
 from .material.cls_pos3d import CPos3d
 from .material.cls_pos3d import CreateName as CreateNameMaterialPos3d
 from .material.cls_local_pos3d import CLocalPos3d
@@ -73,56 +73,36 @@ from .object import armature
 from . import node
 from .node.shader.types import ELabelShaderTypes
 from .cls_anycam_config import CAnyCamConfig
+from .cls_name_cache import CNameCache
+from .cls_scene_index import CSceneIndex
+from .cls_label_engine import CLabelEngine, CLabelPlan
+from .cls_dirty_tracker import CDirtyTracker
+from .cls_geometry_tracker import CGeometryTracker
+from .cls_instance_tracker import CInstanceTracker
+from .geometry import kernels
+from .geometry import tasks
+from .geometry.cls_task_pool import CTaskPool
+from .geometry.cls_frame_geometry import CFrameGeometry
+from .geometry import hull
+from .geometry import instances
+from .geometry import capsules
+from .geometry import culling
+from .geometry import linestrip
+from .geometry import cache
 
 import anytruth
 
 c_dicArmatureBoneLabelWeights = {}
 
+# Records the scene changes since the labels have been applied.
+# This has to be a global variable, as CLabelSet is instantiated for each call.
+c_xDirtyTracker: CDirtyTracker = CDirtyTracker()
 
-class CLabelInstance:
-    def __init__(self, *, _sTopObj: str, _sOrientObj: str, _lValidObjects: list[str]):
-        self._sTopObj: str = _sTopObj
-        self._sOrientObj: str = _sOrientObj
-        self._lValidObjects: list[str] = _lValidObjects.copy()
-
-    # enddef
-
-    @property
-    def sTopObj(self):
-        return self._sTopObj
-
-    # enddef
-
-    @property
-    def sOrientObj(self):
-        return self._sOrientObj
-
-    # enddef
-
-    @property
-    def lValidObjects(self):
-        return self._lValidObjects
-
-    # enddef
-
-    @property
-    def objTop(self):
-        objX = bpy.data.objects.get(self._sTopObj)
-        if objX is None:
-            raise RuntimeError(f"Object '{self._sTopObj}' not available")
-        # endif
-        return objX
-
-    # enddef
-
-    @property
-    def sType(self):
-        return self.objTop.type
-
-    # enddef
+# Records the states of the applied instances, when their label data was last evaluated.
+c_xInstanceTracker: CInstanceTracker = CInstanceTracker()
 
-
-# endclass
+# Records the geometry updates of objects between label data updates.
+c_xGeometryTracker: CGeometryTracker = CGeometryTracker()
 
 
 ###################################################################################
@@ -140,6 +120,32 @@ class CLabelSet:
         # Default label shader type
         self.xAnyCamConfig: CAnyCamConfig = CAnyCamConfig()
 
+        # Scene index, which is created once per apply
+        self._xSceneIndex: CSceneIndex = None
+        # Classification of AnyTruth object, bone and vertex group names
+        self._xNameCache: CNameCache = CNameCache()
+
+        # Object data of the last label apply by original object name.
+        # This is only set during an incremental label update.
+        self._dicPrevObjectData: dict = None
+        # Mesh data of the last label apply by mesh name, for meshes that still have label materials applied.
+        self._dicPrevMeshData: dict = {}
+        # Names of the objects for which previous object data has been used
+        self._setUsedPrevObjectData: set[str] = set()
+        # Names of the meshes whose label materials need not be set again
+        self._setKeepMeshData: set[str] = set()
+        # Names of the meshes whose original materials have been restored
+        self._setRestoredMeshes: set[str] = set()
+        # Whether a mesh may only be used for a single label type
+        self._bUniqueMeshLabels: bool = False
+        # Whether the original materials of the meshes are stored.
+        # This is not needed if the materials are applied via the view layer material override.
+        self._bRecordMeshData: bool = True
+        # Geometry fingerprints of the applied instances by instance key, for a single label data update
+        self._dicInstGeoFingerprint: dict[str, str] = {}
+        # Fingerprint of the scene camera, for a single label data update
+        self._sCameraFingerprint: str = None
+
     # enddef
 
     dicUserLabelMaterial: dict = {}
@@ -147,42 +153,12 @@ class CLabelSet:
 
     reAtMat: re.Pattern = re.compile(r"^.+;AT\.Label\.(.+)$")
     reAtNode: re.Pattern = re.compile(r"^AT\.Label\.(.+)$")
-    reAtOrient: re.Pattern = re.compile(r"^.+;AT\.Label\.Instance\.Orientation$")
-    reAtBone: re.Pattern = re.compile(r"^AT\.Label;(?P<skel>.+);(?P<bone>.+)")
-    reAtVexGrp: re.Pattern = re.compile(
-        r"^AT\.Label;(?P<type>[^;]+);(?P<inst>\d+);(?P<id>[^;]+);(?P<vextype>\w+);" r"(?P<r>\d+);(?P<g>\d+);(?P<b>\d+)$"
-    )
+    reAtOrient: re.Pattern = CNameCache.reAtOrient
+    reAtBone: re.Pattern = CNameCache.reAtBone
+    reAtVexGrp: re.Pattern = CNameCache.reAtVexGrp
 
-    _lAllowedInstTypes: list[str] = ["MESH", "ARMATURE"]
     _lAllowedLabelTypes: list[str] = ["LABEL", "POS3D", "LOCALPOS3D", "OBJIDX", "OBJLOC3D"]
 
-    dicInstInc: dict = {
-        "NONE": {
-            "NONE": (0, 0),
-            "SINGLE": (1, 0),
-            "COLLECTION": (1, 0),
-            "OBJECT": (1, 1),
-        },
-        "SINGLE": {
-            "NONE": (0, 0),
-            "SINGLE": (0, 0),
-            "COLLECTION": (1, 0),
-            "OBJECT": (1, 1),
-        },
-        "COLLECTION": {
-            "NONE": (1, 0),
-            "SINGLE": (1, 0),
-            "COLLECTION": (1, 0),
-            "OBJECT": (1, 1),
-        },
-        "OBJECT": {
-            "NONE": (1, 1),
-            "SINGLE": (1, 0),
-            "COLLECTION": (1, 0),
-            "OBJECT": (1, 1),
-        },
-    }
-
     @classmethod
     def GetAllowedLabelTypes(cls):
         return cls._lAllowedLabelTypes.copy()
@@ -213,6 +189,12 @@ class CLabelSet:
 
     # enddef
 
+    @property
+    def clMeshData(self):
+        return self.xLabelSetProp.clMeshData
+
+    # enddef
+
     @property
     def clIgnoreObjectData(self):
         return self.xLabelSetProp.clIgnoreObjectData
@@ -231,6 +213,224 @@ class CLabelSet:
 
     # enddef
 
+    @property
+    def iColorTypeCount(self):
+        return self.xLabelSetProp.iColorTypeCount
+
+    # enddef
+
+    @iColorTypeCount.setter
+    def iColorTypeCount(self, iValue):
+        self.xLabelSetProp.iColorTypeCount = iValue
+
+    # enddef
+
+    @property
+    def eEncodingCapacity(self) -> str:
+        return self.xLabelSetProp.eEncodingCapacity
+
+    # enddef
+
+    @eEncodingCapacity.setter
+    def eEncodingCapacity(self, _eValue: str):
+        self.xLabelSetProp.eEncodingCapacity = _eValue
+
+    # enddef
+
+    @property
+    def iCapacityTypeCount(self) -> int:
+        return self.xLabelSetProp.iCapacityTypeCount
+
+    # enddef
+
+    @iCapacityTypeCount.setter
+    def iCapacityTypeCount(self, _iValue: int):
+        self.xLabelSetProp.iCapacityTypeCount = _iValue
+
+    # enddef
+
+    @property
+    def iCapacityMaxInstCount(self) -> int:
+        return self.xLabelSetProp.iCapacityMaxInstCount
+
+    # enddef
+
+    @iCapacityMaxInstCount.setter
+    def iCapacityMaxInstCount(self, _iValue: int):
+        self.xLabelSetProp.iCapacityMaxInstCount = _iValue
+
+    # enddef
+
+    @property
+    def fCapacityHeadroom(self) -> float:
+        return self.xLabelSetProp.fCapacityHeadroom
+
+    # enddef
+
+    @fCapacityHeadroom.setter
+    def fCapacityHeadroom(self, _fValue: float):
+        self.xLabelSetProp.fCapacityHeadroom = _fValue
+
+    # enddef
+
+    @property
+    def eBoundsFidelity(self) -> str:
+        return self.xLabelSetProp.eBoundsFidelity
+
+    # enddef
+
+    @eBoundsFidelity.setter
+    def eBoundsFidelity(self, _eValue: str):
+        self.xLabelSetProp.eBoundsFidelity = _eValue
+
+    # enddef
+
+    @property
+    def iBoundsSampleCount(self) -> int:
+        return self.xLabelSetProp.iBoundsSampleCount
+
+    # enddef
+
+    @iBoundsSampleCount.setter
+    def iBoundsSampleCount(self, _iValue: int):
+        self.xLabelSetProp.iBoundsSampleCount = _iValue
+
+    # enddef
+
+    @property
+    def bUseBoneCapsuleBoxes(self) -> bool:
+        return self.xLabelSetProp.bUseBoneCapsuleBoxes
+
+    # enddef
+
+    @bUseBoneCapsuleBoxes.setter
+    def bUseBoneCapsuleBoxes(self, _bValue: bool):
+        self.xLabelSetProp.bUseBoneCapsuleBoxes = _bValue
+
+    # enddef
+
+    @property
+    def eBoxes2dMode(self) -> str:
+        return self.xLabelSetProp.eBoxes2dMode
+
+    # enddef
+
+    @eBoxes2dMode.setter
+    def eBoxes2dMode(self, _eValue: str):
+        self.xLabelSetProp.eBoxes2dMode = _eValue
+
+    # enddef
+
+    @property
+    def bUseViewCulling(self) -> bool:
+        return self.xLabelSetProp.bUseViewCulling
+
+    # enddef
+
+    @bUseViewCulling.setter
+    def bUseViewCulling(self, _bValue: bool):
+        self.xLabelSetProp.bUseViewCulling = _bValue
+
+    # enddef
+
+    @property
+    def fViewCullMaxDistance(self) -> float:
+        return self.xLabelSetProp.fViewCullMaxDistance
+
+    # enddef
+
+    @fViewCullMaxDistance.setter
+    def fViewCullMaxDistance(self, _fValue: float):
+        self.xLabelSetProp.fViewCullMaxDistance = _fValue
+
+    # enddef
+
+    @property
+    def bExportCulledInstances(self) -> bool:
+        return self.xLabelSetProp.bExportCulledInstances
+
+    # enddef
+
+    @bExportCulledInstances.setter
+    def bExportCulledInstances(self, _bValue: bool):
+        self.xLabelSetProp.bExportCulledInstances = _bValue
+
+    # enddef
+
+    @property
+    def bUseTemporalCoherence(self) -> bool:
+        return self.xLabelSetProp.bUseTemporalCoherence
+
+    # enddef
+
+    @bUseTemporalCoherence.setter
+    def bUseTemporalCoherence(self, _bValue: bool):
+        self.xLabelSetProp.bUseTemporalCoherence = _bValue
+        c_xInstanceTracker.Clear()
+
+    # enddef
+
+    ##########################################################################
+    def GetTemporalCoherenceHitRates(self) -> dict[str, float]:
+        """Get the ratio of unchanged instances, that need not be evaluated again, per evaluation stage."""
+        return c_xInstanceTracker.GetHitRates()
+
+    # enddef
+
+    ##########################################################################
+    def ResetTemporalCoherenceStats(self):
+        c_xInstanceTracker.ResetStats()
+
+    # enddef
+
+    @property
+    def iWorkerThreads(self) -> int:
+        return self.xLabelSetProp.iWorkerThreads
+
+    # enddef
+
+    @iWorkerThreads.setter
+    def iWorkerThreads(self, _iValue: int):
+        self.xLabelSetProp.iWorkerThreads = _iValue
+
+    # enddef
+
+    @property
+    def bGeometryDoublePrecision(self) -> bool:
+        return self.xLabelSetProp.bGeometryDoublePrecision
+
+    # enddef
+
+    @bGeometryDoublePrecision.setter
+    def bGeometryDoublePrecision(self, _bValue: bool):
+        self.xLabelSetProp.bGeometryDoublePrecision = _bValue
+
+    # enddef
+
+    @property
+    def sGeometryCachePath(self) -> str:
+        return self.xLabelSetProp.sGeometryCachePath
+
+    # enddef
+
+    @sGeometryCachePath.setter
+    def sGeometryCachePath(self, _sValue: str):
+        self.xLabelSetProp.sGeometryCachePath = _sValue
+
+    # enddef
+
+    @property
+    def iGeometryMemoryBudget(self) -> int:
+        return self.xLabelSetProp.iGeometryMemoryBudget
+
+    # enddef
+
+    @iGeometryMemoryBudget.setter
+    def iGeometryMemoryBudget(self, _iValue: int):
+        self.xLabelSetProp.iGeometryMemoryBudget = _iValue
+
+    # enddef
+
     @property
     def bAutoUpdateAnnotation(self):
         return self.xLabelSetProp.bAutoUpdateAnnotation
@@ -243,6 +443,30 @@ class CLabelSet:
 
     # enddef
 
+    @property
+    def eLabelEncoding(self) -> str:
+        return self.xLabelSetProp.eLabelEncoding
+
+    # enddef
+
+    @eLabelEncoding.setter
+    def eLabelEncoding(self, _eValue: str):
+        self.xLabelSetProp.eLabelEncoding = _eValue
+
+    # enddef
+
+    @property
+    def bUseMaterialOverride(self):
+        return self.xLabelSetProp.bUseMaterialOverride
+
+    # enddef
+
+    @bUseMaterialOverride.setter
+    def bUseMaterialOverride(self, _bValue: bool):
+        self.xLabelSetProp.bUseMaterialOverride = _bValue
+
+    # enddef
+
     @property
     def bEnableArmatureSelfOcclusion(self):
         return self.xLabelSetProp.bEnableArmatureSelfOcclusion
@@ -377,8 +601,15 @@ class CLabelSet:
     # enddef
 
     ##########################################################################
-    def ApplyAnnotation(self, _bApply, *, _bEvalBoxes2d: bool = False, _bAllowFovBoxes2d: bool = False):
+    def ApplyAnnotation(
+        self, _bApply, *, _bEvalBoxes2d: bool = False, _bAllowFovBoxes2d: bool = False, _bIncremental: bool = False
+    ):
         if _bApply == self.loc_bApplyAnnotation:
+            # If labels are already applied, only update them for the scene changes since the last apply
+            if _bApply is True and _bIncremental is True and self.eAnnotationType == "LABEL":
+                self.UpdateLabel()
+                self.UpdateLabelData3d(bEvalBoxes2d=_bEvalBoxes2d, bAllowFovBoxes2d=_bAllowFovBoxes2d)
+            # endif
             return
         # endif
 
@@ -420,19 +651,53 @@ class CLabelSet:
 
         self.Print("UpdateLabelData3d() start")
 
-        self.Print("UpdateLabelData3d->EvalPoses() start")
-        self.EvalPoses()
+        # Static geometry summaries may be shared between processes via a disk cache
+        cache.SetDiskCachePath(self.sGeometryCachePath)
 
-        if bEvalBoxes2d is True:
-            self.Print("UpdateLabelData3d->EvalBoxes2d() start")
-            self.EvalBoxes2d(bAllowFovBoxes2d=bAllowFovBoxes2d)
-        # endif
+        # Instances whose state has not changed since the last update are not evaluated again
+        self._dicInstGeoFingerprint = {}
+        self._sCameraFingerprint = None
+        c_xGeometryTracker.BeginUpdate(self.xLabelSetProp.id_data.name)
 
-        self.Print("UpdateLabelData3d->EvalBoxes3d() start")
-        self.EvalBoxes3d()
+        # All evaluation stages share the evaluated geometry of the objects,
+        # which is released when the stages are finished.
+        try:
+            self.Print("UpdateLabelData3d->EvalViewCulling() start")
+            self.EvalViewCulling()
 
-        self.Print("UpdateLabelData3d->EvalVertexLists3d() start")
-        self.EvalVertexLists3d()
+            self.Print("UpdateLabelData3d->EvalPoses() start")
+            self.EvalPoses()
+
+            self.Print("UpdateLabelData3d->EvalBoxes3d() start")
+            self.EvalBoxes3d()
+
+            # The 2D boxes may be evaluated from the 3D boxes
+            if bEvalBoxes2d is True:
+                self.Print("UpdateLabelData3d->EvalBoxes2d() start")
+                self.EvalBoxes2d(bAllowFovBoxes2d=bAllowFovBoxes2d)
+            # endif
+
+            self.Print("UpdateLabelData3d->EvalVertexLists3d() start")
+            self.EvalVertexLists3d()
+        except Exception:
+            # The instance states may have been recorded without evaluating the instances
+            c_xInstanceTracker.Clear()
+            c_xGeometryTracker.Invalidate()
+            raise
+        finally:
+            cache.ReleaseFrameGeometry()
+        # endtry
+
+        if self.bUseTemporalCoherence is True:
+            self.Print(
+                "UpdateLabelData3d() unchanged instances: {}".format(
+                    ", ".join(
+                        "{} {:.1f}%".format(sStage, 100.0 * fRate)
+                        for sStage, fRate in c_xInstanceTracker.GetHitRates().items()
+                    )
+                )
+            )
+        # endif
 
         if bDrawData:
             self.Print("UpdateLabelData3d->CreateBoxes3d() start")
@@ -603,6 +868,12 @@ class CLabelSet:
     ):
         clRoot = anyblend.collection.GetRootCollection(bpy.context)
         self.clObjectData.clear()
+        self.clMeshData.clear()
+        # All objects get the same material, so meshes may be shared between label types
+        self._bUniqueMeshLabels = False
+        # With the view layer material override, the mesh materials are not changed at all
+        bUseOverride: bool = self.bUseMaterialOverride
+        self._bRecordMeshData = not bUseOverride
 
         # Add None type to applied types with single instance
         # lNames = [x.name for x in self.clTypes]
@@ -611,13 +882,16 @@ class CLabelSet:
             raise Exception("No labeltype 'None' defined")
         # endif
         self.clAppliedTypes.clear()
+        c_xInstanceTracker.Clear()
         xAppType = self.clAppliedTypes.add()
         xAppType.sId = xAppType.name = xTypeNone.sId
         xAppType.colLabel = xTypeNone.colLabel
 
         ##########################################################################################
         # Add label data from scene
-        self._AddLabelData(clRoot, "NONE", "None", None, None)
+        self._xSceneIndex = CSceneIndex.FromContext(bpy.context, clRoot, _xNameCache=self._xNameCache)
+        xPlan = CLabelEngine(self._xSceneIndex, list(self.clTypes.keys())).Resolve(clRoot.name)
+        self._AddLabelData(xPlan)
 
         if matObject is None and funcCreateMaterial is not None:
             matObject = funcCreateMaterial(self)
@@ -638,35 +912,39 @@ class CLabelSet:
                 funcPerObject(objX)
             # endif
 
-            for xMesh in xObjData.clMeshes:
-                sMeshId = xMesh.sId
-                mshX = bpy.data.meshes[sMeshId]
-                iMatCnt = len(mshX.materials)
-                # Switch off LOD as workaround for problems with Grasswald.
-                # I cannot find bug where LOD objects are not switched to
-                # render LOD.
-                # The LOD feature has been removed in Blender 2.93
-                if bpy.app.version <= (2, 84, 0):
-                    mshX.lod_enabled = False
+            iObjIdx += 1
+        # endfor objects
 
-                if iMatCnt == 0:
-                    mshX.materials.append(matObject)
-                else:
-                    for iMatIdx in range(iMatCnt):
-                        matX = mshX.materials[iMatIdx]
-                        if matX is not None:
-                            matX.use_fake_user = True
-                            mshX.materials[iMatIdx] = matObject
-                        else:
-                            mshX.materials[iMatIdx] = matObject
-                        # endif
+        if bUseOverride is True:
+            self._ApplyMaterialOverride(matObject)
+        # endif
 
-                    # endfor materials
-                # endfor
-            # endfor meshes
+        # Set the materials of each mesh only once, even if it is shared by many objects
+        for xMeshData in self.clMeshData:
+            mshX = bpy.data.meshes[xMeshData.sId]
+            iMatCnt = len(mshX.materials)
+            # Switch off LOD as workaround for problems with Grasswald.
+            # I cannot find bug where LOD objects are not switched to
+            # render LOD.
+            # The LOD feature has been removed in Blender 2.93
+            if bpy.app.version <= (2, 84, 0):
+                mshX.lod_enabled = False
 
-            iObjIdx += 1
-        # endfor objects
+            if iMatCnt == 0:
+                mshX.materials.append(matObject)
+            else:
+                for iMatIdx in range(iMatCnt):
+                    matX = mshX.materials[iMatIdx]
+                    if matX is not None:
+                        matX.use_fake_user = True
+                        mshX.materials[iMatIdx] = matObject
+                    else:
+                        mshX.materials[iMatIdx] = matObject
+                    # endif
+
+                # endfor materials
+            # endif
+        # endfor meshes
 
         #######################################################################
         # Replace world shader with label shader
@@ -848,12 +1126,67 @@ class CLabelSet:
 
     ###################################################################################
     def ApplyLabel(self):
+        self.Print("ApplyLabel() start")
+
+        # Changes of the scene made while applying the labels must not be recorded
+        c_xDirtyTracker.Invalidate()
+        self._dicPrevObjectData = None
+        self._dicPrevMeshData = {}
+        self._setRestoredMeshes = set()
+
+        self._ApplyLabelData()
+
+        #######################################################################
+        # Replace world shader with label shader
+        self.Print("Replace world shader...")
+
+        # Get currently selected world
+        worldAct = bpy.context.scene.world
+        if worldAct is None:
+            raise Exception("Scene has no world shader set")
+        # endif
+
+        # Store current world id
+        self.xLabelSetProp.sWorldId = worldAct.name
+
+        # Look for "AT.Label" world
+        worldATL = bpy.data.worlds.get("AT.Label")
+        if worldATL is None:
+            # Create the label world shader
+            worldATL = bpy.data.worlds.new(name="AT.Label")
+            worldATL.use_nodes = True
+
+            nodBg = worldATL.node_tree.nodes.get("Background")
+            if nodBg is None:
+                raise Exception("Newly created world shader does not contain 'Background' node")
+            # endif
+
+            nodBg.use_custom_color = True
+            nodBg.inputs["Color"].default_value = (0, 0, 0, 1)
+        # endif
+
+        # Set AT.Label shader as world shader
+        bpy.context.scene.world = worldATL
+
+        self._StartDirtyTracking()
+
+        self.Print("ApplyLabel() finished")
+
+    # enddef
+
+    ###################################################################################
+    def _ApplyLabelData(self):
         global c_dicArmatureBoneLabelWeights
 
-        self.Print("ApplyLabel() start")
         clRoot = anyblend.collection.GetRootCollection(bpy.context)
+        self._setUsedPrevObjectData = set()
+        self._setKeepMeshData = set()
+        # Each mesh can only have a single label type
+        self._bUniqueMeshLabels = True
+        self._bRecordMeshData = True
 
         self.clObjectData.clear()
+        self.clMeshData.clear()
         self.dicUserLabelMaterial = {}
         c_dicArmatureBoneLabelWeights = {}
 
@@ -865,6 +1198,7 @@ class CLabelSet:
             raise Exception("No labeltype 'None' defined")
         # endif
         self.clAppliedTypes.clear()
+        c_xInstanceTracker.Clear()
         xAppType = self.clAppliedTypes.add()
         xAppType.sId = xAppType.name = xTypeNone.sId
         xAppType.colLabel = xTypeNone.colLabel
@@ -877,12 +1211,24 @@ class CLabelSet:
 
         ##########################################################################################
         # Add label data from scene
-        self.Print("_AddLabelData() start")
-        self._AddLabelData(clRoot, "NONE", "None", None, None)
+        self.Print("Scene index start")
+        self._xSceneIndex = CSceneIndex.FromContext(bpy.context, clRoot, _xNameCache=self._xNameCache)
+
+        self.Print("Label engine start")
+        xPlan = CLabelEngine(self._xSceneIndex, list(self.clTypes.keys())).Resolve(clRoot.name)
+
+        self.Print("_AddLabelData() start")
+        self._AddLabelData(xPlan)
+
+        if self._dicPrevObjectData is not None:
+            self.Print("_RestorePrevObjectData() start")
+            self._RestorePrevObjectData()
+        # endif
 
         self.Print("Label Types count: {}".format(len(self.clTypes)))
         self.Print("Applied Types count: {}".format(len(self.clAppliedTypes)))
         self.Print("Object Data count: {}".format(len(self.clObjectData)))
+        self.Print("Mesh Data count: {}".format(len(self.clMeshData)))
         self.Print("Ignore Object Data count: {}".format(len(self.clIgnoreObjectData)))
 
         ##########################################################################################
@@ -896,150 +1242,236 @@ class CLabelSet:
         self.Print("_ProvideLabelMaterials() start")
         dicMaterials = self._ProvideLabelMaterials()
         self.iColorNormValue = dicMaterials["iMaxInstCnt"]
+        self.iColorTypeCount = dicMaterials["iLabelTypeCnt"]
 
         # New label meshes created for skeletons need a view layer update
         self.Print("View Layer Update start")
         bpy.context.view_layer.update()
 
-        # Ensure that all meshes have a unique label
-        self.Print("Ensure unique mesh label types...")
-        dicMeshes = {}
+        # With the shared label material, the label type and instance indices are read from object attributes
+        dicTypeIdx: dict[str, int] = None
+        if self.eLabelEncoding == "OBJECT_ATTRIBUTE":
+            dicTypeIdx = {x.sId: i for i, x in enumerate(self.clAppliedTypes)}
+        # endif
+
+        # Set pass index of objects and materials of armature label meshes
+        self.Print("Set pass indices for all objects...")
         for xObjData in self.clObjectData:
-            sMaterialType = xObjData.sMaterialType
-            if sMaterialType == "DEFAULT":
-                sLabelType = xObjData.sLabelId
-                for xMesh in xObjData.clMeshes:
-                    sMeshName = xMesh.sId
-                    if sMeshName not in dicMeshes:
-                        dicMeshes[sMeshName] = sLabelType
-                    else:
-                        if dicMeshes[sMeshName] != sLabelType:
-                            raise RuntimeError(
-                                "Mesh '{}' is used for different label types: {} and {}".format(
-                                    sMeshName, dicMeshes[sMeshName], sLabelType
-                                )
-                            )
-                        # endif
-                    # endif
-                # endfor meshes
+            objX = bpy.data.objects.get(xObjData.sId)
+            if objX.pass_index != xObjData.iLabelPassIdx:
+                objX.pass_index = xObjData.iLabelPassIdx
             # endif
-        # endfor
 
-        # Set materials and pass index of objects
-        self.Print("Set materials and pass indices for all objects...")
-        for xObjData in self.clObjectData:
             sMaterialType = xObjData.sMaterialType
-            dicMatType = dicMaterials["dicTypes"].get(sMaterialType)
-            if dicMatType is None:
-                raise Exception("Materials for material type '{}' do not exist".format(sMaterialType))
+            if dicTypeIdx is not None and sMaterialType == "DEFAULT":
+                iTypeIdx = dicTypeIdx[xObjData.sLabelId]
+                if objX.get(node.grp.object_label_value.c_sTypeIdxKey) != iTypeIdx:
+                    objX[node.grp.object_label_value.c_sTypeIdxKey] = iTypeIdx
+                # endif
+                if objX.get(node.grp.object_label_value.c_sInstIdxKey) != xObjData.iLabelPassIdx:
+                    objX[node.grp.object_label_value.c_sInstIdxKey] = xObjData.iLabelPassIdx
+                # endif
             # endif
 
-            if sMaterialType == "DEFAULT":
-                self._SetDefaultMeshLabelMaterial(dicMatType, xObjData)
-
-            elif sMaterialType == "ARMATURE_MESH":
+            if sMaterialType == "ARMATURE_MESH":
                 # if the material is of type ARMATURE_MESH, need to create
                 # and update a vertex color layer for the mesh.
-                self._SetArmatureMeshLabelMaterial(dicMatType, xObjData)
+                self._SetArmatureMeshLabelMaterial(dicMaterials["dicTypes"]["ARMATURE_MESH"], xObjData)
 
-            else:
+            elif sMaterialType != "DEFAULT":
                 raise Exception("Unsupported label material type '{}'".format(sMaterialType))
             # endif
+        # endfor
+
+        # Set the materials of each mesh only once, even if it is shared by many objects.
+        # The meshes have been checked for a unique label type when the mesh data was added.
+        self.Print("Set materials for all meshes...")
+        for xMeshData in self.clMeshData:
+            if xMeshData.sMaterialType != "DEFAULT":
+                continue
+            # endif
 
-            objX = bpy.data.objects.get(xObjData.sId)
-            objX.pass_index = xObjData.iLabelPassIdx
+            # In an incremental update, the label materials of unchanged meshes are still applied
+            if xMeshData.sId in self._setKeepMeshData and xMeshData.sId not in self._setRestoredMeshes:
+                continue
+            # endif
+
+            self._SetDefaultMeshLabelMaterial(dicMaterials["dicTypes"]["DEFAULT"], xMeshData)
         # endfor
 
-        #######################################################################
-        # Replace world shader with label shader
-        self.Print("Replace world shader...")
+    # enddef
 
-        # Get currently selected world
-        worldAct = bpy.context.scene.world
-        if worldAct is None:
-            raise Exception("Scene has no world shader set")
+    ###################################################################################
+    def UpdateLabel(self):
+        """Re-apply the labels for the scene changes recorded since the last label apply.
+        Only the objects that have changed, or whose label assignment has changed, get their
+        materials restored and set again. If no valid change records are available,
+        the labels are restored and applied completely.
+        """
+        # Evaluate pending scene changes, so that they are recorded by the depsgraph update handler
+        bpy.context.view_layer.update()
+
+        if c_xDirtyTracker.bIsValid is False:
+            self.Restore()
+            self.ApplyLabel()
+            return
         # endif
 
-        # Store current world id
-        self.xLabelSetProp.sWorldId = worldAct.name
+        if c_xDirtyTracker.bHasChanges is False:
+            return
+        # endif
 
-        # Look for "AT.Label" world
-        worldATL = bpy.data.worlds.get("AT.Label")
-        if worldATL is None:
-            # Create the label world shader
-            worldATL = bpy.data.worlds.new(name="AT.Label")
-            worldATL.use_nodes = True
+        self.Print("UpdateLabel() start")
+
+        setObjects = set(c_xDirtyTracker.setObjects)
+        setMeshes = set(c_xDirtyTracker.setMeshes)
+        setMaterials = set(c_xDirtyTracker.setMaterials)
+        c_xDirtyTracker.Invalidate()
+
+        # Restore all objects that have changed since the last label apply,
+        # so that their original data is evaluated again.
+        # Armature label meshes depend on the current pose, so they are always created again.
+        self._setRestoredMeshes = set()
+        self._dicPrevObjectData = self._GetObjectDataRecords()
+        self._dicPrevMeshData = self._GetMeshDataRecords()
+        # The names of the meshes that use a changed material
+        setMaterialMeshes = set(
+            sMeshId
+            for sMeshId, dicMesh in self._dicPrevMeshData.items()
+            if any(x["sId"] in setMaterials for x in dicMesh["lMaterials"])
+        )
+        for sKey, dicRecord in list(self._dicPrevObjectData.items()):
+            if (
+                sKey in setObjects
+                or dicRecord["sMaterialType"] == "ARMATURE_MESH"
+                or dicRecord["sId"] != sKey
+                or any(x in setMeshes or x in setMaterialMeshes for x in dicRecord["lMeshes"])
+            ):
+                self._RestorePrevObject(sKey)
+            # endif
+        # endfor
 
-            nodBg = worldATL.node_tree.nodes.get("Background")
-            if nodBg is None:
-                raise Exception("Newly created world shader does not contain 'Background' node")
+        self._RestoreIgnoreObjectData()
+        self._RestoreCameraFromLabeling()
+
+        self._ApplyLabelData()
+
+        self._dicPrevObjectData = None
+        self._dicPrevMeshData = {}
+
+        self._StartDirtyTracking()
+
+        self.Print("UpdateLabel() finished")
+
+    # enddef
+
+    ###################################################################################
+    def _RestorePrevObjectData(self):
+        # Restore the objects of the last label apply, which are not labeled anymore
+        for sKey, dicRecord in self._dicPrevObjectData.items():
+            if sKey not in self._setUsedPrevObjectData:
+                self._RestoreObjectRecord(dicRecord)
             # endif
+        # endfor
 
-            nodBg.use_custom_color = True
-            nodBg.inputs["Color"].default_value = (0, 0, 0, 1)
-        # endif
+        # Restore the meshes of the last label apply, which are not labeled anymore
+        # or whose label materials have to be set again.
+        for sMeshId, dicMesh in self._dicPrevMeshData.items():
+            if sMeshId not in self._setKeepMeshData:
+                self._RestoreMeshRecord(dicMesh)
+            # endif
+        # endfor
 
-        # Set AT.Label shader as world shader
-        bpy.context.scene.world = worldATL
+    # enddef
 
-        self.Print("ApplyLabel() finished")
+    ###################################################################################
+    def _RestorePrevObject(self, _sKey: str):
+        # Restore an object of the last label apply together with its' meshes
+        # and remove it from the previous object data.
+        dicRecord = self._dicPrevObjectData.pop(_sKey)
+        self._RestoreObjectRecord(dicRecord)
+
+        for sMeshId in dicRecord["lMeshes"]:
+            dicMesh = self._dicPrevMeshData.pop(sMeshId, None)
+            if dicMesh is not None:
+                self._RestoreMeshRecord(dicMesh)
+            # endif
+        # endfor
+
+    # enddef
+
+    ###################################################################################
+    def _StartDirtyTracking(self):
+        # Evaluate the changes made by applying the labels, before recording the scene changes
+        bpy.context.view_layer.update()
+        c_xDirtyTracker.Start()
+
+    # enddef
+
+    ###################################################################################
+    def RecordDepsgraphUpdates(self, _xDepsGraph: bpy.types.Depsgraph):
+        c_xDirtyTracker.RecordDepsgraph(_xDepsGraph)
+
+    # enddef
+
+    ###################################################################################
+    def RecordGeometryUpdates(self, _xDepsGraph: bpy.types.Depsgraph):
+        c_xGeometryTracker.RecordDepsgraph(_xDepsGraph)
 
     # enddef
 
     ############################################################################################################
-    def _SetDefaultMeshLabelMaterial(self, _dicMatType, _xObjData):
-        sLabelType = _xObjData.sLabelId
+    def _SetDefaultMeshLabelMaterial(self, _dicMatType, _xMeshData):
+        sLabelType = _xMeshData.sLabelId
         xMat = _dicMatType.get(sLabelType)
         if xMat is None:
             raise Exception("No material object defined for label type '{}'".format(sLabelType))
         # endif
         matType = xMat.xMaterial
 
-        for xMesh in _xObjData.clMeshes:
-            sMeshId = xMesh.sId
-
-            ### DEBUG
-            # if sMeshId == ".PlantainRibwort_Big_CLUMP_LOW_001":
-            #     print(sMeshId)
-            # # endif
-            ###
+        sMeshId = _xMeshData.sId
 
-            mshX = bpy.data.meshes[sMeshId]
-            iMatCnt = len(mshX.materials)
+        ### DEBUG
+        # if sMeshId == ".PlantainRibwort_Big_CLUMP_LOW_001":
+        #     print(sMeshId)
+        # # endif
+        ###
 
-            # Switch off LOD as workaround for problems with Grasswald.
-            # I cannot find bug where LOD objects are not switched to
-            # render LOD.
-            # The LOD feature has been removed in Blender 2.93
-            if bpy.app.version <= (2, 84, 0):
-                mshX.lod_enabled = False
+        mshX = bpy.data.meshes[sMeshId]
+        iMatCnt = len(mshX.materials)
 
-            if iMatCnt == 0:
-                mshX.materials.append(matType)
-            else:
-                for iMatIdx in range(iMatCnt):
-                    matX = mshX.materials[iMatIdx]
+        # Switch off LOD as workaround for problems with Grasswald.
+        # I cannot find bug where LOD objects are not switched to
+        # render LOD.
+        # The LOD feature has been removed in Blender 2.93
+        if bpy.app.version <= (2, 84, 0):
+            mshX.lod_enabled = False
 
-                    if matX is not None:
-                        matX.use_fake_user = True
-                        if matX.name not in xMesh.clMaterial:
-                            sUserMatId = ""
-                        else:
-                            sUserMatId = xMesh.clMaterial.get(matX.name).sUserId
-                        # endif
+        if iMatCnt == 0:
+            mshX.materials.append(matType)
+        else:
+            for iMatIdx in range(iMatCnt):
+                matX = mshX.materials[iMatIdx]
 
-                        if len(sUserMatId) == 0:
-                            mshX.materials[iMatIdx] = matType
-                        else:
-                            mshX.materials[iMatIdx] = bpy.data.materials[sUserMatId]
-                        # endif
+                if matX is not None:
+                    matX.use_fake_user = True
+                    if matX.name not in _xMeshData.clMaterial:
+                        sUserMatId = ""
                     else:
+                        sUserMatId = _xMeshData.clMaterial.get(matX.name).sUserId
+                    # endif
+
+                    if len(sUserMatId) == 0:
                         mshX.materials[iMatIdx] = matType
+                    else:
+                        mshX.materials[iMatIdx] = bpy.data.materials[sUserMatId]
                     # endif
+                else:
+                    mshX.materials[iMatIdx] = matType
+                # endif
 
-                # endfor materials
-            # endif
-        # endfor meshes
+            # endfor materials
+        # endif
 
     # enddef
 
@@ -1119,6 +1551,7 @@ class CLabelSet:
             sVexColNameLabel=sVexColNameLabel,
             lPreviewColors=lPreviewColors,
             sVexColNamePreview=sVexColNamePreview,
+            xTaskPool=self._GetTaskPool(),
         )
 
         dicArmaBLW = c_dicArmatureBoneLabelWeights.get(objArma.name)
@@ -1170,14 +1603,13 @@ class CLabelSet:
         for boneX in objArma.pose.bones:
             xBone = xPose.clBones.add()
             xBone.sId = xBone.name = boneX.name
-            xMatch = self.reAtBone.search(boneX.name)
+            tAtBone = self._xNameCache.MatchBone(boneX.name)
             # Check whether bone is a AT bone
-            if xMatch is not None:
+            if tAtBone is not None:
                 # If this is an AT bone, add the AT skeleton
                 # and the bone to the applied type and
                 # add a reference to the skeleton to the pose of the instance
-                sSkelId = xMatch.group("skel")
-                sBoneId = xMatch.group("bone")
+                sSkelId, sBoneId = tAtBone
                 xSkel = xActAppType.clSkeletons.get(sSkelId)
                 if xSkel is None:
                     xSkel = xActAppType.clSkeletons.add()
@@ -1230,534 +1662,484 @@ class CLabelSet:
     # enddef
 
     ############################################################################################################
-    def _GetInstances(self, _lObjects: list[str], _sActiveCollection: str) -> list[CLabelInstance]:
-        """For each top level object collect the object itself and all its' children
-            that are of an allowed type and are members of collection _clAct, into separate object lists.
-
-        Parameters
-        ----------
-        _lObjects : list[str]
-            Top level objects.
-        _sActiveCollection : string
-            Only objects and child objects that are members of this collection are considered.
-
-        Returns
-        -------
-        list[CLabelInstance]
-            List of instance objects.
-        """
-        # For each top level object collect the object itself and all its' children
-        # that are of an allowed type, into separate object lists.
-        clnAct = bpy.data.collections.get(_sActiveCollection)
-
-        lLabInstList: list[CLabelInstance] = []
-        for sTopObj in _lObjects:
-            if clnAct is not None and sTopObj not in clnAct.objects:
-                continue
+    def _AddLabelData(self, _xPlan: CLabelPlan):
+        """Apply the label plan created by the label engine to the applied types and object data."""
+        xIndex: CSceneIndex = self._xSceneIndex
+
+        # Mark collections with a label type that is currently not available as not having a label
+        for sCln in _xPlan.lInvalidLabelCollections:
+            clnX = bpy.data.collections.get(sCln)
+            if clnX is None and sCln == bpy.context.scene.collection.name:
+                clnX = bpy.context.scene.collection
             # endif
-
-            if sTopObj not in bpy.context.view_layer.objects:
-                continue
+            if clnX is not None:
+                clnX.AnyTruth.xLabel.bHasLabel = False
             # endif
+        # endfor
 
-            objTop = bpy.data.objects[sTopObj]
+        for sObj in _xPlan.lIgnoreObjects:
+            objX = xIndex.GetObject(sObj)
+            xIgnObjData = self.clIgnoreObjectData.add()
+            xIgnObjData.sId = xIgnObjData.name = objX.name
+            xIgnObjData.bHideRender = objX.hide_render
+            xIgnObjData.bHideViewport = objX.hide_get()
+            anyblend.object.Hide(objX, bHide=True, bHideRender=True)
+        # endfor
 
-            if objTop.AnyTruth.xSettings.bIgnore is True:
-                xIgnObjData = self.clIgnoreObjectData.add()
-                xIgnObjData.sId = xIgnObjData.name = objTop.name
-                xIgnObjData.bHideRender = objTop.hide_render
-                xIgnObjData.bHideViewport = objTop.hide_get()
-                anyblend.object.Hide(objTop, bHide=True, bHideRender=True)
-                continue
+        # Add applied types and their instances
+        for sType in _xPlan.lTypes:
+            xActAppType = self.clAppliedTypes.get(sType)
+            if xActAppType is None:
+                xActLabelType = self.clTypes.get(sType)
+                xActAppType = self.clAppliedTypes.add()
+                xActAppType.sId = xActAppType.name = xActLabelType.sId
+                xActAppType.colLabel = xActLabelType.colLabel
             # endif
 
-            if objTop.type == "EMPTY":
-                lChildren = [x.name for x in objTop.children]
-                if len(lChildren) > 0:
-                    lChildInst = self._GetInstances(lChildren, _sActiveCollection)
-                    lLabInstList.extend(lChildInst)
-                # endif
-
-            elif objTop.type in self._lAllowedInstTypes and objTop.hide_render is False:
-                lInstGrp = [sTopObj]
-                lChildren = [x.name for x in objTop.children]
-                if len(lChildren) > 0:
-                    lChildInst = self._GetInstances(lChildren, _sActiveCollection)
-                    for xChild in lChildInst:
-                        lInstGrp.extend(xChild.lValidObjects)
-                    # endfor
-                # endif
-
-                # Look for instance orientation object
-                objOrient = next(
-                    (x for x in objTop.children if x.type == "EMPTY" and self.reAtOrient.match(x.name) is not None),
-                    None,
-                )
+            for dicInst in _xPlan.dicInstances[sType]:
+                xActInst = xActAppType.clInstances.add()
+                iLabelTypeInstIdx = dicInst["iIdx"]
+                xActInst.name = str(iLabelTypeInstIdx)
+                xActInst.iIdx = iLabelTypeInstIdx
+                xActInst.sOrientId = dicInst["sOrientId"]
 
-                # Check whether object has a child orientation empty
-                if objOrient is None:
-                    sInstOrientId = objTop.name
-                else:
-                    sInstOrientId = objOrient.name
-                # endif
+                for sName, bIsCollection in dicInst["lInstRep"]:
+                    xActInstRep = xActInst.clInstRep.add()
+                    xActInstRep.name = sName
+                    if bIsCollection is True:
+                        xActInstRep.pObject = None
+                        xActInstRep.pCollection = bpy.data.collections.get(sName)
+                    else:
+                        xActInstRep.pObject = xIndex.GetObject(sName)
+                        xActInstRep.pCollection = None
+                    # endif
+                # endfor
+            # endfor
+        # endfor
 
-                # print(f"Cln: {_sActiveCollection}, Top: {objTop.name} -> {sInstOrientId}")
+        # Add the object data in the order of the label traversal,
+        # as this defines the order of the shader types.
+        for dicAssign in _xPlan.lAssignments:
+            sLabelType: str = dicAssign["sType"]
+            xActAppType = self.clAppliedTypes.get(sLabelType)
+            xActInst = xActAppType.clInstances[dicAssign["iInstIdx"] - 1]
 
-                lLabInstList.append(
-                    CLabelInstance(_sTopObj=sTopObj, _sOrientObj=sInstOrientId, _lValidObjects=lInstGrp)
+            # Store pose of armature objects
+            if dicAssign["sTopType"] == "ARMATURE":
+                xArmaPose = self._AddArmatureData(
+                    objArma=xIndex.GetObject(dicAssign["sTopObj"]), xActInst=xActInst, xActAppType=xActAppType
                 )
+            else:
+                xArmaPose = None
             # endif
-        # endfor
 
-        return lLabInstList
+            for sObj in dicAssign["lObjects"]:
+                self._AddObjectData(
+                    objIter=xIndex.GetObject(sObj),
+                    sLabelType=sLabelType,
+                    xActInst=xActInst,
+                    xActAppType=xActAppType,
+                    xArmaPose=xArmaPose,
+                )
+            # endfor object + objects children
+        # endfor assignments
 
     # enddef
 
     ############################################################################################################
-    def _AddLabelData(
-        self,
-        _clAct,
-        _sParentInstType,
-        _sLabelType,
-        _sParentInstOrientId,
-        _iParentInstIdx,
-    ):
-        ### DEBUG
-        # sClName = _clAct.name
-        # if sClName == "Grass":
-        #     print(sClName)
-        # # endif
-        ###
-
-        # 2023-11-28: Exclude this test, to ensure that also materials of objects
-        # in disabled collections are adapted, because these can be the input
-        # to a geometry node tree modifier that uses the collection's objects
-        # as instances.
-
-        # Do not process collections excluded from the current view layer context
-        # if anyblend.collection.IsExcluded(bpy.context, _clAct.name):
-        #     return None
-        # # endif
+    def _AddObjectData(self, *, objIter, sLabelType, xActInst, xActAppType, xArmaPose):
+        sMaterialType: str = "DEFAULT"
+        bIsArmatureMesh: bool = xArmaPose is not None and len(xArmaPose.clSkelId) > 0
+        if bIsArmatureMesh is True and self.bEnableArmatureSelfOcclusion is True:
+            sMaterialType = "ARMATURE_MESH"
+        # endif
 
-        xLabel = None
-        bIgnore = False
-        xAnyTruth = _clAct.AnyTruth
-        if xAnyTruth is None:
-            bIgnore = True
-        else:
-            xLabel = xAnyTruth.xLabel
-            if xLabel is None:
-                bIgnore = True
-            else:
-                bIgnore = xLabel.bIgnore
+        # For an incremental update, look for the object data stored by the last label apply.
+        dicPrev: dict = None
+        if self._dicPrevObjectData is not None:
+            dicPrev = self._dicPrevObjectData.get(objIter.name)
+            if dicPrev is not None and bIsArmatureMesh is True:
+                # The object changed from a plain mesh to an armature mesh
+                self._RestorePrevObject(objIter.name)
+                dicPrev = None
             # endif
+            self._setUsedPrevObjectData.add(objIter.name)
         # endif
 
-        if bIgnore:
-            return None
+        # Store current object data that will be changed
+        xObjData = self.clObjectData.add()
+        xObjData.sLabelId = sLabelType
+        xObjData.iLabelPassIdx = xActInst.iIdx
+        xObjData.sMaterialType = sMaterialType
+
+        objX: bpy.types.Object = None
+        if bIsArmatureMesh is True:
+            # Evaluate mesh object and add it as child to armature.
+            # This will be the object we are labelling.
+            # Armature label meshes are always restored before an incremental update,
+            # so that they are recreated here.
+            objX = armature.CreateLabelMeshObject(objIter)
+        else:
+            objX = objIter
         # endif
 
-        # Test whether collection has a label type that is currently not available
-        # In this case, mark the collection has not having a label
-        if xLabel.bHasLabel is True:
-            if self.clTypes.get(xLabel.sType) is None:
-                xLabel.bHasLabel = False
-            # endif
-        # endif
+        xObjData.sId = xObjData.name = objX.name
 
-        xActLabelType = self.clTypes.get(_sLabelType)
+        # Store object in applied types structure
+        xActObj = xActInst.clObjects.add()
+        xActObj.name = objX.name
+        xActObj.pObject = objX
 
-        sLabelType = xLabel.sType if xLabel.bHasLabel else _sLabelType
-        bEqualLabelType = _sLabelType == sLabelType
+        if dicPrev is not None:
+            # The label materials are still applied to the object,
+            # so the original data is taken from the last label apply.
+            xObjData.iPassIdx = dicPrev["iPassIdx"]
+            xObjData.bIsShadowCatcher = dicPrev["bIsShadowCatcher"]
+            lMeshIds: list[str] = dicPrev["lMeshes"]
 
-        sThisInstType = xLabel.eChildrenInstanceType if xLabel.bHasLabel else "NONE"
-        sParentInstType = _sParentInstType if bEqualLabelType else "NONE"
+        else:
+            xObjData.iPassIdx = objX.pass_index
+            xObjData.bIsShadowCatcher = objX.is_shadow_catcher
 
-        if sThisInstType == "INHERIT":
-            sThisInstType = sParentInstType
-        # endif
+            if self._bRecordMeshData is False:
+                return
+            # endif
 
-        bFirstObject = True
-        dicThisInstInc = self.dicInstInc.get(sParentInstType)
-        if dicThisInstInc is None:
-            raise Exception("Unsupport children instance type '{0}'".format(sParentInstType))
-        # endif
-        iFirstObjInc, iNextObjInc = dicThisInstInc.get(sThisInstType)
+            # get original LOD mesh, which contains the list of lod meshes
+            lObjMeshes = []
+            # The LOD feature has been removed in Blender 2.93
+            if bpy.app.version <= (2, 84, 0):
+                mshOrig = objX.lod_original
+            else:
+                mshOrig = None
+            # endif
 
-        xActLabelType = self.clTypes.get(sLabelType)
-        xActAppType = self.clAppliedTypes.get(sLabelType)
-        if xActAppType is None:
-            xActInst = None
-        else:
-            if bEqualLabelType and _iParentInstIdx is not None and iFirstObjInc == 0:
-                xActInst = xActAppType.clInstances[_iParentInstIdx]
+            if mshOrig is None:
+                # Check whether object has graswald data
+                if hasattr(objX, "graswald"):
+                    xGwLod = objX.graswald.lod
+                    if xGwLod.high_data is not None and xGwLod.low_data is not None and xGwLod.proxy_data is not None:
+                        # Use meshes stored in Graswald LOD
+                        lObjMeshes = [
+                            objX.graswald.lod.high_data,
+                            objX.graswald.lod.low_data,
+                            objX.graswald.lod.proxy_data,
+                        ]
+                    else:
+                        lObjMeshes = [objX.data]
+                    # endif
+                else:
+                    # There are no LODs
+                    lObjMeshes = [objX.data]
+                # endif
             else:
-                xActInst = None
+                # There are LOD meshes
+                if mshOrig.lod_enabled:
+                    lObjMeshes = [x.ui_lod for x in mshOrig.lod_list]
+                else:
+                    lObjMeshes = [objX.data]
+                # endif
             # endif
+
+            lMeshIds = [x.name for x in lObjMeshes]
         # endif
 
-        # Get top-level objects in collection
-        lTopObjs = anyblend.collection.GetCollectionObjects(_clAct)
-        # Keep only those objects that are also rendered
-        lTopObjs = [x for x in lTopObjs if bpy.data.objects[x].hide_render is False]
+        # Loop over LOD meshes of object
+        for sMeshId in lMeshIds:
+            xObjMesh = xObjData.clMeshes.add()
+            xObjMesh.sId = xObjMesh.name = sMeshId
+            self._AddMeshData(
+                sMeshId=sMeshId, sLabelType=sLabelType, sMaterialType=sMaterialType, xActAppType=xActAppType
+            )
+        # endfor meshes
 
-        # Get list of instances by ignoring empties and only collecting
-        # MESH and ARMATURE objects and their children as instances.
-        lLabInst: list[CLabelInstance] = self._GetInstances(lTopObjs, _clAct.name)
+    # enddef
 
-        ##########################################
-        ### DEBUG ####
-        # if _clAct.name == "Highway.4Lane":
-        #     iLen = len(lLabInst)
-        #     print(f"Instance count: {iLen}")
-        #     for xInst in lLabInst:
-        #         print(xInst.lValidObjects)
-        #     # endfor
-        # # endif
-        ##########################################
+    ############################################################################################################
+    def _AddMeshData(self, *, sMeshId: str, sLabelType: str, sMaterialType: str, xActAppType):
+        """Store the original materials of a mesh and evaluate the associated user label materials.
+        The data of each mesh is stored only once, even if the mesh is shared by many objects.
+        """
+        xMeshData = self.clMeshData.get(sMeshId)
+        if xMeshData is not None:
+            # Ensure that all meshes have a unique label
+            if (
+                self._bUniqueMeshLabels is True
+                and sMaterialType == "DEFAULT"
+                and xMeshData.sMaterialType == "DEFAULT"
+                and xMeshData.sLabelId != sLabelType
+            ):
+                raise RuntimeError(
+                    "Mesh '{}' is used for different label types: {} and {}".format(
+                        sMeshId, xMeshData.sLabelId, sLabelType
+                    )
+                )
+            # endif
+            return
+        # endif
 
-        if bEqualLabelType and _sParentInstOrientId is not None and iFirstObjInc == 0:
-            sInstOrientId = _sParentInstOrientId
+        xMeshData = self.clMeshData.add()
+        xMeshData.sId = xMeshData.name = sMeshId
+        xMeshData.sLabelId = sLabelType
+        xMeshData.sMaterialType = sMaterialType
+
+        # In an incremental update, a mesh that still has the label materials applied
+        # is not read from Blender. Its' original data is taken from the last label apply.
+        dicPrevMesh: dict = self._dicPrevMeshData.get(sMeshId) if self._dicPrevObjectData is not None else None
+        if dicPrevMesh is not None:
+            xMeshData.bLodEnabled = dicPrevMesh["bLodEnabled"]
+            lMaterials = dicPrevMesh["lMaterials"]
         else:
-            # Look for instance orientation object
-            objOrient = next(
-                (
-                    bpy.data.objects[x]
-                    for x in lTopObjs
-                    if bpy.data.objects[x].type == "EMPTY" and self.reAtOrient.match(x) is not None
-                ),
-                None,
-            )
-
-            if objOrient is None:
-                # if no explicit instance orientation object is present at the top level,
-                # then look for an orientation empty as child of a top object.
-                for sTopObj in lTopObjs:
-                    objTop = bpy.data.objects[sTopObj]
-                    if objTop is not None:
-                        objOrient = next(
-                            (
-                                x
-                                for x in objTop.children
-                                if x.type == "EMPTY" and self.reAtOrient.match(x.name) is not None
-                            ),
-                            None,
-                        )
-                        if objOrient is not None:
-                            break
-                        # endif
-                    # endif
-                # endfor
+            mshX = bpy.data.meshes[sMeshId]
+            if bpy.app.version <= (2, 84, 0):
+                xMeshData.bLodEnabled = mshX.lod_enabled
+            else:
+                xMeshData.bLodEnabled = False
+            # endif
 
-                if objOrient is None:
-                    # if not explicit orientation object could be found as child of a top object,
-                    # then take the first Empty in the collection.
-                    objOrient = next(
-                        (bpy.data.objects[x] for x in lTopObjs if bpy.data.objects[x].type == "EMPTY"),
-                        None,
-                    )
+            lMaterials = [
+                {"sId": "", "bFakeUser": False} if matX is None else {"sId": matX.name, "bFakeUser": matX.use_fake_user}
+                for matX in mshX.materials
+            ]
+        # endif
 
-                    # if there is also no empty in the collection, use the first object's orientation object
-                    if objOrient is None and len(lLabInst) > 0:
-                        objOrient = bpy.data.objects.get(lLabInst[0].sOrientObj)
-                    # endif
+        # Store current set of materials of mesh
+        bUserMatChanged: bool = False
+        for dicMat in lMaterials:
+            xMeshMat = xMeshData.clMaterial.add()
+            sMatId: str = dicMat["sId"]
+            xMeshMat.sId = sMatId
+            xMeshMat.bFakeUser = dicMat["bFakeUser"]
+            xMeshMat.sUserId = ""
+
+            if len(sMatId) > 0:
+                xMeshMat.name = sMatId
+
+                # Check whether material has associated AnyTruth Material
+                sAtMatId = self._GetUserLabelMaterialId(sMatId, sLabelType)
+                xMeshMat.sUserId = sAtMatId
+                if len(sAtMatId) > 0:
+                    self._AddUserMaterialShaderTypes(xActAppType, sAtMatId)
                 # endif
             # endif
 
-            # if objOrient is not None:
-            #     print(f"clnAct: {_clAct.name}, objOrient: {objOrient.name}")
-            # else:
-            #     print(f"clnAct: {_clAct.name}, objOrient: None")
-            # # endif
+            bUserMatChanged = bUserMatChanged or xMeshMat.sUserId != dicMat.get("sUserId", xMeshMat.sUserId)
+        # endfor materials
+
+        # The label materials of the mesh only need to be set again, if its' label assignment has changed.
+        if (
+            dicPrevMesh is not None
+            and bUserMatChanged is False
+            and dicPrevMesh["sLabelId"] == sLabelType
+            and dicPrevMesh["sMaterialType"] == sMaterialType
+        ):
+            self._setKeepMeshData.add(sMeshId)
+        # endif
 
-            if objOrient is None:
-                sInstOrientId = None
-            else:
-                sInstOrientId = objOrient.name
+    # enddef
+
+    ############################################################################################################
+    def _GetUserLabelMaterialId(self, _sMatId: str, _sLabelType: str) -> str:
+        # Check whether material has associated AnyTruth Material
+        sAtMatId = "{0};AT.Label.{1}".format(_sMatId, _sLabelType)
+        if sAtMatId not in self.dicUserLabelMaterial:
+            # Check whether AnyTruth material is currently active
+            if _sMatId in self.dicUserLabelMaterial:
+                # if yes, then use it also as "replacement"
+                sAtMatId = _sMatId
             # endif
         # endif
 
-        # print(f">> clnAct: {_clAct.name}, sInstOrientId: {sInstOrientId}")
+        # Again check whether label material exists
+        if sAtMatId in self.dicUserLabelMaterial:
+            return sAtMatId
+        # endif
+        return ""
 
-        # Loop over instances
-        for xLabInst in lLabInst:
-            bNewInstance = False
-            if bFirstObject:
-                bFirstObject = False
-                if xActInst is None and iFirstObjInc == 0:
-                    bNewInstance = True
-                else:
-                    bNewInstance = iFirstObjInc > 0
-                # endif
-            else:
-                bNewInstance = iNextObjInc > 0
-            # endif
-
-            # If every object is an instance, then use the object's orientation
-            # as instance orientation, or a child orientation empty.
-            if iNextObjInc > 0:
-                sInstOrientId = xLabInst.sOrientObj
-            # endif
-
-            # Add new instance to applied type data
-            if bNewInstance:
-                if xActAppType is None:
-                    # print(">>>>>")
-                    # print("Add instance type: {0}".format(xActLabelType.sId))
-                    # print("Object: {0}".format(objY.name))
-                    # print("Object parent: {0}".format(objY.parent.name if objY.parent is not None else ""))
-                    # print("Collection: {0}".format(_clAct.name))
-                    # print(">>>>>")
-                    xActAppType = self.clAppliedTypes.add()
-                    xActAppType.sId = xActAppType.name = xActLabelType.sId
-                    xActAppType.colLabel = xActLabelType.colLabel
-                # endif
+    # enddef
 
-                xActInst = xActAppType.clInstances.add()
-                iLabelTypeInstIdx = len(xActAppType.clInstances)
-                xActInst.name = str(iLabelTypeInstIdx)
-                xActInst.iIdx = iLabelTypeInstIdx
-                xActInst.sOrientId = sInstOrientId if sInstOrientId is not None else ""
+    ############################################################################################################
+    def _AddUserMaterialShaderTypes(self, _xActAppType, _sUserMatId: str):
+        dicUserMat = self.dicUserLabelMaterial.get(_sUserMatId)
 
-                # if the whole collection is an instance, then store its' name
-                if iNextObjInc == 0:
-                    xActInstRep = xActInst.clInstRep.add()
-                    xActInstRep.name = _clAct.name
-                    xActInstRep.pObject = None
-                    xActInstRep.pCollection = _clAct
+        _xActAppType.iShaderMaxInstCnt = max(
+            _xActAppType.iShaderMaxInstCnt,
+            dicUserMat.get("iShaderMaxInstCnt"),
+        )
 
-                # endif
+        for sShaderType in dicUserMat.get("lShaderTypes"):
+            if sShaderType not in _xActAppType.clShaderTypes:
+                xShType = _xActAppType.clShaderTypes.add()
+                xShType.sId = xShType.name = sShaderType
             # endif
+        # endfor
 
-            # Store top objects, if every object is an instance
-            if iNextObjInc > 0 and xLabInst.sTopObj not in xActInst.clInstRep:
-                xActInstRep = xActInst.clInstRep.add()
-                xActInstRep.name = xLabInst.sTopObj
-                xActInstRep.pObject = xLabInst.objTop
-                xActInstRep.pCollection = None
-            # endif
+    # enddef
 
-            # Store pose of armature objects
-            if xLabInst.sType == "ARMATURE":
-                xArmaPose = self._AddArmatureData(objArma=xLabInst.objTop, xActInst=xActInst, xActAppType=xActAppType)
-            else:
-                xArmaPose = None
+    ###################################################################################
+    def _GetObjectDataRecords(self) -> dict:
+        """Copy the object data that is stored to restore the scene into plain dictionaries.
+        The dictionary keys are the names of the original objects.
+        """
+        dicRecords: dict = {}
+        for xObjData in self.clObjectData:
+            sKey: str = xObjData.sId
+            if sKey.startswith("AT.Label;"):
+                sKey = sKey[9:]
             # endif
 
-            lObjects: list[bpy.types.Object] = [
-                bpy.data.objects[x] for x in xLabInst.lValidObjects if bpy.data.objects[x].type == "MESH"
-            ]
+            dicRecords[sKey] = {
+                "sId": xObjData.sId,
+                "sLabelId": xObjData.sLabelId,
+                "sMaterialType": xObjData.sMaterialType,
+                "iPassIdx": xObjData.iPassIdx,
+                "iLabelPassIdx": xObjData.iLabelPassIdx,
+                "bIsShadowCatcher": xObjData.bIsShadowCatcher,
+                "lMeshes": [xMesh.sId for xMesh in xObjData.clMeshes],
+            }
+        # endfor
 
-            objIter: bpy.types.Object
-            for objIter in lObjects:
-                # Store current object data that will be changed
-                xObjData = self.clObjectData.add()
-                xObjData.sLabelId = sLabelType
-                xObjData.iLabelPassIdx = xActInst.iIdx
-
-                objX: bpy.types.Object = None
-                if xArmaPose is not None and len(xArmaPose.clSkelId) > 0:
-                    if self.bEnableArmatureSelfOcclusion is True:
-                        xObjData.sMaterialType = "ARMATURE_MESH"
-                    else:
-                        xObjData.sMaterialType = "DEFAULT"
-                    # endif
+        return dicRecords
 
-                    # Evaluate mesh object and add it as child to armature.
-                    # This will be the object we are labelling
-                    objX = armature.CreateLabelMeshObject(objIter)
+    # enddef
 
-                else:
-                    xObjData.sMaterialType = "DEFAULT"
-                    objX = objIter
-                # endif
+    ###################################################################################
+    def _GetMeshDataRecords(self) -> dict:
+        """Copy the mesh data that is stored to restore the scene into plain dictionaries.
+        The dictionary keys are the mesh names.
+        """
+        dicRecords: dict = {}
+        for xMeshData in self.clMeshData:
+            dicRecords[xMeshData.sId] = {
+                "sId": xMeshData.sId,
+                "sLabelId": xMeshData.sLabelId,
+                "sMaterialType": xMeshData.sMaterialType,
+                "bLodEnabled": xMeshData.bLodEnabled,
+                "lMaterials": [
+                    {"sId": xMat.sId, "sUserId": xMat.sUserId, "bFakeUser": xMat.bFakeUser}
+                    for xMat in xMeshData.clMaterial
+                ],
+            }
+        # endfor
 
-                xObjData.sId = xObjData.name = objX.name
-                xObjData.iPassIdx = objX.pass_index
-                xObjData.bIsShadowCatcher = objX.is_shadow_catcher
+        return dicRecords
 
-                # Store object in applied types structure
-                xActObj = xActInst.clObjects.add()
-                xActObj.name = objX.name
-                xActObj.pObject = objX
+    # enddef
 
-                # get original LOD mesh, which contains the list of lod meshes
-                lObjMeshes = []
-                # The LOD feature has been removed in Blender 2.93
-                if bpy.app.version <= (2, 84, 0):
-                    mshOrig = objX.lod_original
-                else:
-                    mshOrig = None
-                # endif
+    ###################################################################################
+    def _RestoreObjectRecord(self, _dicRecord: dict):
+        objX = bpy.data.objects.get(_dicRecord["sId"])
+        if objX is None:
+            return
+        # endif
 
-                if mshOrig is None:
-                    # Check whether object has graswald data
-                    if hasattr(objX, "graswald"):
-                        xGwLod = objX.graswald.lod
-                        if (
-                            xGwLod.high_data is not None
-                            and xGwLod.low_data is not None
-                            and xGwLod.proxy_data is not None
-                        ):
-                            # Use meshes stored in Graswald LOD
-                            lObjMeshes = [
-                                objX.graswald.lod.high_data,
-                                objX.graswald.lod.low_data,
-                                objX.graswald.lod.proxy_data,
-                            ]
-                        else:
-                            lObjMeshes = [objX.data]
-                        # endif
-                    else:
-                        # There are no LODs
-                        lObjMeshes = [objX.data]
-                    # endif
-                else:
-                    # There are LOD meshes
-                    if mshOrig.lod_enabled:
-                        lObjMeshes = [x.ui_lod for x in mshOrig.lod_list]
-                    else:
-                        lObjMeshes = [objX.data]
-                    # endif
-                # endif
+        if armature.TestRemoveLabelMeshObject(objX) is True:
+            return
+        # endif
 
-                # Loop over LOD meshes of object
-                for mshX in lObjMeshes:
-                    xObjMesh = xObjData.clMeshes.add()
-                    xObjMesh.sId = mshX.name
-                    if bpy.app.version <= (2, 84, 0):
-                        xObjMesh.bLodEnabled = mshX.lod_enabled
-                    else:
-                        xObjMesh.bLodEnabled = False
-                    # endif
+        objX.pass_index = _dicRecord["iPassIdx"]
+        objX.is_shadow_catcher = _dicRecord["bIsShadowCatcher"]
 
-                    # lUserMaterial = []
+        # Remove the label attributes used by the shared label material
+        for sKey in (node.grp.object_label_value.c_sTypeIdxKey, node.grp.object_label_value.c_sInstIdxKey):
+            if sKey in objX:
+                del objX[sKey]
+            # endif
+        # endfor
 
-                    # Store current set of materials of mesh
-                    for matX in mshX.materials:
-                        xMeshMat = xObjMesh.clMaterial.add()
-                        if matX is None:
-                            xMeshMat.sId = ""
-                            xMeshMat.sUserId = ""
-                            xMeshMat.bFakeUser = False
-                        else:
-                            xMeshMat.sId = xMeshMat.name = matX.name
-                            xMeshMat.bFakeUser = matX.use_fake_user
-
-                            # Check whether material has associated AnyTruth Material
-                            sAtMatId = "{0};AT.Label.{1}".format(matX.name, sLabelType)
-                            if sAtMatId not in self.dicUserLabelMaterial:
-                                # Check whether AnyTruth material is currently active
-                                if matX.name in self.dicUserLabelMaterial:
-                                    # if yes, then use it also as "replacement"
-                                    sAtMatId = matX.name
-                                # endif
-                            # endif
+    # enddef
 
-                            # Again check whether label material exists
-                            if sAtMatId in self.dicUserLabelMaterial:
-                                xMeshMat.sUserId = sAtMatId
-                                dicUserMat = self.dicUserLabelMaterial.get(sAtMatId)
+    ###################################################################################
+    def _RestoreMeshRecord(self, _dicMesh: dict):
+        sMeshId = _dicMesh["sId"]
+        mshX = bpy.data.meshes.get(sMeshId)
+        if mshX is None:
+            return
+        # endif
+        self._setRestoredMeshes.add(sMeshId)
 
-                                xActAppType.iShaderMaxInstCnt = max(
-                                    xActAppType.iShaderMaxInstCnt,
-                                    dicUserMat.get("iShaderMaxInstCnt"),
-                                )
+        if bpy.app.version <= (2, 84, 0):
+            mshX.lod_enabled = _dicMesh["bLodEnabled"]
+        # endif
 
-                                for sShaderType in dicUserMat.get("lShaderTypes"):
-                                    if sShaderType not in xActAppType.clShaderTypes:
-                                        xShType = xActAppType.clShaderTypes.add()
-                                        xShType.sId = xShType.name = sShaderType
-                                    # endif
-                                # endfor
-                            else:
-                                xMeshMat.sUserId = ""
-                            # endif
-                        # endif
-                    # endfor materials
-                # endfor meshes
+        lMaterials: list = _dicMesh["lMaterials"]
+        if len(lMaterials) == 0:
+            mshX.materials.clear()
+        else:
+            for iMatIdx, dicMat in enumerate(lMaterials):
+                sMatId = dicMat["sId"]
+                if len(sMatId) == 0:
+                    mshX.materials[iMatIdx] = None
+                else:
+                    matX = bpy.data.materials.get(sMatId)
+                    mshX.materials[iMatIdx] = matX
+                    matX.use_fake_user = dicMat["bFakeUser"]
+                # endif
+            # endfor materials
+        # endif has materials
 
-            # endfor object + objects children
-        # endfor objects in collection
+    # enddef
 
-        iThisInstIdx = None
-        if iNextObjInc == 0 and xActInst is not None:
-            iThisInstIdx = len(xActAppType.clInstances) - 1
-        # endif
+    ###################################################################################
+    def _ApplyMaterialOverride(self, _matObject: bpy.types.Material):
+        xViewLayer = bpy.context.view_layer
+        matOrig = xViewLayer.material_override
 
-        # Loop over all child collections
-        for clChild in _clAct.children:
-            iChildInstIdx = self._AddLabelData(clChild, sThisInstType, sLabelType, sInstOrientId, iThisInstIdx)
-            if iThisInstIdx is None and iChildInstIdx is not None and iNextObjInc == 0:
-                iThisInstIdx = iChildInstIdx
-            # endif
-        # endfor
+        self.xLabelSetProp.sViewLayerId = xViewLayer.name
+        self.xLabelSetProp.sMaterialOverrideId = matOrig.name if matOrig is not None else ""
+        self.xLabelSetProp.bMaterialOverrideApplied = True
 
-        if bEqualLabelType and _iParentInstIdx is None and iFirstObjInc == 0 and xActInst is not None:
-            iThisInstIdx = len(xActAppType.clInstances) - 1
-        else:
-            iThisInstIdx = None
+        xViewLayer.material_override = _matObject
+
+    # enddef
+
+    ###################################################################################
+    def _RestoreMaterialOverride(self):
+        if self.xLabelSetProp.bMaterialOverrideApplied is False:
+            return
         # endif
 
-        return iThisInstIdx
+        xViewLayer = bpy.context.scene.view_layers.get(self.xLabelSetProp.sViewLayerId)
+        if xViewLayer is None:
+            raise Exception(
+                "Cannot restore material override of view layer with name '{0}'".format(self.xLabelSetProp.sViewLayerId)
+            )
+        # endif
+
+        sMatId: str = self.xLabelSetProp.sMaterialOverrideId
+        xViewLayer.material_override = bpy.data.materials.get(sMatId) if len(sMatId) > 0 else None
+
+        self.xLabelSetProp.bMaterialOverrideApplied = False
+        self.xLabelSetProp.sViewLayerId = ""
+        self.xLabelSetProp.sMaterialOverrideId = ""
 
     # enddef
 
     ###################################################################################
     def Restore(self):
         self.Print("Restore() start")
+        c_xDirtyTracker.Invalidate()
 
-        for xObjData in self.clObjectData:
-            objX = bpy.data.objects.get(xObjData.sId)
-            if objX is None:
-                continue
-            # endif
-
-            if armature.TestRemoveLabelMeshObject(objX) is True:
-                continue
-            # endif
-
-            for iMeshIdx, xMesh in enumerate(xObjData.clMeshes):
-                sMeshId = xMesh.sId
-                mshX = bpy.data.meshes.get(sMeshId)
-                if bpy.app.version <= (2, 84, 0):
-                    mshX.lod_enabled = xMesh.bLodEnabled
-                # endif
-
-                if len(xMesh.clMaterial) == 0:
-                    mshX.materials.clear()
-                else:
-                    for iMatIdx, xMat in enumerate(xMesh.clMaterial):
-                        sMatId = xMat.sId
-                        if len(sMatId) == 0:
-                            mshX.materials[iMatIdx] = None
-                        else:
-                            matX = bpy.data.materials.get(sMatId)
-                            mshX.materials[iMatIdx] = matX
-                            matX.use_fake_user = xMat.bFakeUser
-                        # endif
-                    # endfor materials
-                # endif has materials
-            # endfor meshes
-            objX.pass_index = xObjData.iPassIdx
-            objX.is_shadow_catcher = xObjData.bIsShadowCatcher
+        self._setRestoredMeshes = set()
+        for dicRecord in self._GetObjectDataRecords().values():
+            self._RestoreObjectRecord(dicRecord)
         # endfor objects
 
-        for xObjData in self.clIgnoreObjectData:
-            objX = bpy.data.objects.get(xObjData.sId)
-            if objX is None:
-                continue
-            # endif
+        # Each mesh is restored only once, even if it is shared by many objects
+        for dicMesh in self._GetMeshDataRecords().values():
+            self._RestoreMeshRecord(dicMesh)
+        # endfor meshes
 
-            objX.hide_render = xObjData.bHideRender
-            objX.hide_set(xObjData.bHideViewport)
-        # endif
+        self._RestoreIgnoreObjectData()
+        self._RestoreMaterialOverride()
 
         self.clObjectData.clear()
-        self.clIgnoreObjectData.clear()
+        self.clMeshData.clear()
         self.clAppliedTypes.clear()
+        c_xInstanceTracker.Clear()
         self.iAppliedTypeSelIdx = 0
         self.iColorNormValue = 0
+        self.iColorTypeCount = 0
 
         # Restore World shader
         worldOrig = bpy.data.worlds.get(self.xLabelSetProp.sWorldId)
@@ -1773,10 +2155,30 @@ class CLabelSet:
 
     # enddef
 
+    ###################################################################################
+    def _RestoreIgnoreObjectData(self):
+        for xObjData in self.clIgnoreObjectData:
+            objX = bpy.data.objects.get(xObjData.sId)
+            if objX is None:
+                continue
+            # endif
+
+            objX.hide_render = xObjData.bHideRender
+            objX.hide_set(xObjData.bHideViewport)
+        # endif
+
+        self.clIgnoreObjectData.clear()
+
+    # enddef
+
     ###################################################################################
     def EvalPoses(self):
         for xAppType in self.clAppliedTypes:
             for xInst in xAppType.clInstances:
+                if self._IsInstanceUnchanged("Poses", xAppType, xInst, lambda: self._GetInstancePoseFingerprint(xInst)):
+                    continue
+                # endif
+
                 for xPose in xInst.clPoses:
                     objX = bpy.data.objects[xPose.sId]
                     if objX is None or objX.type != "ARMATURE":
@@ -1811,9 +2213,255 @@ class CLabelSet:
 
     # enddef
 
+    ###################################################################################
+    def EvalViewCulling(self):
+        # Flag the instances whose bounds are outside of the camera view,
+        # or farther away from the camera than the maximal distance.
+        lInstances: list = [xInst for xAppType in self.clAppliedTypes for xInst in xAppType.clInstances]
+        for xInst in lInstances:
+            if xInst.bIsCulled is True:
+                xInst.bIsCulled = False
+            # endif
+            xInst.fInImageRatio = 1.0
+        # endfor
+
+        if self.bUseViewCulling is False:
+            return
+        # endif
+
+        xDepsGraph = bpy.context.evaluated_depsgraph_get()
+        camX = bpy.context.scene.camera
+        xRender = bpy.context.scene.render
+
+        viewCam = anycam.ops.GetAnyCamView(bpy.context, camX.name, _bAddExtrinsics=True)
+        if not hasattr(viewCam, "ProjectToImage"):
+            viewCam = None
+        # endif
+
+        lBoundedInst: list = []
+        lBounds: list[np.ndarray] = []
+        for xInst in lInstances:
+            aBounds = culling.GetWorldBounds([xObj.pObject for xObj in xInst.clObjects], xDepsGraph)
+            if aBounds is not None:
+                lBoundedInst.append(xInst)
+                lBounds.append(aBounds)
+            # endif
+        # endfor
+
+        if len(lBounds) == 0:
+            return
+        # endif
+
+        fScale: float = xRender.resolution_percentage / 100.0
+        aIsCulled, aInImageRatio = culling.EvalViewCulling(
+            viewCam,
+            np.stack(lBounds),
+            np.array(camX.matrix_world.translation),
+            fMaxDistance=self.fViewCullMaxDistance,
+            tImageSize=(xRender.resolution_x * fScale, xRender.resolution_y * fScale),
+            bIsPinhole=self._IsPinholeCamera(camX),
+        )
+
+        for xInst, bIsCulled, fInImageRatio in zip(lBoundedInst, aIsCulled.tolist(), aInImageRatio.tolist()):
+            xInst.bIsCulled = bIsCulled
+            xInst.fInImageRatio = fInImageRatio
+        # endfor
+
+        self.Print("EvalViewCulling(): {} of {} instances culled".format(int(aIsCulled.sum()), len(lInstances)))
+
+    # enddef
+
+    ###################################################################################
+    def _GetInstanceKey(self, _xAppType, _xInst) -> str:
+        # The key of an instance in the instance tracker. The tracker is shared by all scenes,
+        # so the key contains the scene of the label set, whose instance indices are only unique per scene.
+        return "{};{};{}".format(self.xLabelSetProp.id_data.name, _xAppType.sId, _xInst.iIdx)
+
+    # enddef
+
+    ###################################################################################
+    def _IsInstanceCulled(self, _sStage: str, _xAppType, _xInst) -> bool:
+        # Culled instances are not evaluated by the stage. Their stored state is discarded,
+        # so that the stage is evaluated again, when they come into view.
+        if _xInst.bIsCulled is False:
+            return False
+        # endif
+
+        c_xInstanceTracker.Discard(_sStage, self._GetInstanceKey(_xAppType, _xInst))
+        return True
+
+    # enddef
+
+    ###################################################################################
+    def _IsInstanceUnchanged(self, _sStage: str, _xAppType, _xInst, _funcFingerprint: Callable[[], str]) -> bool:
+        # Test whether the state of an instance, as given by the fingerprint function,
+        # is the same as when the stage was last evaluated for it.
+        if self.bUseTemporalCoherence is False:
+            return False
+        # endif
+
+        return c_xInstanceTracker.IsUnchanged(_sStage, self._GetInstanceKey(_xAppType, _xInst), _funcFingerprint())
+
+    # enddef
+
+    ###################################################################################
+    def _GetInstanceGeoFingerprint(self, _xAppType, _xInst, _xDepsGraph, _xFrameGeo: CFrameGeometry) -> str:
+        # The fingerprint of the world space geometry of all objects of an instance.
+        # It is evaluated once per label data update and shared by all stages.
+        sInstKey = self._GetInstanceKey(_xAppType, _xInst)
+        sFingerprint = self._dicInstGeoFingerprint.get(sInstKey)
+        if sFingerprint is not None:
+            return sFingerprint
+        # endif
+
+        lParts: list = [self.eBoundsFidelity, self.iBoundsSampleCount, self.bUseBoneCapsuleBoxes, _xInst.sOrientId]
+        if len(_xInst.sOrientId) > 0:
+            objOrient = bpy.data.objects.get(_xInst.sOrientId)
+            lParts.append(np.array(objOrient.matrix_world) if objOrient is not None else None)
+        # endif
+
+        # The meshes that are replaced by bone capsules only depend on the armature poses
+        setSkinMeshes: set[str] = set()
+        if self.bUseBoneCapsuleBoxes is True:
+            setSkinMeshes = set(
+                objX.name for lMeshObjects in self._GetInstanceSkinMeshes(_xInst).values() for objX in lMeshObjects
+            )
+            if len(setSkinMeshes) > 0:
+                lParts.append(self._GetInstancePoseFingerprint(_xInst))
+            # endif
+        # endif
+
+        for xObj in _xInst.clObjects:
+            objOrigX = xObj.pObject
+            lParts.extend([objOrigX.name, objOrigX.hide_render, np.array(objOrigX.matrix_world)])
+            if hull.IsStaticMeshObject(objOrigX) is True:
+                lParts.append(hull.GetStaticMeshFingerprint(objOrigX))
+            elif objOrigX.name not in setSkinMeshes:
+                # The vertices are only read, if the depsgraph reported a geometry update of the object
+                lParts.append(
+                    c_xGeometryTracker.GetFingerprint(
+                        "Vex",
+                        objOrigX,
+                        lambda: CInstanceTracker.GetFingerprint(_xFrameGeo.Get(objOrigX, _xDepsGraph).aLocalVex),
+                    )
+                )
+            # endif
+
+            for aHullVex, aMatrices in self._GetGeoNodesInstances(objOrigX, _xDepsGraph, _xFrameGeo):
+                lParts.extend([aHullVex, aMatrices])
+            # endfor
+        # endfor
+
+        sFingerprint = self._dicInstGeoFingerprint[sInstKey] = CInstanceTracker.GetFingerprint(*lParts)
+        return sFingerprint
+
+    # enddef
+
+    ###################################################################################
+    def _GetInstanceSkinMeshes(self, _xInst) -> dict[str, list]:
+        # The rendered mesh objects of an instance per name of the posed armature of the instance,
+        # which deforms them. These meshes are replaced by the bone capsules of the armature.
+        dicSkinMeshes: dict[str, list] = {}
+        setArmatures = set(xPose.sId for xPose in _xInst.clPoses)
+        for xObj in _xInst.clObjects:
+            objArma = capsules.GetSkinArmature(xObj.pObject)
+            if objArma is not None and objArma.name in setArmatures and xObj.pObject.hide_render is False:
+                dicSkinMeshes.setdefault(objArma.name, []).append(xObj.pObject)
+            # endif
+        # endfor
+
+        return dicSkinMeshes
+
+    # enddef
+
+    ###################################################################################
+    def _GetInstancePoseFingerprint(self, _xInst) -> str:
+        lParts: list = []
+        for xPose in _xInst.clPoses:
+            objX = bpy.data.objects.get(xPose.sId)
+            if objX is None or objX.type != "ARMATURE":
+                lParts.append(None)
+                continue
+            # endif
+
+            aBoneMatrices = np.empty(len(objX.pose.bones) * 16, dtype=np.float32)
+            objX.pose.bones.foreach_get("matrix", aBoneMatrices)
+            lParts.extend([xPose.sId, np.array(objX.matrix_world), aBoneMatrices])
+        # endfor
+
+        return CInstanceTracker.GetFingerprint(*lParts)
+
+    # enddef
+
+    ###################################################################################
+    def _GetCameraFingerprint(self) -> str:
+        # The fingerprint of the scene camera pose and projection parameters.
+        if self._sCameraFingerprint is not None:
+            return self._sCameraFingerprint
+        # endif
+
+        xScene = bpy.context.scene
+        camX = xScene.camera
+        lParts: list = [
+            xScene.render.resolution_x,
+            xScene.render.resolution_y,
+            xScene.render.resolution_percentage,
+            xScene.render.pixel_aspect_x,
+            xScene.render.pixel_aspect_y,
+        ]
+        if camX is not None:
+            camData = camX.data
+            lParts.extend(
+                [
+                    camX.name,
+                    np.array(camX.matrix_world),
+                    camX.get("AnyCam"),
+                    camData.type,
+                    camData.lens,
+                    camData.ortho_scale,
+                    camData.sensor_fit,
+                    camData.sensor_width,
+                    camData.sensor_height,
+                    camData.shift_x,
+                    camData.shift_y,
+                    camData.clip_start,
+                    camData.clip_end,
+                ]
+            )
+        # endif
+
+        self._sCameraFingerprint = CInstanceTracker.GetFingerprint(*lParts)
+        return self._sCameraFingerprint
+
+    # enddef
+
+    ###################################################################################
+    def _GetFrameGeometry(self) -> CFrameGeometry:
+        return cache.GetFrameGeometry(
+            bpy.context.scene,
+            bDoublePrecision=self.bGeometryDoublePrecision,
+            iMemoryBudget=self.iGeometryMemoryBudget * 1024 * 1024,
+        )
+
+    # enddef
+
+    ###################################################################################
+    def _GetTaskPool(self) -> CTaskPool:
+        return tasks.GetTaskPool(self.iWorkerThreads)
+
+    # enddef
+
     ###################################################################################
     def EvalBoxes3d(self):
         xDepsGraph = bpy.context.evaluated_depsgraph_get()
+        xFrameGeo = self._GetFrameGeometry()
+        xTaskPool = self._GetTaskPool()
+        iMemoryBudget = self.iGeometryMemoryBudget * 1024 * 1024
+
+        # The vertex sets of the instances are gathered on the main thread and the boxes
+        # are evaluated in parallel, whenever the gathered vertices exceed the memory budget.
+        lBatch: list = []
+        iBatchBytes: int = 0
 
         for xAppType in self.clAppliedTypes:
             ############################################
@@ -1829,64 +2477,30 @@ class CLabelSet:
                 # # endif
                 ############################################
 
-                xInst.xBox3d.bIsValid = False
                 sOrientId = xInst.sOrientId
 
                 # Use presence of sOrientId as flag whether to calculate a 3d box
                 if len(sOrientId) == 0:
+                    xInst.xBox3d.bIsValid = False
                     continue
                 # endif
 
-                aAllVex = None
-                for xObj in xInst.clObjects:
-                    objOrigX = xObj.pObject
-                    if objOrigX.hide_render is True:
-                        continue
-                    # endif
-                    ### DEBUG ###
-                    # print(f"3D Box Object: {objOrigX.name} ({objOrigX.type})")
-                    #############
-
-                    objX = objOrigX.evaluated_get(xDepsGraph)
-                    if len(objX.data.vertices) == 0:
-                        # print("> No vertices!")
-                        continue
-                    # endif
-
-                    # if objOrigX.parent is not None and objOrigX.parent.type == "ARMATURE":
-                    # 	objP = objX.parent.evaluated_get(xDepsGraph)
-                    # 	mWorld = objP.matrix_world @ objX.matrix_world
-                    # else:
-                    # 	mWorld = objX.matrix_world
-                    # # endif
-                    mWorld = objX.matrix_world
-
-                    mWorldT = np.array(mWorld.to_3x3()).transpose()
-                    mTrans = np.array(mWorld.translation)
-                    meshX = objX.to_mesh()
-
-                    iVexCnt = len(meshX.vertices)
-                    aVex = np.empty(iVexCnt * 3, dtype=np.float64)
-                    meshX.vertices.foreach_get("co", aVex)
-                    aVex.shape = (iVexCnt, 3)
-                    aVex = (aVex @ mWorldT) + mTrans
-
-                    if aAllVex is not None:
-                        aAllVex = np.append(aAllVex, aVex, axis=0)
-                    else:
-                        aAllVex = aVex.copy()
-                    # endif
-
-                    objX.to_mesh_clear()
-                # endfor objects
+                if self._IsInstanceCulled("Boxes3d", xAppType, xInst):
+                    xInst.xBox3d.bIsValid = False
+                    continue
+                # endif
 
-                # Test whether any vertices were collected.
-                # This can be zero for mesh objects that only instantiate with geometry nodes.
-                if aAllVex is None or aAllVex.shape[0] == 0:
-                    # print("> No vertices collected")
+                if self._IsInstanceUnchanged(
+                    "Boxes3d",
+                    xAppType,
+                    xInst,
+                    lambda: self._GetInstanceGeoFingerprint(xAppType, xInst, xDepsGraph, xFrameGeo),
+                ):
                     continue
                 # endif
 
+                xInst.xBox3d.bIsValid = False
+
                 # Test whether an orientation object is defined for this instance
                 if len(sOrientId) > 0:
                     # We will use the world matrix axes of the orientation object
@@ -1894,48 +2508,182 @@ class CLabelSet:
                     objOrient = bpy.data.objects.get(sOrientId)
 
                     # Get rotation matrix of orientation object without scale
-                    mWorldT = np.array(objOrient.matrix_world.to_euler().to_matrix()).transpose()
-                    mWorldInvT = np.array(objOrient.matrix_world.to_euler().to_matrix().inverted()).transpose()
-
+                    mAxes = np.array(objOrient.matrix_world.to_euler().to_matrix()).transpose()
                 else:
-                    # Use an SVD to determine the main directions of the vertex set
+                    # The main directions of the vertex set are determined with an SVD.
+                    mAxes = None
+                # endif
+
+                # The extents of static meshes are evaluated from their cached convex hull
+                lVexSets = self._GatherInstanceVex(
+                    xInst,
+                    xDepsGraph,
+                    xFrameGeo,
+                    bHullIsExact=True,
+                    bUseBoneCapsules=self.bUseBoneCapsuleBoxes,
+                    mAxes=mAxes,
+                )
+                lBatch.append((xInst, mAxes, lVexSets))
+                iBatchBytes += sum(aVex.nbytes + mWorld.nbytes for aVex, mWorld in lVexSets)
+
+                if iBatchBytes > iMemoryBudget:
+                    self._WriteBoxes3d(xTaskPool, lBatch, iMemoryBudget)
+                    lBatch = []
+                    iBatchBytes = 0
+                # endif
+            # endfor instance
+        # endfor type
+
+        self._WriteBoxes3d(xTaskPool, lBatch, iMemoryBudget)
+
+    # enddef
+
+    ###################################################################################
+    def _WriteBoxes3d(self, _xTaskPool: CTaskPool, _lBatch: list, _iMemoryBudget: int):
+        # The memory budget is shared by the scratch buffers of all workers
+        iKernelBudget = _iMemoryBudget // _xTaskPool.iWorkers
+        lBoxes = _xTaskPool.Map(kernels.EvalBox3d, ((mAxes, lVexSets, iKernelBudget) for _, mAxes, lVexSets in _lBatch))
+
+        for (xInst, _, _), tBox in zip(_lBatch, lBoxes):
+            # Test whether any vertices were collected.
+            # This can be zero for mesh objects that only instantiate with geometry nodes.
+            if tBox is None:
+                # print("> No vertices collected")
+                continue
+            # endif
+
+            aCtr, aSize, mWorldT = tBox
+
+            xBox3d = xInst.xBox3d
+            xBox3d.bIsValid = True
+            xBox3d.vCenter = tuple(aCtr.tolist())
+            xBox3d.vSize = tuple(aSize.tolist())
+            xBox3d.vAxisX = tuple(mWorldT[0].tolist())
+            xBox3d.vAxisY = tuple(mWorldT[1].tolist())
+            xBox3d.vAxisZ = tuple(mWorldT[2].tolist())
+        # endfor
+
+    # enddef
 
-                    # Object Mean
-                    aMean = np.mean(aAllVex, axis=0)
-                    aRelVex = aAllVex - aMean
-                    aSqVex = aRelVex.transpose() @ aRelVex
+    ###################################################################################
+    def _GatherInstanceVex(
+        self,
+        _xInst,
+        _xDepsGraph,
+        _xFrameGeo: CFrameGeometry,
+        *,
+        bHullIsExact: bool,
+        bUseBoneCapsules: bool = False,
+        mAxes: np.ndarray = None,
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        # Get the local vertices and world matrices of all objects of an instance,
+        # as needed for the bounds fidelity level of the label set.
+        # bHullIsExact states, whether the box evaluated from the convex hull vertices
+        # equals the box evaluated from all vertices. Only then the hull is used at level FULL.
+        sFidelity: str = self.eBoundsFidelity
+        lVexSets: list[tuple[np.ndarray, np.ndarray]] = []
+
+        # The meshes deformed by the posed armatures of the instance are replaced by the bone capsules
+        dicSkinMeshes: dict[str, list] = {}
+        if bUseBoneCapsules is True:
+            dicSkinMeshes = self._GetInstanceSkinMeshes(_xInst)
+            for sArmaId, lMeshObjects in dicSkinMeshes.items():
+                objArma = bpy.data.objects[sArmaId]
+                fPadding = capsules.GetRigPadding(objArma, lMeshObjects)
+                lVexSets.append((capsules.GetPosedCapsuleVex(objArma, fPadding, mAxes), np.eye(4)))
+            # endfor
+        # endif
+        setSkinMeshes = set(objX.name for lMeshObjects in dicSkinMeshes.values() for objX in lMeshObjects)
 
-                    mWorldInvT, mS, mWorldT = np.linalg.svd(aSqVex)
+        for xObj in _xInst.clObjects:
+            objOrigX = xObj.pObject
+            if objOrigX.hide_render is True or objOrigX.name in setSkinMeshes:
+                continue
+            # endif
+            ### DEBUG ###
+            # print(f"Box Object: {objOrigX.name} ({objOrigX.type})")
+            #############
+
+            if sFidelity == "OBJECT_BOUNDS":
+                objX = objOrigX.evaluated_get(_xDepsGraph)
+                lVexSets.append((np.array(objX.bound_box), np.array(objX.matrix_world)))
+            elif hull.IsStaticMeshObject(objOrigX) is True and (bHullIsExact is True or sFidelity != "FULL"):
+                lVexSets.append((hull.GetStaticHullVex(objOrigX), np.array(objOrigX.matrix_world)))
+            elif sFidelity == "HULL":
+                objX = objOrigX.evaluated_get(_xDepsGraph)
+                lVexSets.append((hull.GetEvaluatedHullVex(objX), np.array(objX.matrix_world)))
+            else:
+                xGeo = _xFrameGeo.Get(objOrigX, _xDepsGraph)
+                aVex = xGeo.aLocalVex
+                if sFidelity == "SAMPLED" and aVex.shape[0] > self.iBoundsSampleCount:
+                    # The same vertices are sampled for the same vertex count, so that the boxes do not flicker
+                    xRng = np.random.default_rng(aVex.shape[0])
+                    aVex = aVex[xRng.choice(aVex.shape[0], size=self.iBoundsSampleCount, replace=False)]
                 # endif
+                lVexSets.append((aVex, xGeo.mWorld))
+            # endif
 
-                # print(f"aAllVex.shape: {aAllVex.shape}")
-                aRotVex = aAllVex @ mWorldInvT
+            # Geometry nodes instances are not realized. Instead, the hull vertices
+            # of each instanced mesh are transformed by the matrices of all its' instances.
+            for aHullVex, aMatrices in self._GetGeoNodesInstances(objOrigX, _xDepsGraph, _xFrameGeo):
+                if sFidelity == "OBJECT_BOUNDS":
+                    aHullVex = hull.GetBoundCorners(aHullVex)
+                # endif
+                lVexSets.append((aHullVex, aMatrices))
+            # endfor
+        # endfor objects
 
-                aMin = aRotVex.min(axis=0)
-                aMax = aRotVex.max(axis=0)
-                aSize = aMax - aMin
-                aCtr = (aMin + aSize / 2.0) @ mWorldT
+        return lVexSets
 
-                xBox3d = xInst.xBox3d
-                xBox3d.bIsValid = True
-                xBox3d.vCenter = tuple(aCtr.tolist())
-                xBox3d.vSize = tuple(aSize.tolist())
-                xBox3d.vAxisX = tuple(mWorldT[0].tolist())
-                xBox3d.vAxisY = tuple(mWorldT[1].tolist())
-                xBox3d.vAxisZ = tuple(mWorldT[2].tolist())
+    # enddef
 
-            # endfor instance
-        # endfor type
+    ###################################################################################
+    def _GetGeoNodesInstances(
+        self, _objOrigX, _xDepsGraph, _xFrameGeo: CFrameGeometry
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        if instances.IsInstancer(_objOrigX) is False:
+            return []
+        # endif
+
+        # The depsgraph instances are iterated only once per frame for all instancers of the applied instances
+        if _xFrameGeo.bHasInstances is False:
+            setInstancers: set[str] = set()
+            for xAppType in self.clAppliedTypes:
+                for xInst in xAppType.clInstances:
+                    for xObj in xInst.clObjects:
+                        if xObj.pObject is not None and instances.IsInstancer(xObj.pObject) is True:
+                            setInstancers.add(xObj.pObject.name)
+                        # endif
+                    # endfor
+                # endfor
+            # endfor
+            _xFrameGeo.SetInstances(instances.GatherInstances(_xDepsGraph, setInstancers))
+        # endif
+
+        return _xFrameGeo.GetInstances(_objOrigX.name)
 
     # enddef
 
     ###################################################################################
     def EvalBoxes2d(self, bAllowFovBoxes2d: bool = False):
-        # xDepsGraph = bpy.context.evaluated_depsgraph_get()
+        xDepsGraph = bpy.context.evaluated_depsgraph_get()
+        xFrameGeo = self._GetFrameGeometry()
+        xTaskPool = self._GetTaskPool()
 
         viewCam = anycam.ops.GetAnyCamView(bpy.context, bpy.context.scene.camera.name, _bAddExtrinsics=True)
         bCanProject: bool = hasattr(viewCam, "ProjectToImage")
 
+        if self.eBoxes2dMode == "BOX3D_CORNERS":
+            self._EvalBoxes2dFromBoxes3d(viewCam if bCanProject is True else None, bAllowFovBoxes2d)
+            return
+        # endif
+
+        # For a pinhole projection, the extents of the projected vertices of a mesh are attained
+        # at its' convex hull vertices. Clipping the vertices at the image border needs all vertices.
+        bUseHull: bool = bAllowFovBoxes2d is False and self._IsPinholeCamera(bpy.context.scene.camera)
+
+        lInstances: list = []
+        llVexSets: list = []
         for xAppType in self.clAppliedTypes:
             ############################################
             # ## DEBUG ###
@@ -1950,61 +2698,140 @@ class CLabelSet:
                 # # endif
                 ############################################
 
+                if self._IsInstanceCulled("Boxes2d", xAppType, xInst):
+                    xInst.xBox2d.bIsValid = False
+                    continue
+                # endif
+
+                # The 2D box only changes, if the instance or the camera has moved
+                if bCanProject is True and self._IsInstanceUnchanged(
+                    "Boxes2d",
+                    xAppType,
+                    xInst,
+                    lambda: CInstanceTracker.GetFingerprint(
+                        self._GetInstanceGeoFingerprint(xAppType, xInst, xDepsGraph, xFrameGeo),
+                        self._GetCameraFingerprint(),
+                        bUseHull,
+                        bAllowFovBoxes2d,
+                    ),
+                ):
+                    continue
+                # endif
+
                 xInst.xBox2d.bIsValid = False
+                xInst.xBox2d.bHasCorners = False
                 if bCanProject is False:
                     continue
                 # endif
 
-                aAllVex = None
-                for xObj in xInst.clObjects:
-                    objOrigX = xObj.pObject
-                    if objOrigX.hide_render is True:
-                        continue
-                    # endif
+                lVexSets = self._GatherInstanceVex(xInst, xDepsGraph, xFrameGeo, bHullIsExact=bUseHull)
+                lInstances.append(xInst)
+                llVexSets.append(lVexSets)
+            # endfor instance
+        # endfor type
 
-                    aVex = anyblend.object.GetMeshVex(objOrigX, sFrame="WORLD", bEvaluated=True)
+        # Project the vertices of all instances in one batch per worker
+        iGroupSize: int = max(math.ceil(len(llVexSets) / xTaskPool.iWorkers), 1)
+        llBoxes = xTaskPool.Map(
+            kernels.EvalBoxes2d,
+            ((viewCam, llVexSets[i : i + iGroupSize], bAllowFovBoxes2d) for i in range(0, len(llVexSets), iGroupSize)),
+        )
+        lBoxes = [tBox for lGroupBoxes in llBoxes for tBox in lGroupBoxes]
 
-                    if aAllVex is not None:
-                        aAllVex = np.append(aAllVex, aVex, axis=0)
-                    else:
-                        aAllVex = aVex.copy()
-                    # endif
-                # endfor objects
+        for xInst, tBox in zip(lInstances, lBoxes):
+            if tBox is None:
+                continue
+            # endif
 
-                # Test whether any vertices were collected.
-                # This can be zero for mesh objects that only instantiate with geometry nodes.
-                if aAllVex is None or aAllVex.shape[0] == 0:
-                    # print("> No vertices collected")
-                    continue
-                # endif
+            aMin, aMax = tBox
+            xBox2d = xInst.xBox2d
+            xBox2d.bIsValid = True
+            xBox2d.vMinXY = (aMin[0], aMin[1], 0)
+            xBox2d.vMaxXY = (aMax[0], aMax[1], 0)
+        # endfor
 
-                lImgPnts, lInFront, lInImage = viewCam.ProjectToImage(aAllVex, _bDetailedFlags=True)
-                if bAllowFovBoxes2d:
-                    lImgPnts = [x for i, x in enumerate(lImgPnts) if lInImage[i] and lInFront[i]]
-                # endif
+    # enddef
 
-                if len(lImgPnts) > 0 and (all(lInFront) is True or bAllowFovBoxes2d):
-                    aImgPnts = np.array(lImgPnts)
-                    aMin = np.min(aImgPnts, axis=0)
-                    aMax = np.max(aImgPnts, axis=0)
+    ###################################################################################
+    def _EvalBoxes2dFromBoxes3d(self, _viewCam, _bAllowFovBoxes2d: bool):
+        # Evaluate the 2D boxes from the projected corners of the valid 3D boxes.
+        # The vertex based 2D boxes are not tracked in this mode, so that they are evaluated again.
+        c_xInstanceTracker.Clear("Boxes2d")
 
-                    xBox2d = xInst.xBox2d
-                    xBox2d.bIsValid = True
-                    xBox2d.vMinXY = (aMin[0], aMin[1], 0)
-                    xBox2d.vMaxXY = (aMax[0], aMax[1], 0)
+        lInstances: list = []
+        for xAppType in self.clAppliedTypes:
+            for xInst in xAppType.clInstances:
+                xInst.xBox2d.bIsValid = False
+                xInst.xBox2d.bHasCorners = False
+                if _viewCam is not None and xInst.xBox3d.bIsValid is True:
+                    lInstances.append(xInst)
                 # endif
+            # endfor
+        # endfor
 
-            # endfor instance
-        # endfor type
+        if len(lInstances) == 0:
+            return
+        # endif
+
+        lBoxes = kernels.EvalBoxCorners2d(
+            _viewCam,
+            np.array([xInst.xBox3d.vCenter for xInst in lInstances]),
+            np.array([xInst.xBox3d.vSize for xInst in lInstances]),
+            np.array([(xInst.xBox3d.vAxisX, xInst.xBox3d.vAxisY, xInst.xBox3d.vAxisZ) for xInst in lInstances]),
+            _bAllowFovBoxes2d,
+        )
+
+        for xInst, tBox in zip(lInstances, lBoxes):
+            if tBox is None:
+                continue
+            # endif
+
+            aMin, aMax, aCorners = tBox
+            xBox2d = xInst.xBox2d
+            xBox2d.bIsValid = True
+            xBox2d.vMinXY = (aMin[0], aMin[1], 0)
+            xBox2d.vMaxXY = (aMax[0], aMax[1], 0)
+            if aCorners is not None:
+                xBox2d.bHasCorners = True
+                xBox2d.vCornersXY = aCorners.reshape(-1).tolist()
+            # endif
+        # endfor
+
+    # enddef
+
+    ###################################################################################
+    def _IsPinholeCamera(self, _camX: bpy.types.Object) -> bool:
+        sAnyCam = _camX.get("AnyCam")
+        if sAnyCam is None:
+            return _camX.data.type in ["PERSP", "ORTHO"]
+        # endif
+
+        dicAnyCam: dict = json.loads(sAnyCam)
+        return dicAnyCam is not None and anybase.config.IsConfigType(dicAnyCam, "/anycam/camera/pin:1.2")
 
     # enddef
 
     ###################################################################################
     def EvalVertexLists3d(self):
-        # xDepsGraph = bpy.context.evaluated_depsgraph_get()
+        xDepsGraph = bpy.context.evaluated_depsgraph_get()
+        xFrameGeo = self._GetFrameGeometry()
 
         for xAppType in self.clAppliedTypes:
             for xInst in xAppType.clInstances:
+                if self._IsInstanceCulled("VertexLists3d", xAppType, xInst):
+                    xInst.clVexGrpTypes.clear()
+                    continue
+                # endif
+
+                if self._IsInstanceUnchanged(
+                    "VertexLists3d",
+                    xAppType,
+                    xInst,
+                    lambda: self._GetInstanceVexListFingerprint(xAppType, xInst, xDepsGraph, xFrameGeo),
+                ):
+                    continue
+                # endif
+
                 # Clear any vertex group types that may be present
                 xInst.clVexGrpTypes.clear()
 
@@ -2017,6 +2844,11 @@ class CLabelSet:
                     # endif
                     # print("Processing object: {0}".format(objOrigX.name))
 
+                    # The line strips of all vertex groups of the object are evaluated together.
+                    # The vertex groups are referenced by their keys, as references to collection
+                    # elements may become invalid, when elements are added to the collection.
+                    lLineStripGroups: list[tuple[tuple[str, str, str], tuple[float, float, float]]] = []
+
                     # Loop over all vertex groups to get association of label type to vertex color
                     for vgX in objOrigX.vertex_groups:
                         # print("Processing vertex group: {0}".format(vgX.name))
@@ -2033,18 +2865,18 @@ class CLabelSet:
                         #           That is, there may be any number of vertex groups with the same label type and
                         #           shader instance, but different (r, g, b) values and names.
                         #           For example, a road lane line could have a center, left and right line-strip.
-                        mchVgName = self.reAtVexGrp.match(vgX.name)
-                        if mchVgName is None:
+                        dicVgName = self._xNameCache.MatchVexGrp(vgX.name)
+                        if dicVgName is None:
                             continue
                         # endif
 
-                        sVgLabelType = mchVgName.group("type")
-                        sVgShInst = mchVgName.group("inst")
-                        sVgId = mchVgName.group("id")
-                        sVgVexType = mchVgName.group("vextype")
-                        sVgColR = mchVgName.group("r")
-                        sVgColG = mchVgName.group("g")
-                        sVgColB = mchVgName.group("b")
+                        sVgLabelType = dicVgName["type"]
+                        sVgShInst = dicVgName["inst"]
+                        sVgId = dicVgName["id"]
+                        sVgVexType = dicVgName["vextype"]
+                        sVgColR = dicVgName["r"]
+                        sVgColG = dicVgName["g"]
+                        sVgColB = dicVgName["b"]
                         tRGB = (
                             float(sVgColR) / 255.0,
                             float(sVgColG) / 255.0,
@@ -2088,15 +2920,7 @@ class CLabelSet:
                         xVexGrp.vColor = tRGB
 
                         if sVgVexType == "ls":
-                            lLineStrips = self._GetVexListLineStrip(objOrigX, tRGB)
-                            for lLineStrip in lLineStrips:
-                                xVexList = xVexGrp.clVertexLists.add()
-                                xVexList.eType = "LINESTRIP"
-                                for lVex in lLineStrip:
-                                    xVex = xVexList.clVertices.add()
-                                    xVex.vVertex = tuple(lVex)
-                                # endfor
-                            # endfor
+                            lLineStripGroups.append(((sVgLabelType, sVgShInst, sVgId), tRGB))
                         else:
                             raise Exception(
                                 "Vertex group type '{0}' not supported "
@@ -2104,6 +2928,25 @@ class CLabelSet:
                             )
                         # endif
                     # endfor vertex groups
+
+                    if len(lLineStripGroups) == 0:
+                        continue
+                    # endif
+
+                    llLineStrips = self._GetVexListLineStrips(
+                        objOrigX, [tRGB for _, tRGB in lLineStripGroups], xDepsGraph, xFrameGeo
+                    )
+                    for ((sVgLabelType, sVgShInst, sVgId), _), lLineStrips in zip(lLineStripGroups, llLineStrips):
+                        xVexGrp = xInst.clVexGrpTypes[sVgLabelType].clInstances[sVgShInst].clVertexGroups[sVgId]
+                        for lLineStrip in lLineStrips:
+                            xVexList = xVexGrp.clVertexLists.add()
+                            xVexList.eType = "LINESTRIP"
+                            for lVex in lLineStrip:
+                                xVex = xVexList.clVertices.add()
+                                xVex.vVertex = tuple(lVex)
+                            # endfor
+                        # endfor
+                    # endfor
                 # endfor objects
             # endfor instance
         # endfor type
@@ -2111,249 +2954,93 @@ class CLabelSet:
     # enddef
 
     ##########################################################################
-    def _GetVexListLineStrip(self, _objOrigX, _tRGB):
-        xDG = bpy.context.evaluated_depsgraph_get()
-
-        objX = _objOrigX.evaluated_get(xDG)
-        mshX = objX.to_mesh()
-
-        mWorld = objX.matrix_world
-        mWorldT = np.array(mWorld.to_3x3()).transpose()
-        mTrans = np.array(mWorld.translation)
-
-        xVexCol = mshX.vertex_colors.get("AT.Label")
-        if xVexCol is None:
-            raise Exception("Vertex color layer with name 'AT.Label' not available")
-        # endif
-
-        # Find indices of vertices that have the given color associated in the vertex color layer.
-        # lColVexColor = [
-        # 	tuple(xVexCol.data[i].color) for i, x in enumerate(mshX.loops)
-        # 	if xVexCol.data[i].color[0] > 0.0
-        # ]
-
-        fClose = 1e-2
-        fPrec = 1 / 512.0
-        lColVexIdx = [
-            x.vertex_index
-            for i, x in enumerate(mshX.loops)
-            if (
-                abs(xVexCol.data[i].color[0] - _tRGB[0]) < fPrec
-                and abs(xVexCol.data[i].color[1] - _tRGB[1]) < fPrec
-                and abs(xVexCol.data[i].color[2] - _tRGB[2]) < fPrec
-            )
-        ]
-
-        # Get indices of edges whose both vertices are contained in lColVexList
-        lEdgeIdx = [x.index for x in mshX.edges if all((v in lColVexIdx for v in x.vertices))]
-        # Get the vertex indices for the edges
-        lEdgeVexIdx = [[mshX.edges[i].vertices[0], mshX.edges[i].vertices[1]] for i in lEdgeIdx]
-
-        # Get unique set of vertex indices contained in all edges
-        lVexIdx = list(set([i for lSublist in lEdgeVexIdx for i in lSublist]))
-
-        # Get the array of vertex coordinates
-        aVex = np.array([list(mshX.vertices[i].co) for i in lVexIdx])
-
-        # Convert the edge indices to indices for lVexIdx
-        lMyEdgeVexIdx = [[lVexIdx.index(lEdge[0]), lVexIdx.index(lEdge[1])] for lEdge in lEdgeVexIdx]
-
-        # Find vertex indices that relate to the same point in space
-        lSameVexIdx = [lEdge for lEdge in lMyEdgeVexIdx if np.linalg.norm(aVex[lEdge[0]] - aVex[lEdge[1]]) < fClose]
+    def _GetInstanceVexListFingerprint(self, _xAppType, _xInst, _xDepsGraph, _xFrameGeo: CFrameGeometry) -> str:
+        # The vertex lists also depend on the vertex groups and the label vertex colors
+        lParts: list = [self._GetInstanceGeoFingerprint(_xAppType, _xInst, _xDepsGraph, _xFrameGeo)]
+        for xObj in _xInst.clObjects:
+            objOrigX = xObj.pObject
+            if objOrigX.type != "MESH" or "AT.Label" not in objOrigX.data.vertex_colors:
+                continue
+            # endif
 
-        # Create a vertex index reference list, where equivalent vertices point to the same index
-        lSameRefIdx = np.arange(aVex.shape[0]).tolist()
-        for lSameIdx in lSameVexIdx:
-            lSameRefIdx[max(lSameIdx)] = min(lSameIdx)
+            lParts.append([vgX.name for vgX in objOrigX.vertex_groups])
+            if hull.IsStaticMeshObject(objOrigX) is True:
+                lParts.append(cache.GetMeshVexColorHash(objOrigX.data, "AT.Label"))
+            else:
+                lParts.append(
+                    c_xGeometryTracker.GetFingerprint(
+                        "VexCol", objOrigX, lambda: self._GetVexColorFingerprint(objOrigX, _xDepsGraph, _xFrameGeo)
+                    )
+                )
+            # endif
         # endfor
 
-        # Get the list of vertices that are unique in 3d space
-        lUniqueVexIdx = list(set(lSameRefIdx))
-        iUniqueVexCnt = len(lUniqueVexIdx)
+        return CInstanceTracker.GetFingerprint(*lParts)
 
-        # Get the 3d coordinates of these unique vertices
-        aUniqueVex = (aVex[lUniqueVexIdx] @ mWorldT) + mTrans
-
-        # Convert the edge indices so that indices that refer to the same vertex are also equal,
-        # and remove edges that have zero length
-        lMyEdgeVexIdx = [
-            [lSameRefIdx[lEdge[0]], lSameRefIdx[lEdge[1]]]
-            for lEdge in lMyEdgeVexIdx
-            if lSameRefIdx[lEdge[0]] != lSameRefIdx[lEdge[1]]
-        ]
-
-        # Convert vertex indices to point into lUniqueVexIdx
-        lMyEdgeVexIdx = [[lUniqueVexIdx.index(lEdge[0]), lUniqueVexIdx.index(lEdge[1])] for lEdge in lMyEdgeVexIdx]
-
-        # Create hashes of edges and reduce them to a unique set
-        setMyEdgeVexIdxHash = set([min(lEdge) * iUniqueVexCnt + max(lEdge) for lEdge in lMyEdgeVexIdx])
+    # enddef
 
-        # Get list of unique edges
-        lMyUniqueEdge = [[int(h / iUniqueVexCnt), h % iUniqueVexCnt] for h in set(setMyEdgeVexIdxHash)]
+    ##########################################################################
+    def _GetVexColorFingerprint(self, _objOrigX, _xDepsGraph, _xFrameGeo: CFrameGeometry) -> str:
+        xGeo = _xFrameGeo.Get(_objOrigX, _xDepsGraph, sVexColName="AT.Label")
+        return CInstanceTracker.GetFingerprint(xGeo.aEdges, xGeo.aLoopVex, xGeo.aLoopColors)
 
-        # find edge connections
-        lStripLists = []
-        setAllStripVex = set([])
-        bHasLoop = False
+    # enddef
 
-        for lStartEdge in lMyUniqueEdge:
-            if lStartEdge[0] in setAllStripVex:
-                continue
-            # endif
-            lEdge = lStartEdge.copy()
-            # print("Start Edge: {0}".format(lStartEdge))
-            lStrip = []
-            lStripVex = []
-            while True:
-                if lEdge[0] in lStripVex:
-                    # print("Loop: {0}".format(lEdge))
-                    bHasLoop = True
-                    break
-                # endif
-                setAllStripVex.add(lEdge[0])
-                lStripVex.append(lEdge[0])
-                lStrip.append(lEdge)
-                lNextEdge = next(
-                    (x for x in lMyUniqueEdge if x[0] == lEdge[1] and x[1] not in setAllStripVex),
-                    None,
-                )
-                if lNextEdge is None:
-                    lNextEdge = next(
-                        (x for x in lMyUniqueEdge if x[1] == lEdge[1] and x[0] not in setAllStripVex),
-                        None,
-                    )
-                    if lNextEdge is None:
-                        if lEdge[1] not in setAllStripVex:
-                            lStripVex.append(lEdge[1])
-                            setAllStripVex.add(lEdge[1])
-                        # endif
-                        break
-                    # endif
-                    lEdge = [lNextEdge[1], lNextEdge[0]]
-                else:
-                    lEdge = lNextEdge
+    ##########################################################################
+    def _GetVexListLineStrips(
+        self, _objOrigX, _ltRGB: list[tuple[float, float, float]], _xDepsGraph, _xFrameGeo: CFrameGeometry
+    ) -> list[list]:
+        # Get the line strips of all given vertex colors of an object, from a single evaluation of the object.
+        # The line strips of static meshes are read from the disk cache, if available.
+        llLineStrips: list = [None] * len(_ltRGB)
+        lCacheKeys: list = [None] * len(_ltRGB)
+        xDiskCache = cache.GetDiskCache()
+        if xDiskCache is not None and hull.IsStaticMeshObject(_objOrigX) is True:
+            mWorld = _objOrigX.matrix_world
+            mWorldT = np.array(mWorld.to_3x3()).transpose()
+            mTrans = np.array(mWorld.translation)
+            sVexColHash = cache.GetMeshVexColorHash(_objOrigX.data, "AT.Label")
+            # Line strips are joined by distances in world space, which depend on the object scale
+            tScale = tuple(round(x, 6) for x in mWorld.to_scale())
+
+            for iColor, tRGB in enumerate(_ltRGB):
+                lCacheKeys[iColor] = "{};{};{}".format(sVexColHash, tuple(tRGB), tScale)
+                dicStrips = xDiskCache.Load("linestrip", lCacheKeys[iColor])
+                if dicStrips is not None:
+                    llLineStrips[iColor] = [
+                        ((dicStrips["aStrip{}".format(i)] @ mWorldT) + mTrans).tolist() for i in range(len(dicStrips))
+                    ]
                 # endif
             # endfor
-            # print("lStrip ({0}):\n{1}\n".format(len(lStrip), lStrip))
+        # endif
 
-            lEdge = lStartEdge.copy()
-            while True:
-                lNextEdge = next(
-                    (x for x in lMyUniqueEdge if x[1] == lEdge[0] and x[0] not in setAllStripVex),
-                    None,
-                )
-                if lNextEdge is None:
-                    lNextEdge = next(
-                        (x for x in lMyUniqueEdge if x[0] == lEdge[0] and x[1] not in setAllStripVex),
-                        None,
-                    )
-                    if lNextEdge is None or lNextEdge[1] in setAllStripVex:
-                        if lEdge[0] not in lStripVex:
-                            lStripVex.insert(0, lEdge[0])
-                            setAllStripVex.add(lEdge[0])
-                        # endif
-                        break
-                    # endif
-                    lEdge = [lNextEdge[1], lNextEdge[0]]
-                else:
-                    lEdge = lNextEdge
-                # endif
-                if lEdge[0] in lStripVex:
-                    # print("Loop: {0}".format(lEdge))
-                    bHasLoop = True
-                    break
-                # endif
-                setAllStripVex.add(lEdge[0])
-                lStripVex.insert(0, lEdge[0])
-                lStrip.insert(0, lEdge)
-            # endfor
-            # print("lStrip ({0}):\n{1}\n".format(len(lStrip), lStrip))
+        lEvalColors: list[int] = [iColor for iColor, lLineStrips in enumerate(llLineStrips) if lLineStrips is None]
+        if len(lEvalColors) == 0:
+            return llLineStrips
+        # endif
 
-            if bHasLoop:
-                break
-            # endif
-            lStripLists.append(lStripVex)
-        # endfor
-        # print("lStripLists ({0}):\n{1}\n".format(len(lStripLists), lStripLists))
-
-        if bHasLoop:
-            raise Exception("Edge loop found in line strip")
-        # endif
-
-        # Check whether line strips are connected in 3d space
-        setUsedStripIdx = set([])
-        lFullStripLists = []
-        iStartStripIdx = 0
-        while iStartStripIdx < len(lStripLists):
-            if iStartStripIdx not in setUsedStripIdx:
-                setUsedStripIdx.add(iStartStripIdx)
-                lStrip = lStripLists[iStartStripIdx]
-                lFullStrip = lStrip.copy()
-                aVexBase = aUniqueVex[lStrip[-1]]
-                while True:
-                    bNextStripFound = False
-                    for iTestStripIdx in range(len(lStripLists)):
-                        if iTestStripIdx in setUsedStripIdx:
-                            continue
-                        # endif
-                        lTestStrip = lStripLists[iTestStripIdx]
-                        if np.linalg.norm(aVexBase - aUniqueVex[lTestStrip[0]]) < fClose:
-                            setUsedStripIdx.add(iTestStripIdx)
-                            lFullStrip.extend(lTestStrip[1:])
-                            aVexBase = aUniqueVex[lTestStrip[-1]]
-                            bNextStripFound = True
-                            break
-                        elif np.linalg.norm(aVexBase - aUniqueVex[lTestStrip[-1]]) < fClose:
-                            setUsedStripIdx.add(iTestStripIdx)
-                            lFullStrip.extend(lTestStrip[-2:0:-1])
-                            aVexBase = aUniqueVex[lTestStrip[0]]
-                            bNextStripFound = True
-                            break
-                        # endif
-                    # endfor
-                    if not bNextStripFound:
-                        break
-                    # endif
-                # endwhile
+        xGeo = _xFrameGeo.Get(_objOrigX, _xDepsGraph, sVexColName="AT.Label")
+        if xGeo.aLoopColors is None:
+            raise Exception("Vertex color layer with name 'AT.Label' not available")
+        # endif
 
-                aVexBase = aUniqueVex[lStrip[0]]
-                while True:
-                    bPrevStripFound = False
-                    for iTestStripIdx in range(len(lStripLists)):
-                        if iTestStripIdx in setUsedStripIdx:
-                            continue
-                        # endif
-                        lTestStrip = lStripLists[iTestStripIdx]
-                        if np.linalg.norm(aVexBase - aUniqueVex[lTestStrip[-1]]) < fClose:
-                            setUsedStripIdx.add(iTestStripIdx)
-                            lTemp = lTestStrip[0:-2]
-                            lTemp.extend(lFullStrip)
-                            lFullStrip = lTemp
-                            aVexBase = aUniqueVex[lTestStrip[0]]
-                            bPrevStripFound = True
-                            break
-                        elif np.linalg.norm(aVexBase - aUniqueVex[lTestStrip[0]]) < fClose:
-                            setUsedStripIdx.add(iTestStripIdx)
-                            lTemp = lTestStrip[-1:1:-1]
-                            lTemp.extend(lFullStrip)
-                            lFullStrip = lTemp
-                            aVexBase = aUniqueVex[lTestStrip[-1]]
-                            bPrevStripFound = True
-                            break
-                        # endif
-                    # endfor
-                    if not bPrevStripFound:
-                        break
-                    # endif
-                # endwhile
+        # The face loops are classified against all colors at once
+        lStripsPerColor = linestrip.GetLineStripsPerColor(
+            xGeo.aLocalVex, xGeo.aEdges, xGeo.aLoopVex, xGeo.aLoopColors, [_ltRGB[i] for i in lEvalColors], xGeo.mWorld
+        )
 
-                lFullStripLists.append(aUniqueVex[lFullStrip].tolist())
+        for iColor, (lFullStripLists, lLocalStripLists) in zip(lEvalColors, lStripsPerColor):
+            llLineStrips[iColor] = lFullStripLists
+            if lCacheKeys[iColor] is not None:
+                xDiskCache.Store(
+                    "linestrip",
+                    lCacheKeys[iColor],
+                    {"aStrip{}".format(i): aStrip for i, aStrip in enumerate(lLocalStripLists)},
+                )
             # endif
-            iStartStripIdx += 1
-        # endwhile
-        # print("lFullStripLists ({0}):\n{1}\n".format(len(lFullStripLists), lFullStripLists))
+        # endfor
 
-        return lFullStripLists
+        return llLineStrips
 
     # enddef
 
@@ -2372,6 +3059,9 @@ class CLabelSet:
         # Create Node Groups needed
         self.ProvideLabelNodeGroups()
 
+        # The recorded geometry updates do not refer to the loaded file
+        c_xGeometryTracker.Invalidate()
+
     # enddef
 
     ##########################################################################
@@ -2410,7 +3100,11 @@ class CLabelSet:
         matBlenderToWorld = self._GetBlenderToCustomWorldMatrix()
         matBlenderToWorldRot = matBlenderToWorld.to_3x3()
 
-        dicData = {"sId": "${filebasename}", "iColorNormValue": self.iColorNormValue}
+        dicData = {
+            "sId": "${filebasename}",
+            "iColorNormValue": self.iColorNormValue,
+            "iColorTypeCount": self.iColorTypeCount,
+        }
 
         # Camera data
         camX = bpy.context.scene.camera
@@ -2459,6 +3153,10 @@ class CLabelSet:
 
             dicInstances = {}
             for xInst in xType.clInstances:
+                if xInst.bIsCulled is True and self.bExportCulledInstances is False:
+                    continue
+                # endif
+
                 dicInst = dicInstances.get(xInst.iIdx)
                 if dicInst is None:
                     dicInst = dicInstances[xInst.iIdx] = {"iIdx": xInst.iIdx}
@@ -2474,6 +3172,11 @@ class CLabelSet:
                 # lObjList.extend(lArmaList)
                 dicInst["lNames"] = [x.name for x in xInst.clInstRep]
 
+                if self.bUseViewCulling is True:
+                    dicInst["bIsCulled"] = xInst.bIsCulled
+                    dicInst["fInImageRatio"] = xInst.fInImageRatio
+                # endif
+
                 # ##########################################################################################
                 xBox2d = xInst.xBox2d
                 if xBox2d.bIsValid is True:
@@ -2481,10 +3184,14 @@ class CLabelSet:
                         "lMinXY": [xBox2d.vMinXY[0], xBox2d.vMinXY[1]],
                         "lMaxXY": [xBox2d.vMaxXY[0], xBox2d.vMaxXY[1]],
                     }
+                    if xBox2d.bHasCorners is True:
+                        lCornersXY = list(xBox2d.vCornersXY)
+                        dicInst["mBox2d"]["lCornersXY"] = [lCornersXY[i : i + 2] for i in range(0, 16, 2)]
+                    # endif
                 # endif
 
                 # ##########################################################################################
-                if len(xInst.sOrientId) > 0:
+                if len(xInst.sOrientId) > 0 and xInst.bIsCulled is False:
                     xBox3d = xInst.xBox3d
 
                     dicInst["mBox3d"] = {
@@ -2626,6 +3333,74 @@ class CLabelSet:
 
     # enddef
 
+    ##########################################################################
+    def ResetEncodingCapacity(self):
+        """Reset the automatically grown encoding capacity. Call this at the start of a new frame sequence."""
+        if self.eEncodingCapacity == "AUTO":
+            self.iCapacityTypeCount = 0
+            self.iCapacityMaxInstCount = 0
+        # endif
+
+    # enddef
+
+    ##########################################################################
+    def _GetEncodingCapacity(self, _iLabelTypeCnt: int, _iMaxInstCnt: int) -> tuple[int, int]:
+        """Get the label type count and maximal instance count used for the label encoding.
+
+        Parameters
+        ----------
+        _iLabelTypeCnt : int
+            The number of applied label types.
+        _iMaxInstCnt : int
+            The maximal instance count of the applied label types.
+
+        Returns
+        -------
+        tuple[int, int]
+            The label type count and the maximal instance count of the encoding capacity.
+        """
+        fScale: float = 1.0 + self.fCapacityHeadroom
+        if self.eEncodingCapacity == "PINNED":
+            # Counts that have not been set are pinned to the current counts with headroom on first use
+            if self.iCapacityTypeCount == 0:
+                self.iCapacityTypeCount = int(math.ceil(_iLabelTypeCnt * fScale))
+            # endif
+            if self.iCapacityMaxInstCount == 0:
+                self.iCapacityMaxInstCount = int(math.ceil(_iMaxInstCnt * fScale))
+            # endif
+
+            if _iLabelTypeCnt > self.iCapacityTypeCount:
+                raise RuntimeError(
+                    "The label type count {} exceeds the pinned encoding capacity of {}".format(
+                        _iLabelTypeCnt, self.iCapacityTypeCount
+                    )
+                )
+            # endif
+            if _iMaxInstCnt > self.iCapacityMaxInstCount:
+                raise RuntimeError(
+                    "The maximal instance count {} exceeds the pinned encoding capacity of {}".format(
+                        _iMaxInstCnt, self.iCapacityMaxInstCount
+                    )
+                )
+            # endif
+            return self.iCapacityTypeCount, self.iCapacityMaxInstCount
+
+        elif self.eEncodingCapacity == "AUTO":
+            # The capacity only grows, so that the encoding stays stable for a frame sequence
+            if _iLabelTypeCnt > self.iCapacityTypeCount:
+                self.iCapacityTypeCount = int(math.ceil(_iLabelTypeCnt * fScale))
+            # endif
+            if _iMaxInstCnt > self.iCapacityMaxInstCount:
+                self.iCapacityMaxInstCount = int(math.ceil(_iMaxInstCnt * fScale))
+            # endif
+            return self.iCapacityTypeCount, self.iCapacityMaxInstCount
+
+        # endif
+
+        return _iLabelTypeCnt, _iMaxInstCnt
+
+    # enddef
+
     ##########################################################################
     def _ProvideLabelMaterials(self):
         iMaxInstCnt = 0
@@ -2637,19 +3412,30 @@ class CLabelSet:
         # endfor
 
         iLabelTypeCnt = len(lTypeIds)
+        iLabelTypeCnt, iMaxInstCnt = self._GetEncodingCapacity(iLabelTypeCnt, iMaxInstCnt)
 
         dicMatDefault = {}
         dicMatArma = {}
 
+        # Label materials whose parameters have not changed since the last apply are reused
+        xPool = CLabelPool(
+            iLabelTypeCount=iLabelTypeCnt,
+            iMaxInstCount=iMaxInstCnt,
+            eLabelShaderType=self.xAnyCamConfig.eLabelShaderType,
+        )
+
+        # All label types may share a single label material
+        matShared = None
+        if self.eLabelEncoding == "OBJECT_ATTRIBUTE":
+            matShared = xPool.GetLabelShared()
+        # endif
+
         for iIdx, sTypeId in enumerate(lTypeIds):
-            matLabel = CLabel(
-                iLabelTypeCount=iLabelTypeCnt,
-                iMaxInstCount=iMaxInstCnt,
-                iId=iIdx,
-                sName=sTypeId,
-                eLabelShaderType=self.xAnyCamConfig.eLabelShaderType,
-                bForce=True,
-            )
+            if matShared is not None:
+                matLabel = matShared
+            else:
+                matLabel = xPool.GetLabel(iId=iIdx, sTypeId=sTypeId)
+            # endif
 
             dicMatDefault[sTypeId] = matLabel
 
@@ -2663,14 +3449,7 @@ class CLabelSet:
                 # and attach its' red channel to the shader type input.
                 dicMatSkel = {}
                 for sSkelId in clSkel.keys():
-                    matSkel = CLabelSkeleton(
-                        iLabelTypeCount=iLabelTypeCnt,
-                        iMaxInstCount=iMaxInstCnt,
-                        iId=iIdx,
-                        sLabelId=sTypeId,
-                        sSkelId=sSkelId,
-                        eLabelShaderType=self.xAnyCamConfig.eLabelShaderType,
-                    )
+                    matSkel = xPool.GetLabelSkeleton(iId=iIdx, sTypeId=sTypeId, sSkelId=sSkelId)
 
                     dicMatSkel[sSkelId] = matSkel
                 # endfor
@@ -2679,6 +3458,8 @@ class CLabelSet:
             # endif
         # endfor
 
+        xPool.RecycleUnused()
+
         return {
             "iMaxInstCnt": iMaxInstCnt,
             "iLabelTypeCnt": iLabelTypeCnt,
@@ -2690,10 +3471,12 @@ class CLabelSet:
     ############################################################################################################
     def ProvideLabelNodeGroups(self):
         lNodeGroups = []
-        lNodeGroups.append(node.grp.material_label_value.Create(iLabelTypeCount=1, iMaxInstCount=1, bUseFakeUser=True))
-        lNodeGroups.append(node.grp.shader_label_value.Create(bForce=True, bUseFakeUser=True))
-        lNodeGroups.append(node.shader.label_diffuse.Create(bForce=True, bUseFakeUser=True))
-        lNodeGroups.append(node.shader.label_emission.Create(bForce=True, bUseFakeUser=True))
+        # Node groups are only rebuilt if they were created by a different version of this add-on
+        lNodeGroups.append(node.grp.material_label_value.Create(bUseFakeUser=True))
+        lNodeGroups.append(node.grp.object_label_value.Create(bUseFakeUser=True))
+        lNodeGroups.append(node.grp.shader_label_value.Create(bUseFakeUser=True))
+        lNodeGroups.append(node.shader.label_diffuse.Create(bUseFakeUser=True))
+        lNodeGroups.append(node.shader.label_emission.Create(bUseFakeUser=True))
 
         lNodeGroupNames = [x.name for x in lNodeGroups]
         # Ensure that node groups of the given names do not have copies.
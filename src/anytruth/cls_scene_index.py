@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_scene_index.py
+# Created Date: Saturday, October 17th 2026, 9:12:40 am
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+from typing import Any, Optional
+
+from .cls_name_cache import CNameCache
+
+
+###################################################################################
+# Label settings of a collection
+class CCollectionLabel:
+    def __init__(self, *, _bIgnore: bool, _bHasLabel: bool, _sType: str, _sChildrenInstType: str):
+        self.bIgnore: bool = _bIgnore
+        self.bHasLabel: bool = _bHasLabel
+        self.sType: str = _sType
+        self.sChildrenInstType: str = _sChildrenInstType
+
+    # enddef
+
+
+# endclass
+
+
+###################################################################################
+# Index of all scene data that is needed to assign labels to objects.
+# The index is built in a single pass over all objects and collections,
+# so that the label traversal does not need to do any Blender RNA lookups.
+# The index module itself does not import bpy, so that it can also be
+# filled with synthetic data outside of Blender.
+class CSceneIndex:
+    def __init__(self, _xNameCache: Optional[CNameCache] = None):
+        # Classification of AnyTruth names
+        self._xNameCache: CNameCache = _xNameCache if _xNameCache is not None else CNameCache()
+        # Blender objects by name
+        self._dicObjects: dict[str, Any] = {}
+        # Object properties by name
+        self._dicObjType: dict[str, str] = {}
+        self._dicObjHideRender: dict[str, bool] = {}
+        self._dicObjIgnore: dict[str, bool] = {}
+        # Child object names per object name
+        self._dicObjChildren: dict[str, list[str]] = {}
+        # Names of all objects in the active view layer
+        self._setViewLayerObjects: set[str] = set()
+        # Names of all instance orientation empties
+        self._setOrientEmpties: set[str] = set()
+        # Names of all label mesh objects created for armature meshes
+        self._setLabelMeshes: set[str] = set()
+        # First child orientation empty per object name, evaluated on demand
+        self._dicFirstChildOrient: dict[str, Optional[str]] = {}
+        # Names of the direct member objects per collection name.
+        # The scene master collection has no entry, as it contains all objects.
+        self._dicClnObjects: dict[str, set[str]] = {}
+        # Top level object names per collection name
+        self._dicClnTopObjects: dict[str, list[str]] = {}
+        # Child collection names per collection name
+        self._dicClnChildren: dict[str, list[str]] = {}
+        # Label settings per collection name
+        self._dicClnLabel: dict[str, CCollectionLabel] = {}
+
+    # enddef
+
+    ##########################################################################
+    @classmethod
+    def FromContext(cls, _xContext, _clRoot, *, _xNameCache: Optional[CNameCache] = None) -> "CSceneIndex":
+        """Create the scene index for the given context.
+
+        Parameters
+        ----------
+        _xContext : bpy.types.Context
+            The Blender context. The objects of the context's view layer are regarded as visible.
+        _clRoot : bpy.types.Collection
+            The root collection of the label traversal.
+        _xNameCache : Optional[CNameCache], optional
+            The name classification cache to use. If None, a new cache is created.
+
+        Returns
+        -------
+        CSceneIndex
+            The filled scene index.
+        """
+        # Imported here, so that the index class can be used without Blender.
+        import anyblend
+
+        xIndex = cls(_xNameCache)
+        xIndex._setViewLayerObjects = set(x.name for x in _xContext.view_layer.objects)
+
+        for objX in _xContext.blend_data.objects:
+            sName: str = objX.name
+            xIndex.AddObject(
+                _sName=sName,
+                _sType=objX.type,
+                _bHideRender=objX.hide_render,
+                _bIgnore=objX.AnyTruth.xSettings.bIgnore,
+                _sParent=objX.parent.name if objX.parent is not None else None,
+                _objX=objX,
+            )
+        # endfor
+
+        # Add all collections below the root collection.
+        # A collection can be linked into more than one parent, but is only evaluated once.
+        lStack: list = [_clRoot]
+        while len(lStack) > 0:
+            clnX = lStack.pop()
+            if clnX.name in xIndex._dicClnTopObjects:
+                continue
+            # endif
+
+            xAnyTruth = clnX.AnyTruth
+            xLabel = xAnyTruth.xLabel if xAnyTruth is not None else None
+            xClnLabel: Optional[CCollectionLabel] = None
+            if xLabel is not None:
+                xClnLabel = CCollectionLabel(
+                    _bIgnore=xLabel.bIgnore,
+                    _bHasLabel=xLabel.bHasLabel,
+                    _sType=xLabel.sType,
+                    _sChildrenInstType=xLabel.eChildrenInstanceType,
+                )
+            # endif
+
+            xIndex.AddCollection(
+                _sName=clnX.name,
+                _lObjects=None if clnX == _xContext.scene.collection else [x.name for x in clnX.objects],
+                _lTopObjects=[x.name for x in anyblend.collection.GetCollectionObjects(clnX)],
+                _lChildren=[x.name for x in clnX.children],
+                _xLabel=xClnLabel,
+            )
+            lStack.extend(clnX.children)
+        # endwhile
+
+        return xIndex
+
+    # enddef
+
+    ##########################################################################
+    def AddObject(
+        self,
+        *,
+        _sName: str,
+        _sType: str,
+        _bHideRender: bool = False,
+        _bIgnore: bool = False,
+        _sParent: Optional[str] = None,
+        _objX: Any = None,
+    ):
+        self._dicObjects[_sName] = _objX
+        self._dicObjType[_sName] = _sType
+        self._dicObjHideRender[_sName] = _bHideRender
+        self._dicObjIgnore[_sName] = _bIgnore
+        self._dicObjChildren.setdefault(_sName, [])
+
+        if _sParent is not None:
+            self._dicObjChildren.setdefault(_sParent, []).append(_sName)
+        # endif
+
+        if _sType == "EMPTY" and self._xNameCache.IsOrientEmpty(_sName) is True:
+            self._setOrientEmpties.add(_sName)
+        elif _sType == "MESH" and self._xNameCache.IsLabelMesh(_sName) is True:
+            self._setLabelMeshes.add(_sName)
+        # endif
+
+    # enddef
+
+    ##########################################################################
+    def AddCollection(
+        self,
+        *,
+        _sName: str,
+        _lObjects: Optional[list[str]],
+        _lTopObjects: list[str],
+        _lChildren: list[str],
+        _xLabel: Optional["CCollectionLabel"] = None,
+    ):
+        """Add a collection to the index.
+
+        Parameters
+        ----------
+        _sName : str
+            The collection name.
+        _lObjects : Optional[list[str]]
+            The names of the direct member objects. Set to None for the scene master collection.
+        _lTopObjects : list[str]
+            The names of the top level objects of the collection.
+        _lChildren : list[str]
+            The names of the child collections.
+        _xLabel : Optional[CCollectionLabel], optional
+            The label settings of the collection. If None, the collection is ignored.
+        """
+        if _lObjects is not None:
+            self._dicClnObjects[_sName] = set(_lObjects)
+        # endif
+        self._dicClnTopObjects[_sName] = list(_lTopObjects)
+        self._dicClnChildren[_sName] = list(_lChildren)
+        if _xLabel is not None:
+            self._dicClnLabel[_sName] = _xLabel
+        # endif
+
+    # enddef
+
+    ##########################################################################
+    def GetObject(self, _sName: str):
+        return self._dicObjects.get(_sName)
+
+    # enddef
+
+    ##########################################################################
+    def GetType(self, _sName: str) -> Optional[str]:
+        return self._dicObjType.get(_sName)
+
+    # enddef
+
+    ##########################################################################
+    def IsHiddenRender(self, _sName: str) -> bool:
+        return self._dicObjHideRender.get(_sName, True)
+
+    # enddef
+
+    ##########################################################################
+    def IsIgnored(self, _sName: str) -> bool:
+        return self._dicObjIgnore.get(_sName, False)
+
+    # enddef
+
+    ##########################################################################
+    def IsInViewLayer(self, _sName: str) -> bool:
+        return _sName in self._setViewLayerObjects
+
+    # enddef
+
+    ##########################################################################
+    def IsOrientEmpty(self, _sName: str) -> bool:
+        return _sName in self._setOrientEmpties
+
+    # enddef
+
+    ##########################################################################
+    def IsLabelMesh(self, _sName: str) -> bool:
+        return _sName in self._setLabelMeshes
+
+    # enddef
+
+    ##########################################################################
+    def IsInCollection(self, _sName: str, _sCollection: str) -> bool:
+        """Test whether an object is a direct member of a collection.
+        The scene master collection has no member list and contains all objects.
+        """
+        setObjects = self._dicClnObjects.get(_sCollection)
+        if setObjects is None:
+            return True
+        # endif
+        return _sName in setObjects
+
+    # enddef
+
+    ##########################################################################
+    def GetChildren(self, _sName: str) -> list[str]:
+        return self._dicObjChildren.get(_sName, [])
+
+    # enddef
+
+    ##########################################################################
+    def GetCollectionTopObjects(self, _sCollection: str) -> list[str]:
+        return self._dicClnTopObjects.get(_sCollection, [])
+
+    # enddef
+
+    ##########################################################################
+    def GetCollectionChildren(self, _sCollection: str) -> list[str]:
+        return self._dicClnChildren.get(_sCollection, [])
+
+    # enddef
+
+    ##########################################################################
+    def GetCollectionLabel(self, _sCollection: str) -> Optional["CCollectionLabel"]:
+        return self._dicClnLabel.get(_sCollection)
+
+    # enddef
+
+    ##########################################################################
+    def GetFirstChildOrientEmpty(self, _sName: str) -> Optional[str]:
+        if _sName in self._dicFirstChildOrient:
+            return self._dicFirstChildOrient[_sName]
+        # endif
+
+        sOrientObj = next((x for x in self.GetChildren(_sName) if x in self._setOrientEmpties), None)
+        self._dicFirstChildOrient[_sName] = sOrientObj
+        return sOrientObj
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \geometry\cache.py
+# Created Date: Saturday, October 17th 2026, 11:48:20 pm
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+from typing import Optional
+
+import bpy
+import numpy as np
+
+from .cls_disk_cache import CDiskCache
+from .cls_frame_geometry import CFrameGeometry
+from .cls_frame_geometry import c_iDefaultMemoryBudget
+
+# Disk cache of the geometry summaries. This is None, if no cache path is set.
+c_xDiskCache: Optional[CDiskCache] = None
+
+# Evaluated geometry of the objects in the current frame. This is None, if no frame is evaluated.
+c_xFrameGeometry: Optional[CFrameGeometry] = None
+
+
+#########################################################################
+def SetDiskCachePath(_sPath: str):
+    """Set the path of the geometry summary disk cache. An empty path disables the disk cache."""
+    global c_xDiskCache
+
+    if len(_sPath) == 0:
+        c_xDiskCache = None
+        return
+    # endif
+
+    sPath: str = bpy.path.abspath(_sPath)
+    if c_xDiskCache is None or c_xDiskCache.pathMain.as_posix() != sPath:
+        c_xDiskCache = CDiskCache(sPath)
+    # endif
+
+
+# enddef
+
+
+#########################################################################
+def GetDiskCache() -> Optional[CDiskCache]:
+    return c_xDiskCache
+
+
+# enddef
+
+
+#########################################################################
+def GetMeshVexColorHash(_meshX: bpy.types.Mesh, _sVexColName: str) -> str:
+    """Get the hash of the vertices, edges, loops and a vertex color layer of a mesh.
+
+    Parameters
+    ----------
+    _meshX : bpy.types.Mesh
+        The mesh.
+    _sVexColName : str
+        The name of the vertex color layer.
+
+    Returns
+    -------
+    str
+        The hash of the mesh data.
+    """
+    iVexCnt = len(_meshX.vertices)
+    aVex = np.empty(iVexCnt * 3, dtype=np.float32)
+    _meshX.vertices.foreach_get("co", aVex)
+
+    iEdgeCnt = len(_meshX.edges)
+    aEdges = np.empty(iEdgeCnt * 2, dtype=np.int32)
+    _meshX.edges.foreach_get("vertices", aEdges)
+
+    iLoopCnt = len(_meshX.loops)
+    aLoops = np.empty(iLoopCnt, dtype=np.int32)
+    _meshX.loops.foreach_get("vertex_index", aLoops)
+
+    aColors = np.empty(0, dtype=np.float32)
+    xVexCol = _meshX.vertex_colors.get(_sVexColName)
+    if xVexCol is not None:
+        aColors = np.empty(len(xVexCol.data) * 4, dtype=np.float32)
+        xVexCol.data.foreach_get("color", aColors)
+    # endif
+
+    return CDiskCache.GetHash(aVex, aEdges, aLoops, aColors)
+
+
+# enddef
+
+
+#########################################################################
+def GetFrameGeometry(
+    _xScene: bpy.types.Scene, *, bDoublePrecision: bool = False, iMemoryBudget: int = c_iDefaultMemoryBudget
+) -> CFrameGeometry:
+    """Get the evaluated geometry cache of the current frame of a scene.
+    The cache is dropped and created again, if the frame or the precision has changed.
+    """
+    global c_xFrameGeometry
+
+    if (
+        c_xFrameGeometry is None
+        or c_xFrameGeometry.iFrame != _xScene.frame_current
+        or c_xFrameGeometry.bDoublePrecision != bDoublePrecision
+    ):
+        c_xFrameGeometry = CFrameGeometry(
+            iFrame=_xScene.frame_current, bDoublePrecision=bDoublePrecision, iMemoryBudget=iMemoryBudget
+        )
+    # endif
+
+    return c_xFrameGeometry
+
+
+# enddef
+
+
+#########################################################################
+def ReleaseFrameGeometry():
+    global c_xFrameGeometry
+
+    if c_xFrameGeometry is not None:
+        c_xFrameGeometry.Clear()
+        c_xFrameGeometry = None
+    # endif
+
+
+# enddef
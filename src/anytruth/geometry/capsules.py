@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \geometry\capsules.py
+# Created Date: Sunday, October 18th 2026, 1:17:38 am
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+from typing import Optional
+
+import bpy
+import numpy as np
+
+from ..cls_instance_tracker import CInstanceTracker
+
+# Rest pose fingerprint and capsule padding per rig, which is given by the armature
+# object name and the names of the mesh objects it deforms.
+c_dicRigPadding: dict[str, tuple[str, float]] = {}
+
+# Maximal number of vertices that are tested against all bone capsules at once
+c_iMaxPaddingVexCount: int = 1 << 12
+
+
+#########################################################################
+def GetSkinArmature(_objX: bpy.types.Object) -> Optional[bpy.types.Object]:
+    """Get the armature object that deforms an object via an armature modifier, or None."""
+    for xMod in _objX.modifiers:
+        if xMod.type == "ARMATURE" and xMod.object is not None:
+            return xMod.object
+        # endif
+    # endfor
+    return None
+
+
+# enddef
+
+
+#########################################################################
+def _GetDeformMask(_lBones) -> np.ndarray:
+    # The mask of the bones that deform meshes. Control bones, like IK targets, poles or root bones,
+    # may lie far away from the meshes, so that they are not used as capsules.
+    aIsDeform = np.empty(len(_lBones), dtype=bool)
+    _lBones.foreach_get("use_deform", aIsDeform)
+    return aIsDeform
+
+
+# enddef
+
+
+#########################################################################
+def _GetRestCapsules(_objArma: bpy.types.Object) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Heads, tails and radii of the deforming bones in the rest pose in armature space
+    lBones = _objArma.data.bones
+    iBoneCnt = len(lBones)
+    aHead = np.empty(iBoneCnt * 3, dtype=np.float64)
+    aTail = np.empty(iBoneCnt * 3, dtype=np.float64)
+    aRadius = np.empty(iBoneCnt * 2, dtype=np.float64)
+    lBones.foreach_get("head_local", aHead)
+    lBones.foreach_get("tail_local", aTail)
+    aRadius[0::2] = [boneX.head_radius for boneX in lBones]
+    aRadius[1::2] = [boneX.tail_radius for boneX in lBones]
+
+    aIsDeform = _GetDeformMask(lBones)
+    return aHead.reshape(-1, 3)[aIsDeform], aTail.reshape(-1, 3)[aIsDeform], aRadius.reshape(-1, 2)[aIsDeform]
+
+
+# enddef
+
+
+#########################################################################
+def EvalCapsuleDistance(_aVex: np.ndarray, _aHead: np.ndarray, _aTail: np.ndarray, _aRadius: np.ndarray) -> np.ndarray:
+    """Evaluate the signed distance of vertices to the closest of a set of capsules.
+    The radius of each capsule is interpolated linearly between its' head and tail.
+
+    Parameters
+    ----------
+    _aVex : np.ndarray
+        The vertices, as array of shape (n, 3).
+    _aHead : np.ndarray
+        The capsule head positions, as array of shape (b, 3).
+    _aTail : np.ndarray
+        The capsule tail positions, as array of shape (b, 3).
+    _aRadius : np.ndarray
+        The head and tail radii per capsule, as array of shape (b, 2).
+
+    Returns
+    -------
+    np.ndarray
+        The distances, which are negative within a capsule, as array of shape (n,).
+    """
+    aDir = _aTail - _aHead
+    aDirSqLen = np.maximum(np.sum(aDir * aDir, axis=1), 1e-12)
+
+    # Parameter of the closest point on each bone segment, as array of shape (n, b)
+    aRelVex = _aVex[:, np.newaxis, :] - _aHead[np.newaxis, :, :]
+    aParam = np.clip(np.sum(aRelVex * aDir[np.newaxis, :, :], axis=2) / aDirSqLen, 0.0, 1.0)
+
+    aDist = np.linalg.norm(aRelVex - aParam[:, :, np.newaxis] * aDir[np.newaxis, :, :], axis=2)
+    aDist -= _aRadius[:, 0] + aParam * (_aRadius[:, 1] - _aRadius[:, 0])
+    return np.min(aDist, axis=1)
+
+
+# enddef
+
+
+#########################################################################
+def GetRigPadding(_objArma: bpy.types.Object, _lMeshObjects: list[bpy.types.Object]) -> float:
+    """Get the padding that has to be added to the bone radii of a rig, so that the bone capsules
+    contain the meshes deformed by the armature. The padding is calibrated once in the rest pose
+    and only calibrated again, if the rest pose or the meshes change.
+
+    Parameters
+    ----------
+    _objArma : bpy.types.Object
+        The armature object.
+    _lMeshObjects : list[bpy.types.Object]
+        The mesh objects deformed by the armature.
+
+    Returns
+    -------
+    float
+        The padding in armature space.
+    """
+    aHead, aTail, aRadius = _GetRestCapsules(_objArma)
+    sRigId = ";".join([_objArma.name] + sorted(objX.name for objX in _lMeshObjects))
+
+    # The rest pose vertices of all meshes in armature space
+    mArmaInv = np.linalg.inv(np.array(_objArma.matrix_world))
+    lVex: list[np.ndarray] = []
+    lMatrices: list[np.ndarray] = []
+    for objX in _lMeshObjects:
+        meshX: bpy.types.Mesh = objX.data
+        aVex = np.empty(len(meshX.vertices) * 3, dtype=np.float32)
+        meshX.vertices.foreach_get("co", aVex)
+        lVex.append(aVex.reshape(-1, 3))
+        lMatrices.append(mArmaInv @ np.array(objX.matrix_world))
+    # endfor
+
+    sFingerprint = CInstanceTracker.GetFingerprint(aHead, aTail, aRadius, *lVex, *lMatrices)
+    tPadding = c_dicRigPadding.get(sRigId)
+    if tPadding is not None and tPadding[0] == sFingerprint:
+        return tPadding[1]
+    # endif
+
+    fPadding: float = 0.0
+    if aHead.shape[0] > 0:
+        for aVex, mLocal in zip(lVex, lMatrices):
+            mRotT = mLocal[0:3, 0:3].transpose()
+            for iStart in range(0, aVex.shape[0], c_iMaxPaddingVexCount):
+                aArmaVex = (aVex[iStart : iStart + c_iMaxPaddingVexCount] @ mRotT) + mLocal[0:3, 3]
+                fPadding = max(fPadding, float(np.max(EvalCapsuleDistance(aArmaVex, aHead, aTail, aRadius))))
+            # endfor
+        # endfor
+    # endif
+
+    c_dicRigPadding[sRigId] = (sFingerprint, fPadding)
+    return fPadding
+
+
+# enddef
+
+
+#########################################################################
+def GetPosedCapsuleVex(_objArma: bpy.types.Object, _fPadding: float, _mAxes: Optional[np.ndarray]) -> np.ndarray:
+    """Get world space points, whose box along the given axes contains the capsules of all posed deforming bones.
+    For each bone head and tail, the points at the padded radius along the positive and
+    negative box axes are returned.
+
+    Parameters
+    ----------
+    _objArma : bpy.types.Object
+        The posed armature object.
+    _fPadding : float
+        The padding of the bone radii in armature space, see GetRigPadding().
+    _mAxes : Optional[np.ndarray]
+        The 3x3 matrix whose rows are the unit box axes in world space.
+        If None, the world axes are used.
+
+    Returns
+    -------
+    np.ndarray
+        The points in world space, as array of shape (12 * b, 3) for b deforming bones.
+    """
+    lPoseBones = _objArma.pose.bones
+    iBoneCnt = len(lPoseBones)
+    aEnds = np.empty((iBoneCnt, 2, 3), dtype=np.float64)
+    aHead = np.empty(iBoneCnt * 3, dtype=np.float64)
+    aTail = np.empty(iBoneCnt * 3, dtype=np.float64)
+    lPoseBones.foreach_get("head", aHead)
+    lPoseBones.foreach_get("tail", aTail)
+    aEnds[:, 0, :] = aHead.reshape(-1, 3)
+    aEnds[:, 1, :] = aTail.reshape(-1, 3)
+
+    aRadius = np.array([(boneX.bone.head_radius, boneX.bone.tail_radius) for boneX in lPoseBones], dtype=np.float64)
+    aRadius = aRadius.reshape(-1, 2) + _fPadding
+
+    # Only the deforming bones are used as capsules, as in GetRigPadding()
+    aIsDeform = np.array([boneX.bone.use_deform for boneX in lPoseBones], dtype=bool)
+    aEnds = aEnds[aIsDeform]
+    aRadius = aRadius[aIsDeform]
+
+    # Transform to world space. Radii are scaled by the maximal scale of the armature.
+    mWorld = np.array(_objArma.matrix_world)
+    aEnds = (aEnds.reshape(-1, 3) @ mWorld[0:3, 0:3].transpose()) + mWorld[0:3, 3]
+    aRadius = aRadius.reshape(-1) * float(np.max(np.linalg.norm(mWorld[0:3, 0:3], axis=0)))
+
+    mAxes = np.eye(3) if _mAxes is None else np.asarray(_mAxes, dtype=np.float64)
+    aOffsets = np.concatenate([mAxes, -mAxes], axis=0)
+    aPoints = aEnds[:, np.newaxis, :] + aRadius[:, np.newaxis, np.newaxis] * aOffsets[np.newaxis, :, :]
+    return aPoints.reshape(-1, 3)
+
+
+# enddef
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \geometry\cls_box_reducer.py
+# Created Date: Saturday, October 17th 2026, 10:24:38 pm
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+from typing import Optional
+
+import numpy as np
+
+# Default memory budget of the scratch buffers in bytes
+c_iDefaultMemoryBudget: int = 256 * 1024 * 1024
+
+
+###################################################################################
+# Streaming evaluation of an oriented 3D bounding box.
+# The vertices of all objects of an instance are folded into running extents
+# along the box axes, so that the vertices of all objects never need to be held
+# in memory at the same time. If no box axes are given, the first and second moments
+# of the vertices are accumulated instead, from which the principal axes are evaluated.
+# The extents along the principal axes then need a second pass over the vertices.
+# The reducer does not import bpy, so that it can also be used outside of Blender.
+class CBoxReducer:
+    def __init__(self, *, iMemoryBudget: int = c_iDefaultMemoryBudget):
+        # Scratch buffers larger than the memory budget are released after use
+        self._iMemoryBudget: int = max(iMemoryBudget, 0)
+        # Number of rows of the transformation scratch buffer, which uses at most half of the budget
+        self._iChunkRows: int = max(self._iMemoryBudget // (2 * 3 * 8), 1024)
+
+        # Flat vertex coordinate buffer, as needed by foreach_get()
+        self._aCoords: np.ndarray = np.empty(0, dtype=np.float64)
+        # Buffer for the transformed vertices
+        self._aChunk: np.ndarray = np.empty((0, 3), dtype=np.float64)
+
+        self.Reset(None)
+
+    # enddef
+
+    @property
+    def bHasAxes(self) -> bool:
+        return self._mAxes is not None
+
+    # enddef
+
+    @property
+    def iVexCount(self) -> int:
+        return self._iVexCnt
+
+    # enddef
+
+    ##########################################################################
+    def Reset(self, _mAxes: Optional[np.ndarray]):
+        """Start the reduction of a new box.
+
+        Parameters
+        ----------
+        _mAxes : Optional[np.ndarray]
+            The 3x3 matrix whose rows are the unit box axes in world space.
+            If None, the moments of the vertices are accumulated.
+        """
+        self._mAxes: Optional[np.ndarray] = None if _mAxes is None else np.array(_mAxes, dtype=np.float64)
+        self._iVexCnt: int = 0
+        self._aMin: np.ndarray = np.full(3, np.inf)
+        self._aMax: np.ndarray = np.full(3, -np.inf)
+        self._aSum: np.ndarray = np.zeros(3)
+        self._aSqSum: np.ndarray = np.zeros((3, 3))
+
+    # enddef
+
+    ##########################################################################
+    def GetCoordBuffer(self, _iVexCnt: int) -> np.ndarray:
+        """Get a flat scratch buffer for the coordinates of the given number of vertices.
+        The buffer is only valid until the next call.
+        """
+        iSize: int = 3 * _iVexCnt
+        if self._aCoords.size < iSize:
+            self._aCoords = np.empty(iSize, dtype=np.float64)
+        # endif
+        return self._aCoords[:iSize]
+
+    # enddef
+
+    ##########################################################################
+    def Release(self):
+        """Release the scratch buffers, if they exceed the memory budget."""
+        if self._aCoords.nbytes > self._iMemoryBudget:
+            self._aCoords = np.empty(0, dtype=np.float64)
+        # endif
+
+    # enddef
+
+    ##########################################################################
+    def AddVertices(self, _aVex: np.ndarray, _mWorld):
+        """Fold vertices into the box.
+
+        Parameters
+        ----------
+        _aVex : np.ndarray
+            The vertices in local object space, as array of shape (n, 3).
+        _mWorld : array_like
+            The 4x4 world matrix of the object.
+        """
+        iVexCnt: int = _aVex.shape[0]
+        if iVexCnt == 0:
+            return
+        # endif
+
+        mWorld = np.asarray(_mWorld, dtype=np.float64)
+        mRotT = mWorld[0:3, 0:3].transpose()
+        aTrans = mWorld[0:3, 3]
+
+        if self._mAxes is not None:
+            # Transform directly from local space into the box frame
+            mRotT = mRotT @ self._mAxes.transpose()
+            aTrans = aTrans @ self._mAxes.transpose()
+        # endif
+
+        if self._aChunk.shape[0] < min(iVexCnt, self._iChunkRows):
+            self._aChunk = np.empty((min(iVexCnt, self._iChunkRows), 3), dtype=np.float64)
+        # endif
+
+        for iStart in range(0, iVexCnt, self._iChunkRows):
+            aVex = _aVex[iStart : iStart + self._iChunkRows]
+            aOut = self._aChunk[0 : aVex.shape[0]]
+            np.matmul(aVex, mRotT, out=aOut)
+            aOut += aTrans
+
+            if self._mAxes is not None:
+                np.minimum(self._aMin, aOut.min(axis=0), out=self._aMin)
+                np.maximum(self._aMax, aOut.max(axis=0), out=self._aMax)
+            else:
+                self._aSum += aOut.sum(axis=0)
+                self._aSqSum += aOut.transpose() @ aOut
+            # endif
+        # endfor
+
+        self._iVexCnt += iVexCnt
+
+    # enddef
+
+    ##########################################################################
+    def AddInstancedVertices(self, _aVex: np.ndarray, _aMatrices: np.ndarray):
+        """Fold the vertices of many instances of the same vertex set into the box.
+
+        Parameters
+        ----------
+        _aVex : np.ndarray
+            The vertices in local space of the instanced geometry, as array of shape (n, 3).
+        _aMatrices : np.ndarray
+            The 4x4 world matrices of the instances, as array of shape (m, 4, 4).
+        """
+        iVexCnt: int = _aVex.shape[0]
+        iInstCnt: int = _aMatrices.shape[0]
+        if iVexCnt == 0 or iInstCnt == 0:
+            return
+        # endif
+
+        aVex = np.asarray(_aVex, dtype=np.float64)
+        # Transform as many instances at once, as fit into the transformation scratch buffer
+        iInstPerChunk: int = max(self._iChunkRows // iVexCnt, 1)
+
+        for iStart in range(0, iInstCnt, iInstPerChunk):
+            aMatrices = np.asarray(_aMatrices[iStart : iStart + iInstPerChunk], dtype=np.float64)
+            mRotT = aMatrices[:, 0:3, 0:3].transpose(0, 2, 1)
+            aTrans = aMatrices[:, np.newaxis, 0:3, 3]
+
+            if self._mAxes is not None:
+                # Transform directly from local space into the box frame
+                mRotT = mRotT @ self._mAxes.transpose()
+                aTrans = aTrans @ self._mAxes.transpose()
+            # endif
+
+            aOut = (np.matmul(aVex, mRotT) + aTrans).reshape(-1, 3)
+
+            if self._mAxes is not None:
+                np.minimum(self._aMin, aOut.min(axis=0), out=self._aMin)
+                np.maximum(self._aMax, aOut.max(axis=0), out=self._aMax)
+            else:
+                self._aSum += aOut.sum(axis=0)
+                self._aSqSum += aOut.transpose() @ aOut
+            # endif
+        # endfor
+
+        self._iVexCnt += iVexCnt * iInstCnt
+
+    # enddef
+
+    ##########################################################################
+    def GetPrincipalAxes(self) -> np.ndarray:
+        """Get the principal axes of the accumulated vertices as rows of a 3x3 matrix."""
+        if self._iVexCnt == 0:
+            raise RuntimeError("No vertices have been added to the box")
+        # endif
+
+        aMean = self._aSum / self._iVexCnt
+        aCov = self._aSqSum - self._iVexCnt * np.outer(aMean, aMean)
+        mU, mS, mVT = np.linalg.svd(aCov)
+
+        return mVT
+
+    # enddef
+
+    ##########################################################################
+    def GetBox(self) -> Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Get the box that contains all added vertices.
+
+        Returns
+        -------
+        Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]
+            The tuple (center, size, axes), where the rows of axes are the box axes.
+            None, if no vertices have been added.
+        """
+        if self._iVexCnt == 0:
+            return None
+        # endif
+
+        if self._mAxes is None:
+            raise RuntimeError("The box extents are only available for given box axes")
+        # endif
+
+        aSize = self._aMax - self._aMin
+        aCtr = (self._aMin + aSize / 2.0) @ self._mAxes
+
+        return aCtr, aSize, self._mAxes
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \geometry\cls_disk_cache.py
+# Created Date: Saturday, October 17th 2026, 11:31:44 pm
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import os
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+###################################################################################
+# Content addressed cache of geometry summaries on disk.
+# Each entry is a set of named numpy arrays, which is stored in a single file.
+# The file name is derived from a hash of the entry kind and key, where the key is
+# typically a hash of the mesh data the summary was evaluated from.
+# Entries are written to a temporary file first, which is then renamed atomically,
+# so that many processes can share a single cache directory.
+# The cache does not import bpy, so that it can also be used outside of Blender.
+class CDiskCache:
+    # Version of the stored summaries. Increase this, whenever the summary evaluation changes.
+    iVersion: int = 1
+
+    def __init__(self, _sPath: str):
+        self._pathMain: Path = Path(_sPath)
+
+    # enddef
+
+    @property
+    def pathMain(self) -> Path:
+        return self._pathMain
+
+    # enddef
+
+    ##########################################################################
+    @staticmethod
+    def GetHash(*_lArrays: np.ndarray) -> str:
+        """Get a hash of the contents of the given arrays."""
+        xHash = hashlib.blake2b(digest_size=20)
+        for aX in _lArrays:
+            aX = np.ascontiguousarray(aX)
+            xHash.update(str((aX.dtype.str, aX.shape)).encode("utf-8"))
+            xHash.update(aX.tobytes())
+        # endfor
+        return xHash.hexdigest()
+
+    # enddef
+
+    ##########################################################################
+    def _GetFilePath(self, _sKind: str, _sKey: str) -> Path:
+        sHash = hashlib.blake2b("{};{};{}".format(self.iVersion, _sKind, _sKey).encode("utf-8"), digest_size=20)
+        sName = sHash.hexdigest()
+        # Distribute the files over sub-folders, to keep the folders small
+        return self._pathMain / _sKind / sName[0:2] / "{}.npz".format(sName)
+
+    # enddef
+
+    ##########################################################################
+    def Load(self, _sKind: str, _sKey: str) -> Optional[dict[str, np.ndarray]]:
+        """Load a cache entry.
+
+        Returns
+        -------
+        Optional[dict[str, np.ndarray]]
+            The arrays of the entry by name, or None if the entry is not available or cannot be read.
+        """
+        pathFile = self._GetFilePath(_sKind, _sKey)
+        if not pathFile.exists():
+            return None
+        # endif
+
+        try:
+            with np.load(pathFile, allow_pickle=False) as xData:
+                return {sName: xData[sName] for sName in xData.files}
+            # endwith
+        except Exception:
+            # A damaged entry is regarded as missing and is overwritten by the next store
+            return None
+        # endtry
+
+    # enddef
+
+    ##########################################################################
+    def Store(self, _sKind: str, _sKey: str, _dicArrays: dict[str, np.ndarray]):
+        """Store a cache entry atomically. Errors while writing are ignored,
+        as a missing cache entry only means that the summary is evaluated again.
+        """
+        pathFile = self._GetFilePath(_sKind, _sKey)
+        sTempFile: str = None
+        try:
+            pathFile.parent.mkdir(parents=True, exist_ok=True)
+            iFd, sTempFile = tempfile.mkstemp(dir=pathFile.parent, prefix=".tmp-", suffix=".npz")
+            with os.fdopen(iFd, "wb") as xFile:
+                np.savez(xFile, **_dicArrays)
+            # endwith
+            os.replace(sTempFile, pathFile)
+            sTempFile = None
+        except Exception as xEx:
+            print("WARNING: Cannot write geometry cache entry '{}':\n{}".format(pathFile.as_posix(), str(xEx)))
+        finally:
+            if sTempFile is not None and os.path.exists(sTempFile):
+                os.remove(sTempFile)
+            # endif
+        # endtry
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \geometry\cls_frame_geometry.py
+# Created Date: Saturday, October 17th 2026, 11:02:17 pm
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+# Default memory budget of the cached geometry in bytes
+c_iDefaultMemoryBudget: int = 256 * 1024 * 1024
+
+
+###################################################################################
+# Evaluated geometry of a single object.
+# All arrays are read-only, as they are shared by all label evaluation stages.
+class CObjectGeometry:
+    def __init__(
+        self,
+        *,
+        aLocalVex: np.ndarray,
+        mWorld: np.ndarray,
+        aEdges: Optional[np.ndarray] = None,
+        aLoopVex: Optional[np.ndarray] = None,
+        aLoopColors: Optional[np.ndarray] = None,
+    ):
+        self._aLocalVex: np.ndarray = _ReadOnly(aLocalVex)
+        self._mWorld: np.ndarray = _ReadOnly(mWorld)
+        self._aEdges: Optional[np.ndarray] = _ReadOnly(aEdges)
+        self._aLoopVex: Optional[np.ndarray] = _ReadOnly(aLoopVex)
+        self._aLoopColors: Optional[np.ndarray] = _ReadOnly(aLoopColors)
+        # World space vertices, which are evaluated on demand
+        self._aVex: Optional[np.ndarray] = None
+
+    # enddef
+
+    @property
+    def iVexCount(self) -> int:
+        return self._aLocalVex.shape[0]
+
+    # enddef
+
+    @property
+    def aLocalVex(self) -> np.ndarray:
+        """The vertices in local object coordinates, as array of shape (n, 3)."""
+        return self._aLocalVex
+
+    # enddef
+
+    @property
+    def aVex(self) -> np.ndarray:
+        """The vertices in world coordinates, as array of shape (n, 3).
+        They are only evaluated on first access, as most stages transform the local vertices themselves.
+        """
+        if self._aVex is None:
+            aVex = self._aLocalVex @ self._mWorld[0:3, 0:3].transpose().astype(self._aLocalVex.dtype)
+            aVex += self._mWorld[0:3, 3].astype(self._aLocalVex.dtype)
+            self._aVex = _ReadOnly(aVex)
+        # endif
+        return self._aVex
+
+    # enddef
+
+    @property
+    def mWorld(self) -> np.ndarray:
+        """The 4x4 world matrix of the evaluated object."""
+        return self._mWorld
+
+    # enddef
+
+    @property
+    def aEdges(self) -> Optional[np.ndarray]:
+        """The vertex indices of the edges, as array of shape (m, 2), if available."""
+        return self._aEdges
+
+    # enddef
+
+    @property
+    def aLoopVex(self) -> Optional[np.ndarray]:
+        """The vertex index per loop, if available."""
+        return self._aLoopVex
+
+    # enddef
+
+    @property
+    def aLoopColors(self) -> Optional[np.ndarray]:
+        """The RGBA vertex color per loop, as array of shape (l, 4), if available."""
+        return self._aLoopColors
+
+    # enddef
+
+    @property
+    def iByteCount(self) -> int:
+        """The number of bytes used by the arrays of the geometry,
+        including the world space vertices, if they have been evaluated.
+        """
+        iByteCnt = self._aLocalVex.nbytes
+        for aX in (self._aVex, self._aEdges, self._aLoopVex, self._aLoopColors):
+            if aX is not None:
+                iByteCnt += aX.nbytes
+            # endif
+        # endfor
+        return iByteCnt
+
+    # enddef
+
+
+# endclass
+
+
+###################################################################################
+def _ReadOnly(_aX: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    if _aX is not None:
+        _aX.flags.writeable = False
+    # endif
+    return _aX
+
+
+# enddef
+
+
+###################################################################################
+# Cache of the evaluated geometry of objects for a single frame.
+# Each object is evaluated once with to_mesh() and its' data is read with foreach_get(),
+# so that all label evaluation stages of a frame can share the same arrays.
+# The evaluated mesh is released directly after its' data has been read.
+# If the cached geometry exceeds the memory budget, the least recently used objects are dropped.
+# The cache does not import bpy, so that it can also be used outside of Blender.
+class CFrameGeometry:
+    def __init__(
+        self,
+        *,
+        iFrame: int,
+        bDoublePrecision: bool = False,
+        iMemoryBudget: int = c_iDefaultMemoryBudget,
+    ):
+        self._iFrame: int = iFrame
+        self._bDoublePrecision: bool = bDoublePrecision
+        self._iMemoryBudget: int = max(iMemoryBudget, 0)
+
+        # Evaluated geometry per original object name
+        self._dicGeometry: OrderedDict[str, CObjectGeometry] = OrderedDict()
+        # The bytes counted per object, as the world space vertices are evaluated after the geometry is cached
+        self._dicByteCnt: dict[str, int] = {}
+        self._iByteCnt: int = 0
+        # Hull vertices and instance world matrices of the geometry nodes instances per instancer name.
+        # This is None, until the instances have been gathered.
+        self._dicInstances: Optional[dict[str, list[tuple[np.ndarray, np.ndarray]]]] = None
+
+    # enddef
+
+    @property
+    def iFrame(self) -> int:
+        return self._iFrame
+
+    # enddef
+
+    @property
+    def bDoublePrecision(self) -> bool:
+        return self._bDoublePrecision
+
+    # enddef
+
+    @property
+    def bHasInstances(self) -> bool:
+        return self._dicInstances is not None
+
+    # enddef
+
+    ##########################################################################
+    def SetInstances(self, _dicInstances: dict[str, list[tuple[np.ndarray, np.ndarray]]]):
+        """Set the geometry nodes instances of the frame, as returned by instances.GatherInstances()."""
+        self._dicInstances = _dicInstances
+
+    # enddef
+
+    ##########################################################################
+    def GetInstances(self, _sName: str) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Get the tuples of hull vertices and instance world matrices of the instances created by an object."""
+        if self._dicInstances is None:
+            return []
+        # endif
+        return self._dicInstances.get(_sName, [])
+
+    # enddef
+
+    ##########################################################################
+    def Get(self, _objOrigX, _xDepsGraph, *, sVexColName: Optional[str] = None) -> CObjectGeometry:
+        """Get the evaluated geometry of an object.
+
+        Parameters
+        ----------
+        _objOrigX : bpy.types.Object
+            The original mesh object.
+        _xDepsGraph : bpy.types.Depsgraph
+            The dependency graph to evaluate the object with.
+        sVexColName : Optional[str], optional
+            The name of a vertex color layer. If given, the edges, the loop vertex indices
+            and the loop colors of this layer are also read, if the layer exists.
+
+        Returns
+        -------
+        CObjectGeometry
+            The evaluated geometry.
+        """
+        sName: str = _objOrigX.name_full
+        xGeo = self._dicGeometry.get(sName)
+        if xGeo is not None and (sVexColName is None or xGeo.aLoopVex is not None):
+            self._dicGeometry.move_to_end(sName)
+            self._UpdateByteCount(sName)
+            return xGeo
+        # endif
+
+        xGeo = self._EvalGeometry(_objOrigX, _xDepsGraph, sVexColName)
+        self._Remove(sName)
+        self._dicGeometry[sName] = xGeo
+        self._dicByteCnt[sName] = 0
+        self._UpdateByteCount(sName)
+        return xGeo
+
+    # enddef
+
+    ##########################################################################
+    def _EvalGeometry(self, _objOrigX, _xDepsGraph, _sVexColName: Optional[str]) -> CObjectGeometry:
+        objX = _objOrigX.evaluated_get(_xDepsGraph)
+        mWorld = np.array(objX.matrix_world, dtype=np.float64)
+        dtVex = np.float64 if self._bDoublePrecision else np.float32
+
+        aEdges = aLoopVex = aLoopColors = None
+        meshX = objX.to_mesh()
+        try:
+            if meshX is None:
+                aLocalVex = np.empty((0, 3), dtype=dtVex)
+            else:
+                iVexCnt = len(meshX.vertices)
+                aLocalVex = np.empty(iVexCnt * 3, dtype=dtVex)
+                meshX.vertices.foreach_get("co", aLocalVex)
+                aLocalVex.shape = (iVexCnt, 3)
+
+                xVexCol = meshX.vertex_colors.get(_sVexColName) if _sVexColName is not None else None
+                if xVexCol is not None:
+                    iEdgeCnt = len(meshX.edges)
+                    aEdges = np.empty(iEdgeCnt * 2, dtype=np.int32)
+                    meshX.edges.foreach_get("vertices", aEdges)
+                    aEdges.shape = (iEdgeCnt, 2)
+
+                    iLoopCnt = len(meshX.loops)
+                    aLoopVex = np.empty(iLoopCnt, dtype=np.int32)
+                    meshX.loops.foreach_get("vertex_index", aLoopVex)
+
+                    aLoopColors = np.empty(iLoopCnt * 4, dtype=np.float32)
+                    xVexCol.data.foreach_get("color", aLoopColors)
+                    aLoopColors.shape = (iLoopCnt, 4)
+                # endif
+            # endif
+        finally:
+            objX.to_mesh_clear()
+        # endtry
+
+        return CObjectGeometry(
+            aLocalVex=aLocalVex, mWorld=mWorld, aEdges=aEdges, aLoopVex=aLoopVex, aLoopColors=aLoopColors
+        )
+
+    # enddef
+
+    ##########################################################################
+    def _UpdateByteCount(self, _sName: str):
+        # Count the current bytes of the most recently used geometry
+        iByteCnt: int = self._dicGeometry[_sName].iByteCount
+        self._iByteCnt += iByteCnt - self._dicByteCnt[_sName]
+        self._dicByteCnt[_sName] = iByteCnt
+
+        # Drop the least recently used geometry, but always keep the current one
+        while self._iByteCnt > self._iMemoryBudget and len(self._dicGeometry) > 1:
+            self._Remove(next(iter(self._dicGeometry)))
+        # endwhile
+
+    # enddef
+
+    ##########################################################################
+    def _Remove(self, _sName: str):
+        xGeo = self._dicGeometry.pop(_sName, None)
+        if xGeo is not None:
+            self._iByteCnt -= self._dicByteCnt.pop(_sName)
+        # endif
+
+    # enddef
+
+    ##########################################################################
+    def Clear(self):
+        self._dicGeometry.clear()
+        self._dicByteCnt.clear()
+        self._iByteCnt = 0
+        self._dicInstances = None
+
+    # enddef
+
+
+# endclass
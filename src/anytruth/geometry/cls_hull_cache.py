@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \geometry\cls_hull_cache.py
+# Created Date: Saturday, October 17th 2026, 10:52:09 pm
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+# Default memory budget of the cached hull vertices in bytes
+c_iDefaultMemoryBudget: int = 64 * 1024 * 1024
+
+
+###################################################################################
+# Cache of the convex hull vertices of meshes.
+# The extents of a mesh under any affine transformation are attained at the vertices
+# of its' convex hull. Therefore, boxes can be evaluated from the hull vertices alone.
+# Each entry is keyed by the mesh name and stores a fingerprint of the mesh vertices,
+# so that the hull is evaluated again, if the mesh geometry changes.
+# Meshes that are only known by their geometry, like geometry nodes instances, add new entries
+# whenever their geometry changes. Therefore, if the cached hulls exceed the memory budget,
+# the least recently used hulls are dropped.
+# The cache does not import bpy, so that it can also be used outside of Blender.
+class CHullCache:
+    def __init__(self, *, iMemoryBudget: int = c_iDefaultMemoryBudget):
+        self._iMemoryBudget: int = max(iMemoryBudget, 0)
+
+        # Fingerprint and hull vertices per mesh name
+        self._dicHulls: OrderedDict[str, tuple[str, np.ndarray]] = OrderedDict()
+        self._iByteCnt: int = 0
+
+    # enddef
+
+    ##########################################################################
+    @staticmethod
+    def GetFingerprint(_aVex: np.ndarray) -> str:
+        """Get the fingerprint of a vertex coordinate array.
+        This consists of the vertex count and a checksum of the coordinates.
+        """
+        aVex = np.ascontiguousarray(_aVex)
+        sChecksum = hashlib.blake2b(aVex.tobytes(), digest_size=16).hexdigest()
+        return "{}:{}".format(aVex.size // 3, sChecksum)
+
+    # enddef
+
+    ##########################################################################
+    def Get(self, _sMeshId: str, _sFingerprint: str) -> Optional[np.ndarray]:
+        """Get the hull vertices of a mesh, or None if they are not available for the given fingerprint."""
+        tHull = self._dicHulls.get(_sMeshId)
+        if tHull is None or tHull[0] != _sFingerprint:
+            return None
+        # endif
+        self._dicHulls.move_to_end(_sMeshId)
+        return tHull[1]
+
+    # enddef
+
+    ##########################################################################
+    def Set(self, _sMeshId: str, _sFingerprint: str, _aHullVex: np.ndarray):
+        aHullVex = np.array(_aHullVex, dtype=np.float64).reshape(-1, 3)
+        # Cached hull vertices are shared, so they must not be changed
+        aHullVex.flags.writeable = False
+        self.Remove(_sMeshId)
+        self._dicHulls[_sMeshId] = (_sFingerprint, aHullVex)
+        self._iByteCnt += aHullVex.nbytes
+
+        # Drop the least recently used hulls, but always keep the current one
+        while self._iByteCnt > self._iMemoryBudget and len(self._dicHulls) > 1:
+            self.Remove(next(iter(self._dicHulls)))
+        # endwhile
+
+    # enddef
+
+    ##########################################################################
+    def Remove(self, _sMeshId: str):
+        tHull = self._dicHulls.pop(_sMeshId, None)
+        if tHull is not None:
+            self._iByteCnt -= tHull[1].nbytes
+        # endif
+
+    # enddef
+
+    ##########################################################################
+    def Clear(self):
+        self._dicHulls.clear()
+        self._iByteCnt = 0
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \geometry\cls_spatial_hash.py
+# Created Date: Sunday, October 18th 2026, 3:08:19 am
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import numpy as np
+
+# Offsets of a grid cell to itself and its' 26 neighbors
+c_aNeighborOffsets: np.ndarray = np.array(
+    [[iX, iY, iZ] for iX in (-1, 0, 1) for iY in (-1, 0, 1) for iZ in (-1, 0, 1)], dtype=np.int64
+)
+
+
+###################################################################################
+# Spatial hash grid of a set of points.
+# The points are sorted by the hash of the grid cell they lie in, so that the points
+# of a cell are found by a binary search. Cells with the same hash are not separated,
+# which only adds candidates that are removed by the distance test.
+# Points with a distance below the cell size lie in the same or in neighboring cells.
+# The grid does not import bpy, so that it can also be used outside of Blender.
+class CSpatialHash:
+    def __init__(self, _aPoints: np.ndarray, _fCellSize: float):
+        self._aPoints: np.ndarray = np.asarray(_aPoints, dtype=np.float64).reshape(-1, 3)
+        self._fCellSize: float = _fCellSize
+
+        aKeys = self._GetKeys(self._GetCells(self._aPoints))
+        self._aOrder: np.ndarray = np.argsort(aKeys, kind="stable")
+        self._aSortedKeys: np.ndarray = aKeys[self._aOrder]
+
+    # enddef
+
+    ##########################################################################
+    @property
+    def iPointCount(self) -> int:
+        return self._aPoints.shape[0]
+
+    # enddef
+
+    ##########################################################################
+    def _GetCells(self, _aPoints: np.ndarray) -> np.ndarray:
+        return np.floor(_aPoints / self._fCellSize).astype(np.int64)
+
+    # enddef
+
+    ##########################################################################
+    @staticmethod
+    def _GetKeys(_aCells: np.ndarray) -> np.ndarray:
+        # Hash of the cell coordinates. Integer overflow wraps around, which is intended.
+        with np.errstate(over="ignore"):
+            return (_aCells[..., 0] * 73856093) ^ (_aCells[..., 1] * 19349663) ^ (_aCells[..., 2] * 83492791)
+        # endwith
+
+    # enddef
+
+    ##########################################################################
+    def _GetCandidatePairs(self, _aCells: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Get the pairs of query indices and point indices, for all points in the cells
+        # that neighbor the query cells.
+        aNeighborKeys = self._GetKeys(_aCells[:, np.newaxis, :] + c_aNeighborOffsets[np.newaxis, :, :]).reshape(-1)
+        aStart = np.searchsorted(self._aSortedKeys, aNeighborKeys, side="left")
+        aCount = np.searchsorted(self._aSortedKeys, aNeighborKeys, side="right") - aStart
+
+        # Expand the ranges of sorted points per neighbor cell
+        iPairCnt = int(aCount.sum())
+        aRangeStart = np.repeat(aStart - (np.cumsum(aCount) - aCount), aCount)
+        aQueryIdx = np.repeat(np.arange(aNeighborKeys.shape[0]) // c_aNeighborOffsets.shape[0], aCount)
+        aPointIdx = self._aOrder[aRangeStart + np.arange(iPairCnt)]
+
+        return aQueryIdx, aPointIdx
+
+    # enddef
+
+    ##########################################################################
+    def Query(self, _aPoint: np.ndarray, _fMaxDist: float) -> np.ndarray:
+        """Get the indices of all points closer to the given point than the maximal distance.
+
+        Parameters
+        ----------
+        _aPoint : np.ndarray
+            The query point.
+        _fMaxDist : float
+            The maximal distance, which must not be larger than the cell size.
+
+        Returns
+        -------
+        np.ndarray
+            The sorted point indices.
+        """
+        aPoint = np.asarray(_aPoint, dtype=np.float64).reshape(1, 3)
+        _, aPointIdx = self._GetCandidatePairs(self._GetCells(aPoint))
+        aPointIdx = np.unique(aPointIdx)
+        return aPointIdx[np.linalg.norm(self._aPoints[aPointIdx] - aPoint, axis=1) < _fMaxDist]
+
+    # enddef
+
+    ##########################################################################
+    def GetClosePairs(self, _fMaxDist: float) -> np.ndarray:
+        """Get all pairs of points that are closer to each other than the maximal distance.
+
+        Parameters
+        ----------
+        _fMaxDist : float
+            The maximal distance, which must not be larger than the cell size.
+
+        Returns
+        -------
+        np.ndarray
+            The point index pairs (i, j) with i < j, of shape (n, 2).
+        """
+        aIdx0, aIdx1 = self._GetCandidatePairs(self._GetCells(self._aPoints))
+        aIsPair = aIdx0 < aIdx1
+        aIdx0 = aIdx0[aIsPair]
+        aIdx1 = aIdx1[aIsPair]
+        aIsPair = np.linalg.norm(self._aPoints[aIdx0] - self._aPoints[aIdx1], axis=1) < _fMaxDist
+
+        # Cells with the same hash may give the same pair more than once
+        return np.unique(np.stack((aIdx0[aIsPair], aIdx1[aIsPair]), axis=1), axis=0)
+
+    # enddef
+
+    ##########################################################################
+    def Weld(self, _fMaxDist: float) -> np.ndarray:
+        """Weld the points that are closer to each other than the maximal distance.
+        The points are processed in the order of their indices. A point is welded to the point
+        with the smallest index, which is closer than the maximal distance and which is not welded itself.
+        Points are not welded along chains, so that points are only welded to a point within the distance.
+
+        Parameters
+        ----------
+        _fMaxDist : float
+            The maximal distance, which must not be larger than the cell size.
+
+        Returns
+        -------
+        np.ndarray
+            The index of the welded point per point, which is the point itself if it is not welded.
+        """
+        aPairs = self.GetClosePairs(_fMaxDist)
+        aRefIdx = np.arange(self.iPointCount)
+
+        # Process the pairs in the order of their larger index, so that the welding
+        # of all points with smaller indices is final, when a point is welded.
+        aPairs = aPairs[np.lexsort((aPairs[:, 0], aPairs[:, 1]))]
+        lRefIdx = aRefIdx.tolist()
+        for iIdx0, iIdx1 in aPairs.tolist():
+            if lRefIdx[iIdx1] == iIdx1 and lRefIdx[iIdx0] == iIdx0:
+                lRefIdx[iIdx1] = iIdx0
+            # endif
+        # endfor
+
+        return np.array(lRefIdx, dtype=np.int64)
+
+    # enddef
+
+
+# endclass
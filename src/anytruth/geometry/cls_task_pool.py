@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \geometry\cls_task_pool.py
+# Created Date: Saturday, October 17th 2026, 11:31:45 pm
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional
+
+
+###################################################################################
+# Pool of worker threads for the pure NumPy kernels of the label evaluation.
+# NumPy releases the GIL for its' array operations, so that the kernels of
+# independent instances can run in parallel. The kernels must not access any
+# Blender data, as the Blender API may only be used from the main thread.
+# All Blender data has to be gathered before and written back after the kernels,
+# on the main thread.
+# With a single worker, all kernels are executed directly on the calling thread.
+# The pool does not import bpy, so that it can also be used outside of Blender.
+class CTaskPool:
+    def __init__(self, *, iWorkers: int = 0):
+        """Create a task pool.
+
+        Parameters
+        ----------
+        iWorkers : int, optional
+            The number of worker threads. If zero, one worker per CPU core is used.
+        """
+        self._iWorkers: int = iWorkers if iWorkers > 0 else (os.cpu_count() or 1)
+        self._xExecutor: Optional[ThreadPoolExecutor] = None
+
+    # enddef
+
+    @property
+    def iWorkers(self) -> int:
+        return self._iWorkers
+
+    # enddef
+
+    ##########################################################################
+    def Map(self, _funcKernel: Callable[..., Any], _iterArgs: Iterable[tuple]) -> list:
+        """Execute a kernel for each argument tuple.
+
+        Parameters
+        ----------
+        _funcKernel : Callable[..., Any]
+            The kernel function, which is called with the elements of each argument tuple.
+        _iterArgs : Iterable[tuple]
+            The argument tuples.
+
+        Returns
+        -------
+        list
+            The kernel results in the order of the argument tuples.
+            An exception raised by a kernel is raised again by this function.
+        """
+        lArgs = list(_iterArgs)
+        if self._iWorkers <= 1 or len(lArgs) <= 1:
+            return [_funcKernel(*tArgs) for tArgs in lArgs]
+        # endif
+
+        if self._xExecutor is None:
+            self._xExecutor = ThreadPoolExecutor(max_workers=self._iWorkers, thread_name_prefix="AnyTruth")
+        # endif
+
+        lFutures = [self._xExecutor.submit(_funcKernel, *tArgs) for tArgs in lArgs]
+        return [xFuture.result() for xFuture in lFutures]
+
+    # enddef
+
+    ##########################################################################
+    def Shutdown(self):
+        if self._xExecutor is not None:
+            self._xExecutor.shutdown(wait=True)
+            self._xExecutor = None
+        # endif
+
+    # enddef
+
+
+# endclass
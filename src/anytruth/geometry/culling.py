@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \geometry\culling.py
+# Created Date: Sunday, October 18th 2026, 1:52:06 am
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+from typing import Optional
+
+import numpy as np
+
+# Object types, whose bounding boxes do not enclose any rendered geometry
+c_setNoBoundsTypes: set[str] = {"EMPTY", "ARMATURE", "CAMERA", "LIGHT", "LIGHT_PROBE", "SPEAKER"}
+
+# Maximal number of instances whose bounds are projected at once
+c_iMaxCullInstCount: int = 1 << 17
+
+# Selection of the minimum or maximum per axis for the 8 corners of a box
+c_aCornerSel: np.ndarray = np.array([[(i >> j) & 1 for j in range(3)] for i in range(8)], dtype=bool)
+
+
+#########################################################################
+def GetWorldBounds(_lObjects: list, _xDepsGraph) -> Optional[np.ndarray]:
+    """Get the world axis aligned box of the evaluated bounding boxes of the rendered objects.
+
+    Parameters
+    ----------
+    _lObjects : list[bpy.types.Object]
+        The original objects.
+    _xDepsGraph : bpy.types.Depsgraph
+        The evaluated dependency graph.
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        The array of shape (2, 3) with the minimal and maximal world coordinates,
+        or None if none of the objects has bounds.
+    """
+    lCorners: list[np.ndarray] = []
+    lWorld: list[np.ndarray] = []
+    for objOrigX in _lObjects:
+        if objOrigX is None or objOrigX.hide_render is True or objOrigX.type in c_setNoBoundsTypes:
+            continue
+        # endif
+
+        objX = objOrigX.evaluated_get(_xDepsGraph)
+        lCorners.append(np.array(objX.bound_box))
+        lWorld.append(np.array(objX.matrix_world))
+    # endfor
+
+    if len(lCorners) == 0:
+        return None
+    # endif
+
+    # Transform the corners of all objects at once
+    aWorld = np.stack(lWorld)
+    aVex = np.einsum("nij,nkj->nki", aWorld[:, 0:3, 0:3], np.stack(lCorners)) + aWorld[:, np.newaxis, 0:3, 3]
+    aVex = aVex.reshape(-1, 3)
+
+    return np.stack((aVex.min(axis=0), aVex.max(axis=0)))
+
+
+# enddef
+
+
+#########################################################################
+def EvalViewCulling(
+    _viewCam,
+    _aBounds: np.ndarray,
+    _aCamPos: np.ndarray,
+    *,
+    fMaxDistance: float,
+    tImageSize: tuple[float, float],
+    bIsPinhole: bool,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Test the world bounds of instances against the camera view and the maximal camera distance.
+    The bounds are conservative, so that an instance is only culled, if it is certainly not visible.
+
+    Parameters
+    ----------
+    _viewCam : anycam view
+        The camera view, which must provide the function ProjectToImage(),
+        or None if only the distance is tested.
+    _aBounds : np.ndarray
+        The minimal and maximal world coordinates per instance, of shape (n, 2, 3).
+    _aCamPos : np.ndarray
+        The world position of the camera.
+    fMaxDistance : float
+        The maximal distance of the bounds from the camera. If zero, the distance is not tested.
+    tImageSize : tuple[float, float]
+        The width and height of the image in pixels.
+    bIsPinhole : bool
+        True, if the camera is a pinhole camera. Only then, the projected bounds are contained in the
+        box of the projected bound corners. For other cameras, only instances behind the camera are culled.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The culled flags per instance, and the fraction of the box of the projected
+        bound corners per instance, which lies inside the image.
+        The fraction is zero, if the bounds are partially behind the camera.
+    """
+    iInstCnt: int = _aBounds.shape[0]
+    aMin = _aBounds[:, 0]
+    aMax = _aBounds[:, 1]
+
+    aIsCulled = np.zeros(iInstCnt, dtype=bool)
+    aInImageRatio = np.ones(iInstCnt, dtype=np.float64)
+
+    if fMaxDistance > 0.0:
+        # Distance of the camera to the nearest point of the bounds
+        aNearest = np.clip(_aCamPos[np.newaxis, :], aMin, aMax)
+        aIsCulled |= np.linalg.norm(aNearest - _aCamPos[np.newaxis, :], axis=1) > fMaxDistance
+    # endif
+
+    if _viewCam is None:
+        return aIsCulled, aInImageRatio
+    # endif
+
+    aImageSize = np.array(tImageSize, dtype=np.float64)
+    for iStart in range(0, iInstCnt, c_iMaxCullInstCount):
+        iEnd = min(iStart + c_iMaxCullInstCount, iInstCnt)
+        iCnt = iEnd - iStart
+
+        # Project the 8 corners of all bounds with a single call
+        aCorners = np.where(c_aCornerSel[np.newaxis], aMax[iStart:iEnd, np.newaxis], aMin[iStart:iEnd, np.newaxis])
+        xImgPnts, xInFront, _ = _viewCam.ProjectToImage(aCorners.reshape(-1, 3), _bDetailedFlags=True)
+        aImgPnts = np.asarray(xImgPnts, dtype=np.float64).reshape(iCnt, 8, -1)[:, :, 0:2]
+        aInFront = np.asarray(xInFront, dtype=bool).reshape(iCnt, 8)
+        aAllInFront = aInFront.all(axis=1)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # Box of the projected corners and its' part inside the image.
+            # The values are only used for bounds that are completely in front of the camera.
+            aImgMin = aImgPnts.min(axis=1)
+            aImgMax = aImgPnts.max(axis=1)
+            aClipMin = np.maximum(aImgMin, 0.0)
+            aClipMax = np.minimum(aImgMax, aImageSize)
+            aIsOutside = (aClipMax < aClipMin).any(axis=1)
+
+            fArea = np.prod(aImgMax - aImgMin, axis=1)
+            fClipArea = np.prod(np.maximum(aClipMax - aClipMin, 0.0), axis=1)
+            aRatio = np.where(fArea > 0.0, fClipArea / fArea, np.where(aIsOutside, 0.0, 1.0))
+        # endwith
+
+        aIsChunkCulled = ~aInFront.any(axis=1)
+        if bIsPinhole is True:
+            aIsChunkCulled |= aAllInFront & aIsOutside
+        # endif
+        aIsCulled[iStart:iEnd] |= aIsChunkCulled
+        aInImageRatio[iStart:iEnd] = np.where(aAllInFront & ~aIsChunkCulled, aRatio, 0.0)
+    # endfor
+
+    return aIsCulled, aInImageRatio
+
+
+# enddef
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \geometry\hull.py
+# Created Date: Saturday, October 17th 2026, 11:03:27 pm
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import bpy
+import bmesh
+import numpy as np
+
+from .cls_hull_cache import CHullCache
+from . import cache
+
+# Hull vertices of the meshes of all static objects
+c_xHullCache: CHullCache = CHullCache()
+
+
+#########################################################################
+def IsStaticMeshObject(_objX: bpy.types.Object) -> bool:
+    """Test whether the evaluated mesh of an object equals its' original mesh,
+    so that the object need not be evaluated to get its' geometry.
+    This is the case for mesh objects without modifiers and shape keys.
+    """
+    return _objX.type == "MESH" and len(_objX.modifiers) == 0 and _objX.data.shape_keys is None
+
+
+# enddef
+
+
+#########################################################################
+def GetBoundCorners(_aVex: np.ndarray) -> np.ndarray:
+    """Get the 8 corners of the axis aligned bounding box of the given vertices."""
+    aVex = np.reshape(_aVex, (-1, 3))
+    if aVex.shape[0] == 0:
+        return np.zeros((8, 3))
+    # endif
+
+    aMin = aVex.min(axis=0).astype(np.float64)
+    aMax = aVex.max(axis=0).astype(np.float64)
+    return np.array(
+        [
+            [aMax[0] if i & 1 else aMin[0], aMax[1] if i & 2 else aMin[1], aMax[2] if i & 4 else aMin[2]]
+            for i in range(8)
+        ]
+    )
+
+
+# enddef
+
+
+#########################################################################
+def EvalConvexHullVex(_meshX: bpy.types.Mesh) -> np.ndarray:
+    """Evaluate the vertices of the convex hull of a mesh.
+
+    Parameters
+    ----------
+    _meshX : bpy.types.Mesh
+        The mesh.
+
+    Returns
+    -------
+    np.ndarray
+        The hull vertices in local mesh coordinates, as array of shape (n, 3).
+        For degenerate meshes, for which no hull can be evaluated, all vertices are returned.
+    """
+    iVexCnt = len(_meshX.vertices)
+    aVex = np.empty(iVexCnt * 3, dtype=np.float32)
+    _meshX.vertices.foreach_get("co", aVex)
+    aVex.shape = (iVexCnt, 3)
+
+    # Small meshes are not worth evaluating a hull
+    if iVexCnt <= 8:
+        return aVex.astype(np.float64)
+    # endif
+
+    bmX = bmesh.new()
+    try:
+        bmX.from_mesh(_meshX)
+        dicResult = bmesh.ops.convex_hull(bmX, input=bmX.verts, use_existing_faces=False)
+        lHullVex = [tuple(x.co) for x in dicResult["geom"] if isinstance(x, bmesh.types.BMVert)]
+    except Exception:
+        lHullVex = []
+    finally:
+        bmX.free()
+    # endtry
+
+    # Planar or otherwise degenerate meshes have no volume hull
+    if len(lHullVex) < 4:
+        return aVex.astype(np.float64)
+    # endif
+
+    return np.array(lHullVex, dtype=np.float64)
+
+
+# enddef
+
+
+#########################################################################
+def GetStaticMeshFingerprint(_objX: bpy.types.Object) -> str:
+    """Get the fingerprint of the mesh vertices of a static mesh object, see IsStaticMeshObject()."""
+    meshX: bpy.types.Mesh = _objX.data
+    aVex = np.empty(len(meshX.vertices) * 3, dtype=np.float32)
+    meshX.vertices.foreach_get("co", aVex)
+    return CHullCache.GetFingerprint(aVex)
+
+
+# enddef
+
+
+#########################################################################
+def GetStaticHullVex(_objX: bpy.types.Object) -> np.ndarray:
+    """Get the convex hull vertices of the mesh of a static mesh object.
+    The hull is only evaluated again, if the mesh geometry has changed.
+
+    Parameters
+    ----------
+    _objX : bpy.types.Object
+        The static mesh object, see IsStaticMeshObject().
+
+    Returns
+    -------
+    np.ndarray
+        The read-only hull vertices in local mesh coordinates, as array of shape (n, 3).
+    """
+    meshX: bpy.types.Mesh = _objX.data
+    return _GetHullVex(meshX, meshX.name_full)
+
+
+# enddef
+
+
+#########################################################################
+def GetMeshHullVex(_meshX: bpy.types.Mesh) -> np.ndarray:
+    """Get the convex hull vertices of any mesh, for example of an evaluated mesh
+    instanced by geometry nodes. As the names of evaluated meshes need not be unique,
+    the hull is cached by the mesh geometry only.
+
+    Parameters
+    ----------
+    _meshX : bpy.types.Mesh
+        The mesh.
+
+    Returns
+    -------
+    np.ndarray
+        The read-only hull vertices in local mesh coordinates, as array of shape (n, 3).
+    """
+    return _GetHullVex(_meshX, None)
+
+
+# enddef
+
+
+#########################################################################
+def GetEvaluatedHullVex(_objX: bpy.types.Object) -> np.ndarray:
+    """Get the convex hull vertices of the evaluated mesh of an object.
+    The hull is cached per object, so that it is only evaluated again, if the evaluated mesh has changed.
+
+    Parameters
+    ----------
+    _objX : bpy.types.Object
+        The evaluated object.
+
+    Returns
+    -------
+    np.ndarray
+        The read-only hull vertices in local object coordinates, as array of shape (n, 3).
+    """
+    meshX = _objX.to_mesh()
+    try:
+        if meshX is None:
+            return np.empty((0, 3))
+        # endif
+        return _GetHullVex(meshX, "Eval;" + _objX.original.name_full)
+    finally:
+        _objX.to_mesh_clear()
+    # endtry
+
+
+# enddef
+
+
+#########################################################################
+def _GetHullVex(_meshX: bpy.types.Mesh, _sMeshId: str) -> np.ndarray:
+    iVexCnt = len(_meshX.vertices)
+    aVex = np.empty(iVexCnt * 3, dtype=np.float32)
+    _meshX.vertices.foreach_get("co", aVex)
+
+    sFingerprint = CHullCache.GetFingerprint(aVex)
+    sMeshId: str = _sMeshId if _sMeshId is not None else "#" + sFingerprint
+    aHullVex = c_xHullCache.Get(sMeshId, sFingerprint)
+    if aHullVex is None:
+        # The disk cache is shared by all processes that use the same mesh data
+        xDiskCache = cache.GetDiskCache()
+        dicSummary = xDiskCache.Load("hull", sFingerprint) if xDiskCache is not None else None
+        if dicSummary is not None:
+            aHullVex = dicSummary["aHullVex"]
+        else:
+            aHullVex = EvalConvexHullVex(_meshX)
+            if xDiskCache is not None:
+                xDiskCache.Store("hull", sFingerprint, {"aHullVex": aHullVex})
+            # endif
+        # endif
+
+        c_xHullCache.Set(sMeshId, sFingerprint, aHullVex)
+        aHullVex = c_xHullCache.Get(sMeshId, sFingerprint)
+    # endif
+
+    return aHullVex
+
+
+# enddef
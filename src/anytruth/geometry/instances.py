@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \geometry\instances.py
+# Created Date: Sunday, October 18th 2026, 12:41:03 am
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import bpy
+import numpy as np
+
+from . import hull
+
+
+#########################################################################
+def IsInstancer(_objX: bpy.types.Object) -> bool:
+    """Test whether an object may create instances with geometry nodes."""
+    return any(xMod.type == "NODES" for xMod in _objX.modifiers)
+
+
+# enddef
+
+
+#########################################################################
+def GatherInstances(
+    _xDepsGraph: bpy.types.Depsgraph, _setInstancers: set[str]
+) -> dict[str, list[tuple[np.ndarray, np.ndarray]]]:
+    """Gather the mesh instances created by the given instancer objects, without realizing them.
+    The instances of each instancer are grouped by their instanced mesh, so that the
+    convex hull of each mesh only has to be evaluated once.
+
+    Parameters
+    ----------
+    _xDepsGraph : bpy.types.Depsgraph
+        The evaluated dependency graph.
+    _setInstancers : set[str]
+        The names of the original instancer objects, whose instances are gathered.
+
+    Returns
+    -------
+    dict[str, list[tuple[np.ndarray, np.ndarray]]]
+        Per instancer name, a list of tuples of the read-only hull vertices of an instanced mesh
+        in local mesh coordinates, as array of shape (n, 3), and the world matrices of all its'
+        instances, as array of shape (m, 4, 4).
+    """
+    # Hull vertices and instance world matrices per mesh pointer, per instancer name
+    dicGroups: dict[str, dict[int, tuple[np.ndarray, list]]] = {}
+
+    # The instance data is only valid while iterating, so the hulls have to be evaluated here
+    for xInst in _xDepsGraph.object_instances:
+        if xInst.is_instance is False or xInst.parent is None:
+            continue
+        # endif
+
+        sName: str = xInst.parent.original.name
+        if sName not in _setInstancers:
+            continue
+        # endif
+
+        objX = xInst.object
+        if objX.type != "MESH":
+            continue
+        # endif
+
+        meshX: bpy.types.Mesh = objX.data
+        dicMeshes = dicGroups.setdefault(sName, {})
+        tGroup = dicMeshes.get(meshX.as_pointer())
+        if tGroup is None:
+            tGroup = dicMeshes[meshX.as_pointer()] = (hull.GetMeshHullVex(meshX), [])
+        # endif
+        tGroup[1].append(xInst.matrix_world.copy())
+    # endfor
+
+    dicInstances: dict[str, list[tuple[np.ndarray, np.ndarray]]] = {}
+    for sName, dicMeshes in dicGroups.items():
+        lSets = dicInstances[sName] = []
+        for aHullVex, lMatrices in dicMeshes.values():
+            aMatrices = np.array(lMatrices, dtype=np.float64).reshape(-1, 4, 4)
+            aMatrices.flags.writeable = False
+            lSets.append((aHullVex, aMatrices))
+        # endfor
+    # endfor
+
+    return dicInstances
+
+
+# enddef
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \geometry\kernels.py
+# Created Date: Saturday, October 17th 2026, 11:46:52 pm
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+from typing import Optional
+
+import numpy as np
+
+from .cls_box_reducer import CBoxReducer
+
+# Kernels of the label evaluation, which may run on worker threads of a CTaskPool.
+# The kernels only operate on NumPy arrays and must not access any Blender data.
+# A vertex set is a tuple of the vertices in local object space, as array of shape (n, 3),
+# and either the 4x4 world matrix of the object, or the world matrices of all instances
+# of the vertices as array of shape (m, 4, 4), as NumPy array.
+
+# Maximal number of vertices that are projected at once
+c_iMaxProjectVexCount: int = 1 << 20
+
+# Signs of the 8 corners of a box along its' axes, in the vertex order of the 3D box objects
+c_aBoxCornerSigns: np.ndarray = np.array(
+    [[-1, -1, -1], [1, -1, -1], [1, 1, -1], [-1, 1, -1], [-1, -1, 1], [1, -1, 1], [1, 1, 1], [-1, 1, 1]],
+    dtype=np.float64,
+)
+
+
+#########################################################################
+def _AddVexSets(_xReducer: CBoxReducer, _lVexSets: list[tuple[np.ndarray, np.ndarray]]):
+    for aVex, mWorld in _lVexSets:
+        if mWorld.ndim == 3:
+            _xReducer.AddInstancedVertices(aVex, mWorld)
+        else:
+            _xReducer.AddVertices(aVex, mWorld)
+        # endif
+    # endfor
+
+
+# enddef
+
+
+#########################################################################
+def _IterWorldVex(_lVexSets: list[tuple[np.ndarray, np.ndarray]], _iMaxVexCnt: int):
+    # Yield the world space vertices of the vertex sets, in chunks of at most _iMaxVexCnt vertices,
+    # unless a single instance has more vertices.
+    for aVex, mWorld in _lVexSets:
+        if aVex.shape[0] == 0:
+            continue
+        # endif
+
+        if mWorld.ndim == 2:
+            yield (aVex @ mWorld[0:3, 0:3].transpose()) + mWorld[0:3, 3]
+            continue
+        # endif
+
+        iInstPerChunk: int = max(_iMaxVexCnt // aVex.shape[0], 1)
+        for iStart in range(0, mWorld.shape[0], iInstPerChunk):
+            aMatrices = mWorld[iStart : iStart + iInstPerChunk]
+            aWorldVex = np.matmul(aVex, aMatrices[:, 0:3, 0:3].transpose(0, 2, 1)) + aMatrices[:, np.newaxis, 0:3, 3]
+            yield aWorldVex.reshape(-1, 3)
+        # endfor
+    # endfor
+
+
+# enddef
+
+
+#########################################################################
+def EvalBox3d(
+    _mAxes: Optional[np.ndarray], _lVexSets: list[tuple[np.ndarray, np.ndarray]], _iMemoryBudget: int
+) -> Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Evaluate the oriented 3D bounding box of vertex sets.
+
+    Parameters
+    ----------
+    _mAxes : Optional[np.ndarray]
+        The 3x3 matrix whose rows are the unit box axes in world space.
+        If None, the principal axes of the vertices are used.
+    _lVexSets : list[tuple[np.ndarray, np.ndarray]]
+        The vertex sets.
+    _iMemoryBudget : int
+        The memory budget of the box reducer scratch buffers in bytes.
+
+    Returns
+    -------
+    Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]
+        The tuple (center, size, axes) as returned by CBoxReducer.GetBox(),
+        or None if the vertex sets contain no vertices.
+    """
+    xReducer = CBoxReducer(iMemoryBudget=_iMemoryBudget)
+    xReducer.Reset(_mAxes)
+    _AddVexSets(xReducer, _lVexSets)
+
+    if xReducer.iVexCount == 0:
+        return None
+    # endif
+
+    if xReducer.bHasAxes is False:
+        # Evaluate the extents along the main directions in a second pass
+        xReducer.Reset(xReducer.GetPrincipalAxes())
+        _AddVexSets(xReducer, _lVexSets)
+    # endif
+
+    return xReducer.GetBox()
+
+
+# enddef
+
+
+#########################################################################
+def EvalBoxes2d(
+    _viewCam, _llVexSets: list[list[tuple[np.ndarray, np.ndarray]]], _bAllowFovBoxes2d: bool
+) -> list[Optional[tuple[np.ndarray, np.ndarray]]]:
+    """Evaluate the 2D bounding boxes of the projections of the vertex sets of many instances into the camera image.
+    The vertices of all instances are projected in batches of whole segments, and the boxes are reduced
+    per segment with vectorized segment operations.
+
+    Parameters
+    ----------
+    _viewCam : anycam view
+        The camera view, which must provide the function ProjectToImage().
+    _llVexSets : list[list[tuple[np.ndarray, np.ndarray]]]
+        The vertex sets per instance.
+    _bAllowFovBoxes2d : bool
+        If True, only the vertices within the image are used, and the box is also
+        evaluated if some vertices are behind the camera.
+
+    Returns
+    -------
+    list[Optional[tuple[np.ndarray, np.ndarray]]]
+        The minimal and maximal image coordinates per instance, or None if no valid box exists.
+    """
+    iInstCnt: int = len(_llVexSets)
+    xReduction = _CSegmentReduction(iInstCnt)
+
+    # World space vertex segments and their instance indices of the current batch
+    lSegVex: list[np.ndarray] = []
+    lSegInst: list[int] = []
+    iBatchVexCnt: int = 0
+
+    for iInst, lVexSets in enumerate(_llVexSets):
+        for aVex in _IterWorldVex(lVexSets, c_iMaxProjectVexCount):
+            lSegVex.append(aVex)
+            lSegInst.append(iInst)
+            iBatchVexCnt += aVex.shape[0]
+
+            if iBatchVexCnt >= c_iMaxProjectVexCount:
+                xReduction.Project(_viewCam, lSegVex, lSegInst, _bAllowFovBoxes2d)
+                lSegVex = []
+                lSegInst = []
+                iBatchVexCnt = 0
+            # endif
+        # endfor
+    # endfor
+
+    if len(lSegVex) > 0:
+        xReduction.Project(_viewCam, lSegVex, lSegInst, _bAllowFovBoxes2d)
+    # endif
+
+    return xReduction.GetBoxes(_bAllowFovBoxes2d)
+
+
+# enddef
+
+
+###################################################################################
+# Per instance reduction of projected vertex segments to 2D boxes
+class _CSegmentReduction:
+    def __init__(self, _iInstCnt: int):
+        self._aMin: Optional[np.ndarray] = None
+        self._aMax: Optional[np.ndarray] = None
+        # Number of valid projected points per instance
+        self._aCount: np.ndarray = np.zeros(_iInstCnt, dtype=np.int64)
+        # Whether all points of an instance are in front of the camera
+        self._aAllInFront: np.ndarray = np.ones(_iInstCnt, dtype=bool)
+
+    # enddef
+
+    ##########################################################################
+    def Project(self, _viewCam, _lSegVex: list[np.ndarray], _lSegInst: list[int], _bAllowFovBoxes2d: bool):
+        aVex = np.concatenate(_lSegVex, axis=0)
+        aStarts = np.cumsum([0] + [aSegVex.shape[0] for aSegVex in _lSegVex[:-1]])
+        aSegInst = np.array(_lSegInst, dtype=np.int64)
+
+        # Project the points of all segments with a single call
+        xImgPnts, xInFront, xInImage = _viewCam.ProjectToImage(aVex, _bDetailedFlags=True)
+        aImgPnts = np.asarray(xImgPnts, dtype=np.float64).reshape(aVex.shape[0], -1)
+        aInFront = np.asarray(xInFront, dtype=bool).reshape(-1)
+
+        if _bAllowFovBoxes2d:
+            aValid = aInFront & np.asarray(xInImage, dtype=bool).reshape(-1)
+            aMinSrc = np.where(aValid[:, np.newaxis], aImgPnts, np.inf)
+            aMaxSrc = np.where(aValid[:, np.newaxis], aImgPnts, -np.inf)
+            aSegCount = np.add.reduceat(aValid.astype(np.int64), aStarts)
+        else:
+            aMinSrc = aMaxSrc = aImgPnts
+            aSegCount = np.diff(np.append(aStarts, aVex.shape[0]))
+        # endif
+
+        if self._aMin is None:
+            self._aMin = np.full((self._aCount.shape[0], aImgPnts.shape[1]), np.inf)
+            self._aMax = np.full((self._aCount.shape[0], aImgPnts.shape[1]), -np.inf)
+        # endif
+
+        # Reduce the segments and combine the segments of the same instance
+        np.minimum.at(self._aMin, aSegInst, np.minimum.reduceat(aMinSrc, aStarts, axis=0))
+        np.maximum.at(self._aMax, aSegInst, np.maximum.reduceat(aMaxSrc, aStarts, axis=0))
+        np.add.at(self._aCount, aSegInst, aSegCount)
+        np.logical_and.at(self._aAllInFront, aSegInst, np.logical_and.reduceat(aInFront, aStarts))
+
+    # enddef
+
+    ##########################################################################
+    def GetBoxes(self, _bAllowFovBoxes2d: bool) -> list[Optional[tuple[np.ndarray, np.ndarray]]]:
+        aIsValid = self._aCount > 0
+        if not _bAllowFovBoxes2d:
+            aIsValid &= self._aAllInFront
+        # endif
+
+        return [
+            (self._aMin[iInst], self._aMax[iInst]) if bIsValid else None
+            for iInst, bIsValid in enumerate(aIsValid.tolist())
+        ]
+
+    # enddef
+
+
+# endclass
+
+
+#########################################################################
+def EvalBoxCorners2d(
+    _viewCam, _aCenters: np.ndarray, _aSizes: np.ndarray, _aAxes: np.ndarray, _bAllowFovBoxes2d: bool
+) -> list[Optional[tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]]]:
+    """Evaluate the 2D boxes of the projected corners of 3D boxes.
+
+    Parameters
+    ----------
+    _viewCam : anycam view
+        The camera view, which must provide the function ProjectToImage().
+    _aCenters : np.ndarray
+        The box centers of shape (n, 3).
+    _aSizes : np.ndarray
+        The box sizes along the box axes of shape (n, 3).
+    _aAxes : np.ndarray
+        The box axes as rows of shape (n, 3, 3).
+    _bAllowFovBoxes2d : bool
+        If True, only the corners within the image are used, and the box is also
+        evaluated if some corners are behind the camera.
+
+    Returns
+    -------
+    list[Optional[tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]]]
+        Per box the minimal and maximal image coordinates and the image coordinates of the 8 corners,
+        or None if no valid box exists. The corners are None, if not all corners are in front of the camera.
+    """
+    iBoxCnt: int = _aCenters.shape[0]
+    iMaxBoxCnt: int = c_iMaxProjectVexCount // 8
+    lBoxes: list[Optional[tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]]] = []
+
+    for iStart in range(0, iBoxCnt, iMaxBoxCnt):
+        iEnd = min(iStart + iMaxBoxCnt, iBoxCnt)
+        iCnt = iEnd - iStart
+
+        aCorners = _aCenters[iStart:iEnd, np.newaxis, :] + np.einsum(
+            "kj,nj,nji->nki", 0.5 * c_aBoxCornerSigns, _aSizes[iStart:iEnd], _aAxes[iStart:iEnd]
+        )
+
+        # Project the corners of all boxes with a single call
+        xImgPnts, xInFront, xInImage = _viewCam.ProjectToImage(aCorners.reshape(-1, 3), _bDetailedFlags=True)
+        aImgPnts = np.asarray(xImgPnts, dtype=np.float64).reshape(iCnt, 8, -1)[:, :, 0:2]
+        aInFront = np.asarray(xInFront, dtype=bool).reshape(iCnt, 8)
+        aAllInFront = aInFront.all(axis=1)
+
+        if _bAllowFovBoxes2d:
+            aValid = aInFront & np.asarray(xInImage, dtype=bool).reshape(iCnt, 8)
+        else:
+            aValid = np.repeat(aAllInFront[:, np.newaxis], 8, axis=1)
+        # endif
+
+        aMin = np.where(aValid[:, :, np.newaxis], aImgPnts, np.inf).min(axis=1)
+        aMax = np.where(aValid[:, :, np.newaxis], aImgPnts, -np.inf).max(axis=1)
+
+        for iBox, (bIsValid, bAllInFront) in enumerate(zip(aValid.any(axis=1).tolist(), aAllInFront.tolist())):
+            if bIsValid is False:
+                lBoxes.append(None)
+            else:
+                lBoxes.append((aMin[iBox], aMax[iBox], aImgPnts[iBox] if bAllInFront is True else None))
+            # endif
+        # endfor
+    # endfor
+
+    return lBoxes
+
+
+# enddef
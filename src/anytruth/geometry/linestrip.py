@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \geometry\linestrip.py
+# Created Date: Sunday, October 18th 2026, 2:31:44 am
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+from typing import Optional
+
+import numpy as np
+
+from .cls_spatial_hash import CSpatialHash
+
+# Distance below which vertices are regarded as the same point in space
+c_fClose: float = 1e-2
+
+# Distance below which vertices without a common edge are regarded as coincident
+c_fWeldDist: float = 1e-5
+
+# Maximal difference of a vertex color component from the line strip color
+c_fColorPrec: float = 1 / 512.0
+
+
+#########################################################################
+def GetLineStripsPerColor(
+    _aLocalVex: np.ndarray,
+    _aEdges: np.ndarray,
+    _aLoopVex: np.ndarray,
+    _aLoopColors: np.ndarray,
+    _ltRGB: list[tuple[float, float, float]],
+    _mWorld: np.ndarray,
+) -> list[tuple[list[list[list[float]]], list[np.ndarray]]]:
+    """Get the line strips formed by the edges of a mesh, whose vertices have one of the given vertex colors.
+    The face loops are classified against all colors at once.
+    The line strips are given by zero width quad strips, whose coincident vertices are joined.
+    Line strips whose ends touch in world space are joined to a single strip.
+
+    Parameters
+    ----------
+    _aLocalVex : np.ndarray
+        The local vertex coordinates of shape (n, 3).
+    _aEdges : np.ndarray
+        The vertex indices of the edges of shape (m, 2).
+    _aLoopVex : np.ndarray
+        The vertex index per face loop.
+    _aLoopColors : np.ndarray
+        The vertex color per face loop of shape (l, 4).
+    _ltRGB : list[tuple[float, float, float]]
+        The vertex colors of the line strip vertices, whose components are multiples of 1/255.
+    _mWorld : np.ndarray
+        The 4x4 world matrix of the object.
+
+    Returns
+    -------
+    list[tuple[list[list[list[float]]], list[np.ndarray]]]
+        Per color the line strips as lists of world space vertices,
+        and the line strips as arrays of local vertices.
+
+    Raises
+    ------
+    Exception
+        If the edges form a loop.
+    """
+    aColors = np.rint(np.array(_ltRGB, dtype=np.float64).reshape(-1, 3) * 255.0).astype(np.int64)
+    aUniqueColors, aColorInv = np.unique(aColors, axis=0, return_inverse=True)
+    aLoopClass = _ClassifyLoopColors(_aLoopColors, aUniqueColors)
+
+    # The face loops of each color, as ranges of the loops sorted by color
+    aLoopOrder = np.argsort(aLoopClass, kind="stable")
+    aClassBounds = np.searchsorted(aLoopClass[aLoopOrder], np.arange(aUniqueColors.shape[0] + 1))
+
+    lStripsPerClass: list[tuple[list[list[list[float]]], list[np.ndarray]]] = []
+    for iClass in range(aUniqueColors.shape[0]):
+        aIsColVex = np.zeros(_aLocalVex.shape[0], dtype=bool)
+        aIsColVex[_aLoopVex[aLoopOrder[aClassBounds[iClass] : aClassBounds[iClass + 1]]]] = True
+        lStripsPerClass.append(_GetMaskedLineStrips(_aLocalVex, _aEdges, aIsColVex, _mWorld))
+    # endfor
+
+    return [lStripsPerClass[iClass] for iClass in aColorInv.reshape(-1).tolist()]
+
+
+# enddef
+
+
+#########################################################################
+def _ClassifyLoopColors(_aLoopColors: np.ndarray, _aColors: np.ndarray) -> np.ndarray:
+    # Get the index of the color per face loop, or -1 if the loop has none of the colors.
+    # The colors are given as integer components in the range [0, 255]. As the color precision
+    # is below half of the color spacing, the only color close to a loop is the nearest color.
+    aLoopRGB = _aLoopColors[:, 0:3].astype(np.float64)
+    aLoopInt = np.clip(np.rint(aLoopRGB * 255.0), -1.0, 256.0)
+    aIsClose = np.all(np.abs(aLoopRGB - aLoopInt / 255.0) < c_fColorPrec, axis=1)
+    aLoopInt = aLoopInt.astype(np.int64)
+
+    def _GetKeys(_aRGB: np.ndarray) -> np.ndarray:
+        return ((_aRGB[:, 0] + 1) * 512 + (_aRGB[:, 1] + 1)) * 512 + (_aRGB[:, 2] + 1)
+
+    # enddef
+
+    if _aColors.shape[0] == 0:
+        return np.full(aLoopInt.shape[0], -1, dtype=np.int64)
+    # endif
+
+    aColorKeys = _GetKeys(_aColors)
+    aKeyOrder = np.argsort(aColorKeys)
+    aSortedKeys = aColorKeys[aKeyOrder]
+    aLoopKeys = _GetKeys(aLoopInt)
+
+    aPos = np.minimum(np.searchsorted(aSortedKeys, aLoopKeys), aSortedKeys.shape[0] - 1)
+    aIsMatch = aIsClose & (aSortedKeys[aPos] == aLoopKeys)
+    return np.where(aIsMatch, aKeyOrder[aPos], -1)
+
+
+# enddef
+
+
+#########################################################################
+def _GetMaskedLineStrips(
+    _aLocalVex: np.ndarray, _aEdges: np.ndarray, _aIsColVex: np.ndarray, _mWorld: np.ndarray
+) -> tuple[list[list[list[float]]], list[np.ndarray]]:
+    # Get the line strips formed by the edges whose both vertices are marked in the vertex mask
+    mWorldT = _mWorld[0:3, 0:3].transpose()
+    mTrans = _mWorld[0:3, 3]
+    iVexCnt: int = _aLocalVex.shape[0]
+
+    aEdgeVexIdx = _aEdges[np.all(_aIsColVex[_aEdges], axis=1)]
+
+    # Get unique set of vertex indices contained in all edges.
+    # The order of the set defines the order of the line strips and has to be kept.
+    lVexIdx = list(set(aEdgeVexIdx.reshape(-1).tolist()))
+    aVex = np.array(_aLocalVex[lVexIdx], dtype=np.float64).reshape(-1, 3)
+
+    # Convert the edge indices to indices for lVexIdx
+    aVexIdxInv = np.zeros(iVexCnt, dtype=np.int64)
+    aVexIdxInv[lVexIdx] = np.arange(len(lVexIdx))
+    aMyEdgeVexIdx = aVexIdxInv[aEdgeVexIdx].reshape(-1, 2)
+
+    # Find the edges whose vertices relate to the same point in space
+    aIsSame = np.linalg.norm(aVex[aMyEdgeVexIdx[:, 0]] - aVex[aMyEdgeVexIdx[:, 1]], axis=1) < c_fClose
+    aSameVexIdx = aMyEdgeVexIdx[aIsSame]
+
+    # Create a vertex index reference array, where equivalent vertices point to the same index.
+    # If a vertex is referenced by more than one edge, the last edge is used.
+    aSameRefIdx = np.arange(aVex.shape[0])
+    aSameMax = aSameVexIdx.max(axis=1)
+    aSameMin = aSameVexIdx.min(axis=1)
+    _, aLastIdx = np.unique(aSameMax[::-1], return_index=True)
+    aLastIdx = aSameMax.shape[0] - 1 - aLastIdx
+    aSameRefIdx[aSameMax[aLastIdx]] = aSameMin[aLastIdx]
+
+    # Weld the remaining vertices that coincide, but do not share an edge, like duplicated seam vertices
+    aRefVexIdx = np.flatnonzero(aSameRefIdx == np.arange(aVex.shape[0]))
+    aWeldRefIdx = np.arange(aVex.shape[0])
+    aWeldRefIdx[aRefVexIdx] = aRefVexIdx[CSpatialHash(aVex[aRefVexIdx], c_fWeldDist).Weld(c_fWeldDist)]
+    aSameRefIdx = aWeldRefIdx[aSameRefIdx]
+
+    # Get the list of vertices that are unique in 3d space
+    lUniqueVexIdx = list(set(aSameRefIdx.tolist()))
+    iUniqueVexCnt = len(lUniqueVexIdx)
+
+    # Get the 3d coordinates of these unique vertices
+    aUniqueLocalVex = aVex[lUniqueVexIdx]
+    aUniqueVex = (aUniqueLocalVex @ mWorldT) + mTrans
+
+    # Convert the edge indices so that indices that refer to the same vertex are also equal,
+    # remove edges that have zero length, and convert the indices to point into lUniqueVexIdx.
+    aUniqueIdxInv = np.zeros(aVex.shape[0], dtype=np.int64)
+    aUniqueIdxInv[lUniqueVexIdx] = np.arange(iUniqueVexCnt)
+    aMyEdgeVexIdx = aSameRefIdx[aMyEdgeVexIdx].reshape(-1, 2)
+    aMyEdgeVexIdx = aUniqueIdxInv[aMyEdgeVexIdx[aMyEdgeVexIdx[:, 0] != aMyEdgeVexIdx[:, 1]]].reshape(-1, 2)
+
+    # Create hashes of edges and reduce them to a unique set
+    setMyEdgeVexIdxHash = set((aMyEdgeVexIdx.min(axis=1) * iUniqueVexCnt + aMyEdgeVexIdx.max(axis=1)).tolist())
+
+    # Get list of unique edges
+    lMyUniqueEdge = [list(divmod(h, iUniqueVexCnt)) for h in set(setMyEdgeVexIdxHash)]
+
+    lStripLists = _GetStripLists(lMyUniqueEdge, iUniqueVexCnt)
+    lFullStripIdx = _JoinStripLists(lStripLists, aUniqueVex)
+
+    return [aUniqueVex[lFullStrip].tolist() for lFullStrip in lFullStripIdx], [
+        aUniqueLocalVex[lFullStrip] for lFullStrip in lFullStripIdx
+    ]
+
+
+# enddef
+
+
+#########################################################################
+def _GetAdjacency(_aFromIdx: np.ndarray, _aToIdx: np.ndarray, _iVexCnt: int) -> tuple[list[int], list[int]]:
+    # Adjacency array of the vertices, where the adjacent vertices of vertex i are given by
+    # lAdjIdx[lOffsets[i]:lOffsets[i + 1]], in the order of the edge list.
+    aOrder = np.argsort(_aFromIdx, kind="stable")
+    aOffsets = np.zeros(_iVexCnt + 1, dtype=np.int64)
+    np.cumsum(np.bincount(_aFromIdx, minlength=_iVexCnt), out=aOffsets[1:])
+    return _aToIdx[aOrder].tolist(), aOffsets.tolist()
+
+
+# enddef
+
+
+#########################################################################
+def _GetNextVex(_lAdjIdx: list[int], _lOffsets: list[int], _iVexIdx: int, _setExclude: set[int]) -> Optional[int]:
+    # Get the first vertex adjacent to the given vertex, which is not excluded
+    for iIdx in range(_lOffsets[_iVexIdx], _lOffsets[_iVexIdx + 1]):
+        if _lAdjIdx[iIdx] not in _setExclude:
+            return _lAdjIdx[iIdx]
+        # endif
+    # endfor
+    return None
+
+
+# enddef
+
+
+#########################################################################
+def _GetStripLists(_lMyUniqueEdge: list[list[int]], _iUniqueVexCnt: int) -> list[list[int]]:
+    # Chain the edges to line strips. The strip is extended from the first edge,
+    # which is not part of a strip, in both directions along the vertex adjacencies.
+    aEdges = np.array(_lMyUniqueEdge, dtype=np.int64).reshape(-1, 2)
+    # Vertices adjacent via edges that start or end at a vertex
+    lAdjByFirst, lOffsetsByFirst = _GetAdjacency(aEdges[:, 0], aEdges[:, 1], _iUniqueVexCnt)
+    lAdjBySecond, lOffsetsBySecond = _GetAdjacency(aEdges[:, 1], aEdges[:, 0], _iUniqueVexCnt)
+
+    lStripLists = []
+    setAllStripVex = set([])
+
+    for lStartEdge in _lMyUniqueEdge:
+        if lStartEdge[0] in setAllStripVex:
+            continue
+        # endif
+
+        # The strip vertices are given by the reversed head list followed by the tail list
+        lHeadVex: list[int] = []
+        lTailVex: list[int] = []
+        setStripVex: set[int] = set()
+
+        iVex0, iVex1 = lStartEdge
+        while True:
+            if iVex0 in setStripVex:
+                raise Exception("Edge loop found in line strip")
+            # endif
+            setAllStripVex.add(iVex0)
+            setStripVex.add(iVex0)
+            lTailVex.append(iVex0)
+
+            iNextVex = _GetNextVex(lAdjByFirst, lOffsetsByFirst, iVex1, setAllStripVex)
+            if iNextVex is None:
+                iNextVex = _GetNextVex(lAdjBySecond, lOffsetsBySecond, iVex1, setAllStripVex)
+                if iNextVex is None:
+                    if iVex1 not in setAllStripVex:
+                        setAllStripVex.add(iVex1)
+                        setStripVex.add(iVex1)
+                        lTailVex.append(iVex1)
+                    # endif
+                    break
+                # endif
+            # endif
+            iVex0, iVex1 = iVex1, iNextVex
+        # endwhile
+
+        iVex0 = lStartEdge[0]
+        while True:
+            iNextVex = _GetNextVex(lAdjBySecond, lOffsetsBySecond, iVex0, setAllStripVex)
+            if iNextVex is None:
+                iNextVex = _GetNextVex(lAdjByFirst, lOffsetsByFirst, iVex0, setAllStripVex)
+                if iNextVex is None:
+                    if iVex0 not in setStripVex:
+                        setAllStripVex.add(iVex0)
+                        setStripVex.add(iVex0)
+                        lHeadVex.append(iVex0)
+                    # endif
+                    break
+                # endif
+            # endif
+            iVex0 = iNextVex
+
+            if iVex0 in setStripVex:
+                raise Exception("Edge loop found in line strip")
+            # endif
+            setAllStripVex.add(iVex0)
+            setStripVex.add(iVex0)
+            lHeadVex.append(iVex0)
+        # endwhile
+
+        lStripLists.append(lHeadVex[::-1] + lTailVex)
+    # endfor
+
+    return lStripLists
+
+
+# enddef
+
+
+#########################################################################
+def _JoinStripLists(_lStripLists: list[list[int]], _aUniqueVex: np.ndarray) -> list[list[int]]:
+    # Join the line strips, whose ends are connected in 3d space.
+    # The strip ends are hashed, so that only the strips with ends in the neighboring cells need to be tested.
+    # The start and end of strip i have the indices 2i and 2i + 1 in the hash grid.
+    xEndHash = CSpatialHash(
+        _aUniqueVex[[iVexIdx for lStrip in _lStripLists for iVexIdx in (lStrip[0], lStrip[-1])]], c_fClose
+    )
+    setUsedStripIdx = set([])
+
+    def _GetCandidates(_aVexBase: np.ndarray) -> list[int]:
+        # Unused strips with an end close to the vertex, in the order of the strip list
+        setCandidates = set((xEndHash.Query(_aVexBase, c_fClose) // 2).tolist())
+        return sorted(setCandidates - setUsedStripIdx)
+
+    # enddef
+
+    lFullStripLists = []
+    for iStartStripIdx in range(len(_lStripLists)):
+        if iStartStripIdx in setUsedStripIdx:
+            continue
+        # endif
+
+        setUsedStripIdx.add(iStartStripIdx)
+        lStrip = _lStripLists[iStartStripIdx]
+        lFullStrip = lStrip.copy()
+        aVexBase = _aUniqueVex[lStrip[-1]]
+        while True:
+            bNextStripFound = False
+            for iTestStripIdx in _GetCandidates(aVexBase):
+                lTestStrip = _lStripLists[iTestStripIdx]
+                if np.linalg.norm(aVexBase - _aUniqueVex[lTestStrip[0]]) < c_fClose:
+                    setUsedStripIdx.add(iTestStripIdx)
+                    lFullStrip.extend(lTestStrip[1:])
+                    aVexBase = _aUniqueVex[lTestStrip[-1]]
+                    bNextStripFound = True
+                    break
+                elif np.linalg.norm(aVexBase - _aUniqueVex[lTestStrip[-1]]) < c_fClose:
+                    setUsedStripIdx.add(iTestStripIdx)
+                    lFullStrip.extend(lTestStrip[-2::-1])
+                    aVexBase = _aUniqueVex[lTestStrip[0]]
+                    bNextStripFound = True
+                    break
+                # endif
+            # endfor
+            if not bNextStripFound:
+                break
+            # endif
+        # endwhile
+
+        aVexBase = _aUniqueVex[lStrip[0]]
+        while True:
+            bPrevStripFound = False
+            for iTestStripIdx in _GetCandidates(aVexBase):
+                lTestStrip = _lStripLists[iTestStripIdx]
+                if np.linalg.norm(aVexBase - _aUniqueVex[lTestStrip[-1]]) < c_fClose:
+                    setUsedStripIdx.add(iTestStripIdx)
+                    lFullStrip = lTestStrip[0:-1] + lFullStrip
+                    aVexBase = _aUniqueVex[lTestStrip[0]]
+                    bPrevStripFound = True
+                    break
+                elif np.linalg.norm(aVexBase - _aUniqueVex[lTestStrip[0]]) < c_fClose:
+                    setUsedStripIdx.add(iTestStripIdx)
+                    lFullStrip = lTestStrip[-1:0:-1] + lFullStrip
+                    aVexBase = _aUniqueVex[lTestStrip[-1]]
+                    bPrevStripFound = True
+                    break
+                # endif
+            # endfor
+            if not bPrevStripFound:
+                break
+            # endif
+        # endwhile
+
+        lFullStripLists.append(lFullStrip)
+    # endfor
+
+    return lFullStripLists
+
+
+# enddef
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \geometry\tasks.py
+# Created Date: Saturday, October 17th 2026, 11:38:09 pm
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+from .cls_task_pool import CTaskPool
+
+# Task pool shared by all label evaluations. It is created on first use.
+c_xTaskPool: CTaskPool = None
+
+
+#########################################################################
+def GetTaskPool(_iWorkers: int = 0) -> CTaskPool:
+    """Get the shared task pool with the given number of workers.
+    If the number of workers has changed, the current pool is shut down and a new one is created.
+    A worker count of zero uses one worker per CPU core.
+    """
+    global c_xTaskPool
+
+    xTaskPool = CTaskPool(iWorkers=_iWorkers)
+    if c_xTaskPool is None or c_xTaskPool.iWorkers != xTaskPool.iWorkers:
+        if c_xTaskPool is not None:
+            c_xTaskPool.Shutdown()
+        # endif
+        c_xTaskPool = xTaskPool
+    # endif
+
+    return c_xTaskPool
+
+
+# enddef
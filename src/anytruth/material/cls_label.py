@@ -48,8 +48,6 @@ class CLabel(CMaterial):
     def __init__(
         self,
         *,
-        iLabelTypeCount: int,
-        iMaxInstCount: int,
         iId: int,
         sName: str = "Default",
         eLabelShaderType: ELabelShaderTypes = ELabelShaderTypes.DIFFUSE,
@@ -57,8 +55,6 @@ class CLabel(CMaterial):
     ):
         super().__init__(sName=CreateName(sName), bForce=bForce)
 
-        self._iLabelTypeCount: int = iLabelTypeCount
-        self._iMaxInstCount: int = iMaxInstCount
         self._iId: int = iId
         self._eLabelShaderType: ELabelShaderTypes = eLabelShaderType
 
@@ -85,9 +81,7 @@ class CLabel(CMaterial):
 
         self.RemoveNode("Principled BSDF")
 
-        ngMatLabVal = node.grp.material_label_value.Create(
-            iLabelTypeCount=self._iLabelTypeCount, iMaxInstCount=self._iMaxInstCount
-        )
+        ngMatLabVal = node.grp.material_label_value.Create()
         nodMatLabVal = anyblend.node.shader.utils.Group(self.xNodeTree, ngMatLabVal)
 
         ngLabelColor = self._modLabelShaderColor.Create(bUseFakeUser=True)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \material\cls_label_pool.py
+# Created Date: Saturday, October 17th 2026, 9:14:32 pm
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import bpy
+
+from .. import node
+from ..node.shader.types import ELabelShaderTypes
+from .cls_label import CLabel
+from .cls_label import CreateName as CreateNameLabel
+from .cls_label_skeleton import CLabelSkeleton
+from .cls_label_skeleton import CreateName as CreateNameLabelSkeleton
+from .cls_label_shared import CLabelShared
+from .cls_label_shared import CreateName as CreateNameLabelShared
+
+
+#####################################################################
+# Pool of label materials.
+# Each label material stores the fingerprint of the parameters it was created with
+# as custom property. A material is only rebuilt if its' fingerprint has changed.
+# The label type count and the maximal instance count are not part of the fingerprint,
+# as they are read by the label materials from scene custom properties.
+class CLabelPool:
+    # Name of the custom property that stores the material fingerprint
+    sFingerprintKey: str = "AT.Label.Fingerprint"
+
+    def __init__(
+        self,
+        *,
+        iLabelTypeCount: int,
+        iMaxInstCount: int,
+        eLabelShaderType: ELabelShaderTypes = ELabelShaderTypes.DIFFUSE,
+    ):
+        self._eLabelShaderType: ELabelShaderTypes = eLabelShaderType
+
+        # Names of the materials provided by this pool
+        self._setUsed: set[str] = set()
+
+        # All label materials share the material label value node group,
+        # which reads the counts from the scene.
+        node.grp.material_label_value.SetCounts(
+            bpy.context.scene, iLabelTypeCount=iLabelTypeCount, iMaxInstCount=iMaxInstCount
+        )
+        node.grp.material_label_value.Create()
+
+    # enddef
+
+    #####################################################################
+    def _GetFingerprint(self, *, iId: int, sTypeId: str, sSkelId: str = "") -> str:
+        return str((sTypeId, iId, str(self._eLabelShaderType.value), sSkelId))
+
+    # enddef
+
+    #####################################################################
+    def _NeedsRebuild(self, _sMatName: str, _sFingerprint: str) -> bool:
+        self._setUsed.add(_sMatName)
+
+        matX = bpy.data.materials.get(_sMatName)
+        if matX is None:
+            return True
+        # endif
+
+        return matX.get(self.sFingerprintKey) != _sFingerprint
+
+    # enddef
+
+    #####################################################################
+    def GetLabel(self, *, iId: int, sTypeId: str) -> CLabel:
+        sFingerprint = self._GetFingerprint(iId=iId, sTypeId=sTypeId)
+        bForce = self._NeedsRebuild(CreateNameLabel(sTypeId), sFingerprint)
+
+        xLabel = CLabel(iId=iId, sName=sTypeId, eLabelShaderType=self._eLabelShaderType, bForce=bForce)
+        xLabel.xMaterial[self.sFingerprintKey] = sFingerprint
+
+        return xLabel
+
+    # enddef
+
+    #####################################################################
+    def GetLabelSkeleton(self, *, iId: int, sTypeId: str, sSkelId: str) -> CLabelSkeleton:
+        sFingerprint = self._GetFingerprint(iId=iId, sTypeId=sTypeId, sSkelId=sSkelId)
+        bForce = self._NeedsRebuild(CreateNameLabelSkeleton(sTypeId, sSkelId), sFingerprint)
+
+        xLabel = CLabelSkeleton(
+            iId=iId,
+            sLabelId=sTypeId,
+            sSkelId=sSkelId,
+            eLabelShaderType=self._eLabelShaderType,
+            bForce=bForce,
+        )
+        xLabel.xMaterial[self.sFingerprintKey] = sFingerprint
+
+        return xLabel
+
+    # enddef
+
+    #####################################################################
+    def GetLabelShared(self) -> CLabelShared:
+        sFingerprint = str(("AT.LabelShared", str(self._eLabelShaderType.value)))
+        bForce = self._NeedsRebuild(CreateNameLabelShared(), sFingerprint)
+
+        xLabel = CLabelShared(eLabelShaderType=self._eLabelShaderType, bForce=bForce)
+        xLabel.xMaterial[self.sFingerprintKey] = sFingerprint
+
+        return xLabel
+
+    # enddef
+
+    #####################################################################
+    def RecycleUnused(self) -> int:
+        """Remove all pool materials that have not been provided by this pool
+        and that are not used by any mesh.
+
+        Returns
+        -------
+        int
+            The number of removed materials.
+        """
+        lUnused = [
+            matX
+            for matX in bpy.data.materials
+            if matX.name not in self._setUsed
+            and self.sFingerprintKey in matX
+            and matX.users == (1 if matX.use_fake_user else 0)
+        ]
+
+        for matX in lUnused:
+            bpy.data.materials.remove(matX)
+        # endfor
+
+        return len(lUnused)
+
+    # enddef
+
+
+# endclass
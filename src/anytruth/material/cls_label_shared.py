@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \material\cls_label_shared.py
+# Created Date: Saturday, October 17th 2026, 9:55:41 pm
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+
+from anyblend.cls_material import CMaterial
+import anyblend
+
+from .. import node
+from ..node.shader.types import ELabelShaderTypes
+
+
+#####################################################################
+# @staticmethod
+def CreateName():
+    return "AnyTruth.LabelShared"
+
+
+# enddef
+
+
+#####################################################################
+# Label material that is shared by all label types.
+# The label type index and the instance index are read from object custom properties.
+class CLabelShared(CMaterial):
+    def __init__(
+        self,
+        *,
+        eLabelShaderType: ELabelShaderTypes = ELabelShaderTypes.DIFFUSE,
+        bForce: bool = False,
+    ):
+        super().__init__(sName=CreateName(), bForce=bForce)
+
+        self._eLabelShaderType: ELabelShaderTypes = eLabelShaderType
+
+        self._modLabelShaderColor = None
+
+        if self._eLabelShaderType == ELabelShaderTypes.DIFFUSE:
+            self._modLabelShaderColor = node.shader.label_diffuse
+        elif self._eLabelShaderType == ELabelShaderTypes.EMISSION:
+            self._modLabelShaderColor = node.shader.label_emission
+        else:
+            raise RuntimeError(f"Unsupported label shader type: {self._eLabelShaderType}")
+        # endif
+
+        if self._bNeedUpdate:
+            self._Create()
+        # endif
+
+    # enddef
+
+    #####################################################################
+    def _Create(self):
+
+        tNodeSpace = (50, 25)
+
+        self.RemoveNode("Principled BSDF")
+
+        ngObjLabVal = node.grp.object_label_value.Create()
+        nodObjLabVal = anyblend.node.shader.utils.Group(self.xNodeTree, ngObjLabVal)
+
+        ngLabelColor = self._modLabelShaderColor.Create(bUseFakeUser=True)
+        nodLabelColor = anyblend.node.shader.utils.Group(self.xNodeTree, ngLabelColor)
+
+        nodOut = self.GetNode("Material Output")
+
+        anyblend.node.align.Relative(nodOut, (0, 0), nodLabelColor, (1, 0), tNodeSpace)
+        self.CreateLink(xOut=nodLabelColor.outputs["BSDF"], xIn=nodOut.inputs["Surface"])
+
+        anyblend.node.align.Relative(nodLabelColor, (0, 0), nodObjLabVal, (1, 0), tNodeSpace)
+        self.CreateLink(
+            xOut=nodObjLabVal.outputs[0],
+            xIn=nodLabelColor.inputs["Material Label Value"],
+        )
+
+        self._bNeedUpdate = False
+
+    # enddef
+
+
+# endclass
@@ -52,8 +52,6 @@ class CLabelSkeleton(CMaterial):
     def __init__(
         self,
         *,
-        iLabelTypeCount,
-        iMaxInstCount,
         iId,
         sLabelId,
         sSkelId,
@@ -62,8 +60,6 @@ class CLabelSkeleton(CMaterial):
     ):
         super().__init__(sName=CreateName(sLabelId, sSkelId), bForce=bForce)
 
-        self._iLabelTypeCount = iLabelTypeCount
-        self._iMaxInstCount = iMaxInstCount
         self._iId = iId
         self._sLabelId = sLabelId
         self._sSkelId = sSkelId
@@ -100,9 +96,7 @@ class CLabelSkeleton(CMaterial):
 
         self.RemoveNode("Principled BSDF")
 
-        ngMatLabVal = node.grp.material_label_value.Create(
-            iLabelTypeCount=self._iLabelTypeCount, iMaxInstCount=self._iMaxInstCount
-        )
+        ngMatLabVal = node.grp.material_label_value.Create()
         nodMatLabVal = anyblend.node.shader.utils.Group(self.xNodeTree, ngMatLabVal)
 
         ngLabelColor = self._modLabelShaderColor.Create(bUseFakeUser=True)
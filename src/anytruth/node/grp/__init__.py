@@ -28,3 +28,4 @@
 
 from . import material_label_value
 from . import shader_label_value
+from . import object_label_value
@@ -35,13 +35,23 @@ import anyblend
 nsh = anyblend.node.shader
 nalign = anyblend.node.align
 
-##########################################################
-# Create pixel fraction grid group
+# Version of the node group structure. Increase this, whenever the node group changes,
+# so that node groups stored in existing Blender files are rebuilt.
+c_iVersion = 2
+c_sVersionKey = "AT.Version"
+
+# Name of the node group
+c_sGrpName = "AT.Func.MaterialLabelValue"
 
+# Names of the scene custom properties that store the counts used by the label encoding
+c_sLabelTypeCountKey = "AT.Label.TypeCount"
+c_sMaxInstCountKey = "AT.Label.MaxInstCount"
 
-def Create(*, iLabelTypeCount, iMaxInstCount, bUseFakeUser=False):
+
+##########################################################
+def SetCounts(xScene, *, iLabelTypeCount, iMaxInstCount):
     """
-    Create shader node group for material label value.
+    Set the counts that are read by the material label value node group.
     """
 
     if iLabelTypeCount < 1:
@@ -52,8 +62,84 @@ def Create(*, iLabelTypeCount, iMaxInstCount, bUseFakeUser=False):
         raise CAnyExcept("The maximal number of instances must be larger than zero")
     # endif
 
+    # Older Blender versions read the counts with drivers, whose target is the scene
+    # that was active, when the node group was created. Point them to the given scene.
+    if bpy.app.version < (3, 5, 0):
+        ngMain = bpy.data.node_groups.get(c_sGrpName)
+        if ngMain is not None and ngMain.animation_data is not None:
+            for fcDriver in ngMain.animation_data.drivers:
+                for xVar in fcDriver.driver.variables:
+                    if xVar.targets[0].id_type == "SCENE" and xVar.targets[0].id != xScene:
+                        xVar.targets[0].id = xScene
+                    # endif
+                # endfor
+            # endfor
+        # endif
+    # endif
+
+    if xScene.get(c_sLabelTypeCountKey) == iLabelTypeCount and xScene.get(c_sMaxInstCountKey) == iMaxInstCount:
+        return
+    # endif
+
+    xScene[c_sLabelTypeCountKey] = iLabelTypeCount
+    xScene[c_sMaxInstCountKey] = iMaxInstCount
+    # Custom properties do not tag the scene for update by themselves
+    xScene.update_tag()
+
+
+# enddef
+
+
+##########################################################
+def CountValue(ngMain, sName, sKey):
+    """
+    Create a node that outputs the value of a scene custom property.
+    """
+
+    if bpy.app.version >= (3, 5, 0):
+        # The attribute node looks up view layer attributes in the view layer,
+        # the scene and the world, in this order.
+        nodAttr = ngMain.nodes.new("ShaderNodeAttribute")
+        nodAttr.label = sName
+        nodAttr.attribute_type = "VIEW_LAYER"
+        nodAttr.attribute_name = sKey
+        return nodAttr.outputs["Fac"]
+    # endif
+
+    # Older Blender versions have no view layer attributes, so a driver
+    # copies the custom property of the current scene into a value node.
+    skValue = nsh.utils.Value(ngMain, sName, 1.0)
+    fcDriver = skValue.node.outputs[0].driver_add("default_value")
+    xDriver = fcDriver.driver
+    xDriver.type = "AVERAGE"
+    xVar = xDriver.variables.new()
+    xVar.name = "count"
+    xVar.type = "SINGLE_PROP"
+    xVar.targets[0].id_type = "SCENE"
+    xVar.targets[0].id = bpy.context.scene
+    xVar.targets[0].data_path = '["{}"]'.format(sKey)
+
+    return skValue
+
+
+# enddef
+
+
+##########################################################
+# Create pixel fraction grid group
+
+
+def Create(*, bForce=False, bUseFakeUser=False):
+    """
+    Create shader node group for material label value.
+    The label type count and the maximal instance count are read from
+    scene custom properties, which are set with SetCounts().
+    Optional Parameters:
+        Force: Renew node tree even if group already exists with the current version.
+    """
+
     # Create the name for the sensor specs shade node tree
-    sGrpName = "AT.Func.MaterialLabelValue"
+    sGrpName = c_sGrpName
 
     # Try to get ray splitter specification node group
     ngMain = bpy.data.node_groups.get(sGrpName)
@@ -65,67 +151,77 @@ def Create(*, iLabelTypeCount, iMaxInstCount, bUseFakeUser=False):
 
     if ngMain is None:
         ngMain = bpy.data.node_groups.new(sGrpName, "ShaderNodeTree")
+        bUpdate = True
+    else:
+        bUpdate = bForce or ngMain.get(c_sVersionKey) != c_iVersion
     # endif
 
-    ngMain.use_fake_user = bUseFakeUser
+    if bUpdate:
+        # Remove all nodes that may be present
+        for nod in ngMain.nodes:
+            ngMain.nodes.remove(nod)
+        # endfor
+
+        # Remove drivers that may be present
+        if ngMain.animation_data is not None:
+            for fcDriver in list(ngMain.animation_data.drivers):
+                ngMain.animation_data.drivers.remove(fcDriver)
+            # endfor
+        # endif
 
-    # Remove all nodes that may be present
-    for nod in ngMain.nodes:
-        ngMain.nodes.remove(nod)
-    # endfor
+        ngMain.use_fake_user = bUseFakeUser
 
-    tNodeSpace = (50, 25)
-    tNodeSpaceSmall = (25, 15)
+        tNodeSpace = (50, 25)
+        tNodeSpaceSmall = (25, 15)
 
-    # Define Inputs
-    lInputs = []
+        # Define Inputs
+        lInputs = []
 
-    # Define Output
-    sValueOut = "Material Label Value"
+        # Define Output
+        sValueOut = "Material Label Value"
 
-    lOutputs = [[sValueOut, "NodeSocketFloat"]]
+        lOutputs = [[sValueOut, "NodeSocketFloat"]]
 
-    # Add group inputs if necessary and set default values
-    nodIn = nsh.utils.ProvideNodeTreeInputs(ngMain, lInputs)
+        # Add group inputs if necessary and set default values
+        nodIn = nsh.utils.ProvideNodeTreeInputs(ngMain, lInputs)
 
-    # Add group outputs if necessary
-    nodOut = nsh.utils.ProvideNodeTreeOutputs(ngMain, lOutputs)
+        # Add group outputs if necessary
+        nodOut = nsh.utils.ProvideNodeTreeOutputs(ngMain, lOutputs)
 
-    nodIn.location = (-400, 0)
+        nodIn.location = (-400, 0)
 
-    skInstCnt = nsh.utils.Value(ngMain, "Max Instance Count", iMaxInstCount)
-    nalign.Relative(nodIn, (1, 0), skInstCnt, (0, 0), tNodeSpace)
+        skInstCnt = CountValue(ngMain, "Max Instance Count", c_sMaxInstCountKey)
+        nalign.Relative(nodIn, (1, 0), skInstCnt, (0, 0), tNodeSpace)
 
-    skTypeCnt = nsh.utils.Value(ngMain, "Label Type Count", iLabelTypeCount)
-    nalign.Relative(skInstCnt, (1, 1), skTypeCnt, (1, 0), tNodeSpace)
+        skTypeCnt = CountValue(ngMain, "Label Type Count", c_sLabelTypeCountKey)
+        nalign.Relative(skInstCnt, (1, 1), skTypeCnt, (1, 0), tNodeSpace)
 
-    skMaxCnt = nsh.math.Multiply(ngMain, "Total Count", skInstCnt, skTypeCnt)
-    nalign.Relative(skInstCnt, (1, 0), skMaxCnt, (0, 0), tNodeSpace)
+        skMaxCnt = nsh.math.Multiply(ngMain, "Total Count", skInstCnt, skTypeCnt)
+        nalign.Relative(skInstCnt, (1, 0), skMaxCnt, (0, 0), tNodeSpace)
 
-    skMaxVal = nsh.math.Add(ngMain, "Max Value", skMaxCnt, 1.0)
-    nalign.Relative(skMaxCnt, (1, 0), skMaxVal, (0, 0), tNodeSpaceSmall)
+        skMaxVal = nsh.math.Add(ngMain, "Max Value", skMaxCnt, 1.0)
+        nalign.Relative(skMaxCnt, (1, 0), skMaxVal, (0, 0), tNodeSpaceSmall)
 
-    skObjInfo = nsh.utils.ObjectInfo(ngMain)
-    nalign.Relative(skTypeCnt, (1, 1), skObjInfo, (1, 0), tNodeSpaceSmall)
+        skObjInfo = nsh.utils.ObjectInfo(ngMain)
+        nalign.Relative(skTypeCnt, (1, 1), skObjInfo, (1, 0), tNodeSpaceSmall)
 
-    skObjIdx = nsh.math.Multiply(
-        ngMain, "Object Index", skTypeCnt, skObjInfo["Object Index"]
-    )
-    nalign.Relative(skMaxCnt, (1, 1), skObjIdx, (1, 0), tNodeSpace)
+        skObjIdx = nsh.math.Multiply(ngMain, "Object Index", skTypeCnt, skObjInfo["Object Index"])
+        nalign.Relative(skMaxCnt, (1, 1), skObjIdx, (1, 0), tNodeSpace)
 
-    skCombined = nsh.math.Add(
-        ngMain, "Combined Index", skObjIdx, skObjInfo["Material Index"]
-    )
-    nalign.Relative(skObjIdx, (1, 1), skCombined, (1, 0), tNodeSpaceSmall)
+        skCombined = nsh.math.Add(ngMain, "Combined Index", skObjIdx, skObjInfo["Material Index"])
+        nalign.Relative(skObjIdx, (1, 1), skCombined, (1, 0), tNodeSpaceSmall)
 
-    skValue = nsh.math.Add(ngMain, "Value", skCombined, 1.0)
-    nalign.Relative(skCombined, (1, 0), skValue, (0, 0), tNodeSpaceSmall)
+        skValue = nsh.math.Add(ngMain, "Value", skCombined, 1.0)
+        nalign.Relative(skCombined, (1, 0), skValue, (0, 0), tNodeSpaceSmall)
 
-    skColVal = nsh.math.Divide(ngMain, "Color Value", skValue, skMaxVal)
-    nalign.Relative(skMaxVal, (1, 1), skColVal, (0, 0), tNodeSpaceSmall)
+        skColVal = nsh.math.Divide(ngMain, "Color Value", skValue, skMaxVal)
+        nalign.Relative(skMaxVal, (1, 1), skColVal, (0, 0), tNodeSpaceSmall)
 
-    nalign.Relative(skColVal, (1, 0), nodOut, (0, 0), tNodeSpace)
-    ngMain.links.new(nodOut.inputs[sValueOut], skColVal)
+        nalign.Relative(skColVal, (1, 0), nodOut, (0, 0), tNodeSpace)
+        ngMain.links.new(nodOut.inputs[sValueOut], skColVal)
+
+        ngMain[c_sVersionKey] = c_iVersion
+    # endif
 
     # ###############################################################
 
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \node\grp\object_label_value.py
+# Created Date: Saturday, October 17th 2026, 9:48:05 pm
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Label add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+##########################################################
+# Node group to calculate the label value of a shared label material
+import bpy
+import anyblend
+
+from .material_label_value import CountValue, c_sLabelTypeCountKey, c_sMaxInstCountKey
+
+nsh = anyblend.node.shader
+nalign = anyblend.node.align
+
+# Version of the node group structure. Increase this, whenever the node group changes,
+# so that node groups stored in existing Blender files are rebuilt.
+c_iVersion = 1
+c_sVersionKey = "AT.Version"
+
+# Names of the object custom properties that store the label type and instance indices
+c_sTypeIdxKey = "AT.Label.TypeIdx"
+c_sInstIdxKey = "AT.Label.InstIdx"
+
+
+##########################################################
+def _ObjectAttribute(ngMain, sName, sKey):
+    """
+    Create a node that outputs the value of an object custom property.
+    """
+
+    nodAttr = ngMain.nodes.new("ShaderNodeAttribute")
+    nodAttr.label = sName
+    nodAttr.attribute_type = "OBJECT"
+    nodAttr.attribute_name = sKey
+    return nodAttr.outputs["Fac"]
+
+
+# enddef
+
+
+##########################################################
+# Create object label value group
+
+
+def Create(*, bForce=False, bUseFakeUser=False):
+    """
+    Create shader node group for the label value of a shared label material.
+    This evaluates the same value as the material label value node group.
+    However, the label type index and the instance index are read from
+    object custom properties instead of the material and object pass indices.
+    Optional Parameters:
+        Force: Renew node tree even if group already exists with the current version.
+    """
+
+    sGrpName = "AT.Func.ObjectLabelValue"
+
+    ngMain = bpy.data.node_groups.get(sGrpName)
+
+    if ngMain is None:
+        ngMain = bpy.data.node_groups.new(sGrpName, "ShaderNodeTree")
+        bUpdate = True
+    else:
+        bUpdate = bForce or ngMain.get(c_sVersionKey) != c_iVersion
+    # endif
+
+    if bUpdate:
+        # Remove all nodes that may be present
+        for nod in ngMain.nodes:
+            ngMain.nodes.remove(nod)
+        # endfor
+
+        # Remove drivers that may be present
+        if ngMain.animation_data is not None:
+            for fcDriver in list(ngMain.animation_data.drivers):
+                ngMain.animation_data.drivers.remove(fcDriver)
+            # endfor
+        # endif
+
+        ngMain.use_fake_user = bUseFakeUser
+
+        tNodeSpace = (50, 25)
+        tNodeSpaceSmall = (25, 15)
+
+        # Define Inputs
+        lInputs = []
+
+        # Define Output
+        sValueOut = "Material Label Value"
+
+        lOutputs = [[sValueOut, "NodeSocketFloat"]]
+
+        # Add group inputs if necessary and set default values
+        nodIn = nsh.utils.ProvideNodeTreeInputs(ngMain, lInputs)
+
+        # Add group outputs if necessary
+        nodOut = nsh.utils.ProvideNodeTreeOutputs(ngMain, lOutputs)
+
+        nodIn.location = (-400, 0)
+
+        skInstCnt = CountValue(ngMain, "Max Instance Count", c_sMaxInstCountKey)
+        nalign.Relative(nodIn, (1, 0), skInstCnt, (0, 0), tNodeSpace)
+
+        skTypeCnt = CountValue(ngMain, "Label Type Count", c_sLabelTypeCountKey)
+        nalign.Relative(skInstCnt, (1, 1), skTypeCnt, (1, 0), tNodeSpace)
+
+        skMaxCnt = nsh.math.Multiply(ngMain, "Total Count", skInstCnt, skTypeCnt)
+        nalign.Relative(skInstCnt, (1, 0), skMaxCnt, (0, 0), tNodeSpace)
+
+        skMaxVal = nsh.math.Add(ngMain, "Max Value", skMaxCnt, 1.0)
+        nalign.Relative(skMaxCnt, (1, 0), skMaxVal, (0, 0), tNodeSpaceSmall)
+
+        skInstIdx = _ObjectAttribute(ngMain, "Instance Index", c_sInstIdxKey)
+        nalign.Relative(skTypeCnt, (1, 1), skInstIdx, (1, 0), tNodeSpaceSmall)
+
+        skTypeIdx = _ObjectAttribute(ngMain, "Type Index", c_sTypeIdxKey)
+        nalign.Relative(skInstIdx, (1, 1), skTypeIdx, (1, 0), tNodeSpaceSmall)
+
+        skObjIdx = nsh.math.Multiply(ngMain, "Object Index", skTypeCnt, skInstIdx)
+        nalign.Relative(skMaxCnt, (1, 1), skObjIdx, (1, 0), tNodeSpace)
+
+        skCombined = nsh.math.Add(ngMain, "Combined Index", skObjIdx, skTypeIdx)
+        nalign.Relative(skObjIdx, (1, 1), skCombined, (1, 0), tNodeSpaceSmall)
+
+        skValue = nsh.math.Add(ngMain, "Value", skCombined, 1.0)
+        nalign.Relative(skCombined, (1, 0), skValue, (0, 0), tNodeSpaceSmall)
+
+        skColVal = nsh.math.Divide(ngMain, "Color Value", skValue, skMaxVal)
+        nalign.Relative(skMaxVal, (1, 1), skColVal, (0, 0), tNodeSpaceSmall)
+
+        nalign.Relative(skColVal, (1, 0), nodOut, (0, 0), tNodeSpace)
+        ngMain.links.new(nodOut.inputs[sValueOut], skColVal)
+
+        ngMain[c_sVersionKey] = c_iVersion
+    # endif
+
+    # ###############################################################
+
+    return ngMain
+
+
+# enddef
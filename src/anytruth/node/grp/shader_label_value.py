@@ -35,6 +35,11 @@ import anyblend
 nsh = anyblend.node.shader
 nalign = anyblend.node.align
 
+# Version of the node group structure. Increase this, whenever the node group changes,
+# so that node groups stored in existing Blender files are rebuilt.
+c_iVersion = 1
+c_sVersionKey = "AT.Version"
+
 ##########################################################
 # Create pixel fraction grid group
 
@@ -59,7 +64,7 @@ def Create(*, bForce=False, bUseFakeUser=False):
         ngMain = bpy.data.node_groups.new(sGrpName, "ShaderNodeTree")
         bUpdate = True
     else:
-        bUpdate = bForce
+        bUpdate = bForce or ngMain.get(c_sVersionKey) != c_iVersion
     # endif
 
     if bUpdate:
@@ -125,6 +130,8 @@ def Create(*, bForce=False, bUseFakeUser=False):
         nalign.Relative(skValue, (1, 0), nodOut, (0, 0), tNodeSpace)
         ngMain.links.new(nodOut.inputs[sValueOut], skValue)
 
+        ngMain[c_sVersionKey] = c_iVersion
+
         # ###############################################################
     # endif
 
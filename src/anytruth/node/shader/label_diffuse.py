@@ -35,6 +35,11 @@ import anyblend
 nsh = anyblend.node.shader
 nalign = anyblend.node.align
 
+# Version of the node group structure. Increase this, whenever the node group changes,
+# so that node groups stored in existing Blender files are rebuilt.
+c_iVersion = 1
+c_sVersionKey = "AT.Version"
+
 ##########################################################
 # Create pixel fraction grid group
 
@@ -43,7 +48,7 @@ def Create(*, bForce=False, bUseFakeUser=False):
     """
     Combine material and shader label values to output diffuse shader with label color.
     Optional Parameters:
-        Force: Renew node tree even if group already exists.
+        Force: Renew node tree even if group already exists with the current version.
     """
 
     # Create the name for the sensor specs shade node tree
@@ -61,7 +66,7 @@ def Create(*, bForce=False, bUseFakeUser=False):
         ngMain = bpy.data.node_groups.new(sGrpName, "ShaderNodeTree")
         bUpdate = True
     else:
-        bUpdate = bForce
+        bUpdate = bForce or ngMain.get(c_sVersionKey) != c_iVersion
     # endif
 
     if bUpdate:
@@ -105,6 +110,8 @@ def Create(*, bForce=False, bUseFakeUser=False):
 
         nalign.Relative(shDiffuse, (1, 0), nodOut, (0, 0), tNodeSpace)
         ngMain.links.new(nodOut.inputs[sShaderOut], shDiffuse)
+
+        ngMain[c_sVersionKey] = c_iVersion
     # endif
 
     # ###############################################################
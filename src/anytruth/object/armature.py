@@ -56,14 +56,35 @@ def EvalVexBoneWeight(_objArma, _sBoneName, _aVex, *, sMode="FULL"):
         For invalid mode.
     """
 
-    lAllowedModes = ["FULL", "BONE", "HEAD", "TAIL"]
-    if sMode not in lAllowedModes:
-        raise Exception(
-            "Weight evaluation mode must be one of [{}] but is {}".format(
-                ", ".join(lAllowedModes), sMode
-            )
-        )
-    # endif
+    return EvalVexEnvelopeWeight(
+        GetBoneEnvelope(_objArma, _sBoneName), _aVex, sMode=sMode
+    )
+
+
+# enddef
+
+
+#########################################################################
+def GetBoneEnvelope(_objArma, _sBoneName):
+    """Get the envelope of a posed bone in world space.
+
+    Parameters
+    ----------
+    _objArma : bpy.types.Object
+        The armature object.
+    _sBoneName : str
+        The name of the bone.
+
+    Returns
+    -------
+    tuple
+        The tuple (head position, tail position, head radius, tail radius, envelope distance).
+
+    Raises
+    ------
+    Exception
+        If the bone does not exist.
+    """
 
     boneOrigX = _objArma.data.bones.get(_sBoneName)
     boneX = _objArma.pose.bones.get(_sBoneName)
@@ -80,9 +101,53 @@ def EvalVexBoneWeight(_objArma, _sBoneName, _aVex, *, sMode="FULL"):
     # aPosA = np.array(_objArma.matrix_local @ boneX.head_local)
     # aPosB = np.array(_objArma.matrix_local @ boneX.tail_local)
 
-    fRadA = boneOrigX.head_radius
-    fRadB = boneOrigX.tail_radius
-    fEnvDist = boneOrigX.envelope_distance
+    return (
+        aPosA,
+        aPosB,
+        boneOrigX.head_radius,
+        boneOrigX.tail_radius,
+        boneOrigX.envelope_distance,
+    )
+
+
+# enddef
+
+
+#########################################################################
+def EvalVexEnvelopeWeight(_tEnvelope, _aVex, *, sMode="FULL"):
+    """Evaluate a bone envelope influence weight per given vertex.
+    This function does not access any Blender data, so that it can run on a worker thread.
+
+    Parameters
+    ----------
+    _tEnvelope : tuple
+        The bone envelope, as returned by GetBoneEnvelope().
+    _aVex : numpy.array
+        A numpy array of 3D-vectors.
+    sMode : str, optional
+        The mode of calculating the influence. Must be one of ["FULL", "BONE", "HEAD", "TAIL"], by default "FULL".
+
+    Returns
+    -------
+    numpy.array
+        An 1D-array of weights, one for each input vector.
+
+    Raises
+    ------
+    Exception
+        For invalid mode.
+    """
+
+    lAllowedModes = ["FULL", "BONE", "HEAD", "TAIL"]
+    if sMode not in lAllowedModes:
+        raise Exception(
+            "Weight evaluation mode must be one of [{}] but is {}".format(
+                ", ".join(lAllowedModes), sMode
+            )
+        )
+    # endif
+
+    aPosA, aPosB, fRadA, fRadB, fEnvDist = _tEnvelope
     fRadDelta = fRadB - fRadA
 
     if sMode == "FULL" or sMode == "BONE":
@@ -220,7 +285,8 @@ def CreateBoneWeightVexColLay(
     sBoneWeightMode,
     sVexColNameLabel,
     lPreviewColors=None,
-    sVexColNamePreview=None
+    sVexColNamePreview=None,
+    xTaskPool=None
 ):
 
     if objArma.type != "ARMATURE":
@@ -235,12 +301,22 @@ def CreateBoneWeightVexColLay(
 
     aVex = anyblend.object.GetMeshVex(objMesh, sFrame="WORLD")
 
-    lWeightsPerBone = []
-    for sBoneName in lBoneNames:
-        lWeightsPerBone.append(
-            EvalVexBoneWeight(objArma, sBoneName, aVex, sMode=sBoneWeightMode)
+    # The bone envelopes are read on the main thread,
+    # while the weights of the bones may be evaluated in parallel.
+    lBoneEnvelopes = [GetBoneEnvelope(objArma, sBoneName) for sBoneName in lBoneNames]
+    if xTaskPool is not None:
+        lWeightsPerBone = xTaskPool.Map(
+            lambda tEnvelope: EvalVexEnvelopeWeight(
+                tEnvelope, aVex, sMode=sBoneWeightMode
+            ),
+            ((tEnvelope,) for tEnvelope in lBoneEnvelopes),
         )
-    # endfor
+    else:
+        lWeightsPerBone = [
+            EvalVexEnvelopeWeight(tEnvelope, aVex, sMode=sBoneWeightMode)
+            for tEnvelope in lBoneEnvelopes
+        ]
+    # endif
 
     aAllWeights = np.vstack(lWeightsPerBone)
     aBoneMax = np.max(aAllWeights, axis=0)
@@ -140,7 +140,15 @@ def CopyCollectionLabel(*, _sClnNameTrg: str, _sClnNameSrc: str, _xContext: Opti
 
 
 ############################################################################################################
-def ApplyAnnotation(_xContext, _bApply, _sAnnotationType, *, _bEvalBoxes2d: bool = False, _bAllowFovBoxes2d: bool = False):
+def ApplyAnnotation(
+    _xContext,
+    _bApply,
+    _sAnnotationType,
+    *,
+    _bEvalBoxes2d: bool = False,
+    _bAllowFovBoxes2d: bool = False,
+    _bIncremental: bool = False,
+):
     xLabelSetProp = _xContext.scene.xAtLabelSet
     if xLabelSetProp is None:
         raise CAnyExcept("Label set does not exist in scene")
@@ -152,7 +160,9 @@ def ApplyAnnotation(_xContext, _bApply, _sAnnotationType, *, _bEvalBoxes2d: bool
 
     xLabelSet = CLabelSet(xLabelSetProp)
     xLabelSet.eAnnotationType = _sAnnotationType
-    xLabelSet.ApplyAnnotation(_bApply, _bEvalBoxes2d=_bEvalBoxes2d, _bAllowFovBoxes2d=_bAllowFovBoxes2d)
+    xLabelSet.ApplyAnnotation(
+        _bApply, _bEvalBoxes2d=_bEvalBoxes2d, _bAllowFovBoxes2d=_bAllowFovBoxes2d, _bIncremental=_bIncremental
+    )
 
 
 # enddef
@@ -589,3 +599,197 @@ def EnableAutoUpdateAnnotation(_xContext, _bEnable=True):
 
 
 # enddef
+
+
+############################################################################################################
+def EnableMaterialOverride(_xContext, _bEnable=True):
+    xLabelSetProp = _xContext.scene.xAtLabelSet
+    if xLabelSetProp is None:
+        raise CAnyExcept("Label set does not exist in scene")
+    # endif
+
+    xLabelSet = CLabelSet(xLabelSetProp)
+    xLabelSet.bUseMaterialOverride = _bEnable
+
+
+# enddef
+
+
+############################################################################################################
+def SetLabelEncoding(_xContext, _sEncoding: str):
+    xLabelSetProp = _xContext.scene.xAtLabelSet
+    if xLabelSetProp is None:
+        raise CAnyExcept("Label set does not exist in scene")
+    # endif
+
+    xLabelSet = CLabelSet(xLabelSetProp)
+    xLabelSet.eLabelEncoding = _sEncoding
+
+
+# enddef
+
+
+############################################################################################################
+def SetEncodingCapacity(_xContext, _sMode: str, *, _iTypeCount: int = 0, _iMaxInstCount: int = 0, _fHeadroom=0.25):
+    xLabelSetProp = _xContext.scene.xAtLabelSet
+    if xLabelSetProp is None:
+        raise CAnyExcept("Label set does not exist in scene")
+    # endif
+
+    xLabelSet = CLabelSet(xLabelSetProp)
+    xLabelSet.eEncodingCapacity = _sMode
+    xLabelSet.iCapacityTypeCount = _iTypeCount
+    xLabelSet.iCapacityMaxInstCount = _iMaxInstCount
+    xLabelSet.fCapacityHeadroom = _fHeadroom
+
+
+# enddef
+
+
+############################################################################################################
+def ResetEncodingCapacity(_xContext):
+    xLabelSetProp = _xContext.scene.xAtLabelSet
+    if xLabelSetProp is None:
+        raise CAnyExcept("Label set does not exist in scene")
+    # endif
+
+    xLabelSet = CLabelSet(xLabelSetProp)
+    xLabelSet.ResetEncodingCapacity()
+
+
+# enddef
+
+
+############################################################################################################
+def SetGeometryCachePath(_xContext, _sPath: str):
+    xLabelSetProp = _xContext.scene.xAtLabelSet
+    if xLabelSetProp is None:
+        raise CAnyExcept("Label set does not exist in scene")
+    # endif
+
+    xLabelSet = CLabelSet(xLabelSetProp)
+    xLabelSet.sGeometryCachePath = _sPath
+
+
+# enddef
+
+
+############################################################################################################
+def EnableGeometryDoublePrecision(_xContext, _bEnable: bool):
+    xLabelSetProp = _xContext.scene.xAtLabelSet
+    if xLabelSetProp is None:
+        raise CAnyExcept("Label set does not exist in scene")
+    # endif
+
+    xLabelSet = CLabelSet(xLabelSetProp)
+    xLabelSet.bGeometryDoublePrecision = _bEnable
+
+
+# enddef
+
+
+############################################################################################################
+def SetWorkerThreads(_xContext, _iWorkers: int):
+    xLabelSetProp = _xContext.scene.xAtLabelSet
+    if xLabelSetProp is None:
+        raise CAnyExcept("Label set does not exist in scene")
+    # endif
+
+    xLabelSet = CLabelSet(xLabelSetProp)
+    xLabelSet.iWorkerThreads = _iWorkers
+
+
+# enddef
+
+
+############################################################################################################
+def EnableTemporalCoherence(_xContext, _bEnable: bool):
+    xLabelSetProp = _xContext.scene.xAtLabelSet
+    if xLabelSetProp is None:
+        raise CAnyExcept("Label set does not exist in scene")
+    # endif
+
+    xLabelSet = CLabelSet(xLabelSetProp)
+    xLabelSet.bUseTemporalCoherence = _bEnable
+
+
+# enddef
+
+
+############################################################################################################
+def GetTemporalCoherenceHitRates(_xContext) -> dict[str, float]:
+    xLabelSetProp = _xContext.scene.xAtLabelSet
+    if xLabelSetProp is None:
+        raise CAnyExcept("Label set does not exist in scene")
+    # endif
+
+    xLabelSet = CLabelSet(xLabelSetProp)
+    return xLabelSet.GetTemporalCoherenceHitRates()
+
+
+# enddef
+
+
+############################################################################################################
+def SetBoundsFidelity(_xContext, _eFidelity: str, *, _iSampleCount: int = None):
+    xLabelSetProp = _xContext.scene.xAtLabelSet
+    if xLabelSetProp is None:
+        raise CAnyExcept("Label set does not exist in scene")
+    # endif
+
+    xLabelSet = CLabelSet(xLabelSetProp)
+    xLabelSet.eBoundsFidelity = _eFidelity
+    if _iSampleCount is not None:
+        xLabelSet.iBoundsSampleCount = _iSampleCount
+    # endif
+
+
+# enddef
+
+
+############################################################################################################
+def EnableBoneCapsuleBoxes(_xContext, _bEnable: bool):
+    xLabelSetProp = _xContext.scene.xAtLabelSet
+    if xLabelSetProp is None:
+        raise CAnyExcept("Label set does not exist in scene")
+    # endif
+
+    xLabelSet = CLabelSet(xLabelSetProp)
+    xLabelSet.bUseBoneCapsuleBoxes = _bEnable
+
+
+# enddef
+
+
+############################################################################################################
+def EnableViewCulling(_xContext, _bEnable: bool, *, _fMaxDistance: float = None, _bExportCulled: bool = None):
+    xLabelSetProp = _xContext.scene.xAtLabelSet
+    if xLabelSetProp is None:
+        raise CAnyExcept("Label set does not exist in scene")
+    # endif
+
+    xLabelSet = CLabelSet(xLabelSetProp)
+    xLabelSet.bUseViewCulling = _bEnable
+    if _fMaxDistance is not None:
+        xLabelSet.fViewCullMaxDistance = _fMaxDistance
+    # endif
+    if _bExportCulled is not None:
+        xLabelSet.bExportCulledInstances = _bExportCulled
+    # endif
+
+
+# enddef
+
+
+############################################################################################################
+def SetBoxes2dMode(_xContext, _eMode: str):
+    xLabelSetProp = _xContext.scene.xAtLabelSet
+    if xLabelSetProp is None:
+        raise CAnyExcept("Label set does not exist in scene")
+    # endif
+
+    xLabelSet = CLabelSet(xLabelSetProp)
+    xLabelSet.eBoxes2dMode = _eMode
+
+
+# enddef